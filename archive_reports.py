@@ -17,6 +17,10 @@ Unlike Excel, pandas does not merge difference of capitalization, e.g. MPEG Vide
 Parameters:
     report_folder : the path to the folder which contains ARCHive's group file format reports,
     the combined format reports made by the merge_format_reports.py script, and usage report (all CSVs)
+    spreadsheets : optional, the names of the spreadsheets to make (frequency, group-overlap, ranges, risk,
+    and/or usage-trend), separated by spaces. If none are provided, all except usage-trend are made.
+    top=N : optional, only include the N most common format identifications in the frequency spreadsheet,
+    with the rest combined into one row named Other.
 
 Returns:
     ARCHive-Formats-Analysis_Frequency.xlsx : the amount of collections, AIPs, files, and/or size
@@ -30,23 +34,60 @@ Returns:
 
     ARCHive-Formats-Analysis_Risk.xlsx : the number of files, GB, and format identifications at each NARA risk level
     for ARCHive, each department, each format type, and each NARA plan type, as well the number for each NARA match type
+
+    ARCHive-Formats-Analysis_Usage-Trend.xlsx : only made if requested, the number of files and TB for each group
+    in every usage report in the report folder, and the total TB for each group at the end of each period
 """
 
 import csv
+import hashlib
 import numpy as np
 import os
 import pandas as pd
+import pickle
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from merge_format_reports import get_partition_paths
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from update_standardization import check_argument
 
 
-def archive_overview(df_aip, df_group, usage):
+def aggregate_counts(aggregates, category):
+    """Get the unique counts for one category from the aggregates CSV made by merge_format_reports.py
+
+    The columns are renamed to the archive_formats_by_aip.csv column that was counted,
+    so the result can be used the same way as counting the unique values in the by_aip dataframe.
+
+    Parameters:
+        aggregates : a dataframe with the information from archive_formats_aggregates.csv
+        category : the category (Group, Format_Type, or Format_Standardized_Name) to get the counts for
+
+    Returns:
+        counts : a dataframe with rows by instance of the category and
+        columns Collection, AIP, Format_Type, and Format_Standardized_Name (the number of unique values of each)
+    """
+
+    counts = aggregates[aggregates['Category'] == category].drop(['Category'], axis=1)
+    counts = counts.set_index('Instance').rename_axis(category)
+    counts = counts.rename(columns={"Collections": "Collection", "AIPs": "AIP", "Format_Types": "Format_Type",
+                                    "Format_Standardized_Names": "Format_Standardized_Name"})
+    return counts
+
+
+def archive_overview(df_aip, df_group, usage, aggregates=None):
     """Calculate statistics for each ARCHive group using the usage report and both ARCHive format reports
 
+    If the aggregates are provided, the counts for collections, AIPs, format types, and format standardized names
+    are taken from them instead of df_aip, and df_aip is not used.
+
     Parameters:
-        df_aip : a dataframe with the information from archive_formats_by_aip.csv
+        df_aip : a dataframe with the information from archive_formats_by_aip.csv, or None if aggregates are used
         df_group : a dataframe with the information from archive_formats_by_group.csv
         usage : the path to the ARCHive usage report
+        aggregates : optional, a dataframe with the information from archive_formats_aggregates.csv
 
     Returns:
         group_stats : a dataframe with row by group and columns with the Size (TB and GB) and number of
@@ -60,24 +101,41 @@ def archive_overview(df_aip, df_group, usage):
     # and inflated by multiple identifications for individual files.
     size_inflated = round(df_group.groupby('Group')['Size_GB'].sum(), 2)
 
+    # Gets the unique counts per group from the aggregates made by merge_format_reports.py, if provided.
+    # They are the same as the counts from the archive_formats_by_aip report below.
+    if aggregates is not None:
+        by_group = aggregate_counts(aggregates, 'Group')
+
     # Gets the number of collections per group from the archive_formats_by_aip report.
     # Only counts collections with AIPs, which may result in a difference between this count and the ARCHive interface.
     # Additionally, dlg-hargrett collections in ARCHive that are part of turningpoint are counted as dlg.
-    collections_by_group = df_aip.groupby('Group')['Collection'].nunique()
+    if aggregates is not None:
+        collections_by_group = by_group['Collection']
+    else:
+        collections_by_group = df_aip.groupby('Group')['Collection'].nunique()
 
     # Gets the number of AIPs per group from the archive_formats_by_aip report.
     # Not using data from usage report since each version of an AIP is counted separately.
-    aips_by_group = df_aip.groupby('Group')['AIP'].nunique()
+    if aggregates is not None:
+        aips_by_group = by_group['AIP']
+    else:
+        aips_by_group = df_aip.groupby('Group')['AIP'].nunique()
 
     # Gets the number of format types per group from the archive_formats_by_aip report.
-    types_by_group = df_aip.groupby('Group')['Format_Type'].nunique()
+    if aggregates is not None:
+        types_by_group = by_group['Format_Type']
+    else:
+        types_by_group = df_aip.groupby('Group')['Format_Type'].nunique()
 
     # Gets the number of file_ids per group from the archive_formats_by_group report.
     # These numbers are inflated by files with more than one format identification.
     files_by_group = df_group.groupby('Group')['File_IDs'].sum()
 
     # Gets the number of format standardized names per group from the archive_formats_by_aip report.
-    formats_by_group = df_aip.groupby('Group')['Format_Standardized_Name'].nunique()
+    if aggregates is not None:
+        formats_by_group = by_group['Format_Standardized_Name']
+    else:
+        formats_by_group = df_aip.groupby('Group')['Format_Standardized_Name'].nunique()
 
     # Gets the number of format identifications per group from the archive_formats_by_group report.
     format_ids_by_group = df_group.groupby('Group')['Format_Identification'].nunique()
@@ -107,6 +165,129 @@ def archive_overview(df_aip, df_group, usage):
     return group_stats
 
 
+def cache_key(input_paths):
+    """Calculate a key for the cache of a spreadsheet from the content of its input files and of this script
+
+    The key only changes if one of the input files or the code that makes the spreadsheets changes,
+    so a spreadsheet with the same key as the last time it was made would have the same summaries.
+
+    Parameters:
+        input_paths : a list of the paths to the files used to make the spreadsheet
+
+    Returns:
+        key : a string with the SHA-256 hash of the contents of the input files and this script
+    """
+
+    key = file_hash([os.path.abspath(__file__)] + input_paths)
+
+    return key
+
+
+def check_spreadsheets(argument_list):
+    """Check the optional arguments with the names of the spreadsheets to make and top=N, which are after report_folder
+
+    Parameters:
+        argument_list : list from sys.argv, with the script arguments
+
+    Returns:
+        spreadsheet_names : a list of the spreadsheets to make, in the order provided,
+        or all except usage-trend if none are provided
+        top_n : the number of format identifications to include in the frequency spreadsheet from top=N,
+        or None to include all of them
+        errors : a list of the arguments that are not spreadsheet names or top=N, if any, or an empty list
+    """
+
+    all_names = ["frequency", "group-overlap", "ranges", "risk", "usage-trend"]
+
+    # Any arguments after report_folder are the spreadsheets to make or top=N. Duplicates are only included once.
+    spreadsheet_names = []
+    top_n = None
+    errors = []
+    for argument in argument_list[2:]:
+        if argument.startswith("top="):
+            if argument[4:].isdigit():
+                top_n = int(argument[4:])
+            else:
+                errors.append(f"'{argument}' is not top= followed by a whole number")
+        elif argument not in all_names:
+            errors.append(f"Spreadsheet '{argument}' is not one of {', '.join(all_names)}")
+        elif argument not in spreadsheet_names:
+            spreadsheet_names.append(argument)
+
+    # If no spreadsheets were provided, makes all of them except usage-trend,
+    # which uses every usage report in the folder and is only made if it is requested.
+    if not spreadsheet_names:
+        spreadsheet_names = all_names[:4]
+
+    return spreadsheet_names, top_n, errors
+
+
+def chunked_aggregates(formats_by_aip_path, chunk_size=100000):
+    """Calculate the unique counts used from archive_formats_by_aip.csv by reading it in chunks
+
+    This is for when the by_aip CSV is too large to read into memory all at once.
+    Each chunk is reduced to the distinct pairs of category instance and value for each count,
+    which are combined with the pairs from earlier chunks, so only the distinct pairs are kept in memory.
+    The counts are then the number of unique values in the pairs, which is the same as from the entire CSV.
+
+    Parameters:
+        formats_by_aip_path : the path to the archive_formats_by_aip.csv
+        chunk_size : the number of rows to read at a time
+
+    Returns:
+        aggregates : a dataframe with the same columns as archive_formats_aggregates.csv (made by
+        merge_format_reports.py), Category, Instance, Collections, AIPs, Format_Types, and Format_Standardized_Names
+    """
+
+    columns = ['Group', 'Collection', 'AIP', 'Format_Type', 'Format_Standardized_Name']
+    aggregates = chunks_to_aggregates(pd.read_csv(formats_by_aip_path, usecols=columns, chunksize=chunk_size))
+    return aggregates
+
+
+def chunks_to_aggregates(chunks):
+    """Calculate the unique counts used from archive_formats_by_aip.csv from parts of it (chunks)
+
+    Parameters:
+        chunks : an iterable of dataframes with the Group, Collection, AIP, Format_Type, and Format_Standardized_Name
+        columns of archive_formats_by_aip.csv, which together have every row, for example chunks read from the CSV
+
+    Returns:
+        aggregates : a dataframe with the same columns as archive_formats_aggregates.csv (made by
+        merge_format_reports.py), Category, Instance, Collections, AIPs, Format_Types, and Format_Standardized_Names
+    """
+
+    # The columns counted for each category. The types and standardized names are only counted for groups.
+    counted = {'Group': ['Collection', 'AIP', 'Format_Type', 'Format_Standardized_Name'],
+               'Format_Type': ['Collection', 'AIP'],
+               'Format_Standardized_Name': ['Collection', 'AIP']}
+
+    # Adds the distinct pairs from each chunk to the pairs from the earlier chunks, without duplicates.
+    pairs = {}
+    for chunk in chunks:
+        for category, count_columns in counted.items():
+            for column in count_columns:
+                chunk_pairs = chunk[[category, column]].drop_duplicates()
+                if (category, column) in pairs:
+                    chunk_pairs = pd.concat([pairs[(category, column)], chunk_pairs]).drop_duplicates()
+                pairs[(category, column)] = chunk_pairs
+
+    # Counts the unique values for each instance of each category from the pairs,
+    # in the same format as the aggregates CSV.
+    rename = {"Collection": "Collections", "AIP": "AIPs", "Format_Type": "Format_Types",
+              "Format_Standardized_Name": "Format_Standardized_Names"}
+    category_counts = []
+    for category, count_columns in counted.items():
+        counts = pd.concat([pairs[(category, column)].groupby(category)[column].nunique().rename(rename[column])
+                            for column in count_columns], axis=1)
+        counts = counts.rename_axis('Instance').reset_index()
+        counts.insert(0, 'Category', category)
+        category_counts.append(counts)
+    aggregates = pd.concat(category_counts, ignore_index=True)
+    aggregates = aggregates.reindex(columns=['Category', 'Instance'] + list(rename.values()))
+
+    return aggregates
+
+
 def file_count_ranges(category, df_group):
     """Calculate the number of instances of the category within each range of number of files (1-9, 10-99, etc.)
 
@@ -121,18 +302,11 @@ def file_count_ranges(category, df_group):
     # Makes a series with the number of file_ids for each instance of the category, regardless  of group.
     df_cat = df_group.groupby(df_group[category])['File_IDs'].sum()
 
-    # Makes series with the subset of the archive_formats_by_group report data with the specified numbers of file_ids.
-    ones = df_cat[(df_cat < 10)]
-    tens = df_cat[(df_cat >= 10) & (df_cat < 100)]
-    hundreds = df_cat[(df_cat >= 100) & (df_cat < 1000)]
-    thousands = df_cat[(df_cat >= 1000) & (df_cat < 10000)]
-    ten_thousands = df_cat[(df_cat >= 10000) & (df_cat < 100000)]
-    hundred_thousands_plus = df_cat[(df_cat >= 100000)]
-
-    # Makes lists with the data for the dataframe: file_id ranges (for index) and the number of instances in each range.
+    # Counts the number of instances in each file_id range: 1-9, 10-99, 100-999, 1000-9999, 10000-99999, and 100000+.
+    # Edges are where each range after the first starts and labels are used for the dataframe index.
+    edges = [10, 100, 1000, 10000, 100000]
     file_id_ranges = ["1-9", "10-99", "100-999", "1000-9999", "10000-99999", "100000+"]
-    instances = [ones.count(), tens.count(), hundreds.count(), thousands.count(), ten_thousands.count(),
-                 hundred_thousands_plus.count()]
+    instances = range_counts(df_cat, edges, file_id_ranges)
 
     # Makes a dataframe from the lists.
     result = pd.DataFrame(instances, columns=[f"Number of Formats ({category})"], index=file_id_ranges)
@@ -141,15 +315,40 @@ def file_count_ranges(category, df_group):
     return result
 
 
-def format_id_frequency(totals, df_group):
+def file_hash(file_paths):
+    """Calculate the SHA-256 hash of the contents of one or more files, to tell if any of them have changed
+
+    Parameters:
+        file_paths : a list of the paths to the files, which are hashed in the order of the list
+
+    Returns:
+        hash : a string with the SHA-256 hash of the contents of the files
+    """
+
+    # Reads each file in blocks, so large files are not read into memory all at once.
+    file_sha = hashlib.sha256()
+    for path in file_paths:
+        with open(path, 'rb') as file_open:
+            for block in iter(lambda: file_open.read(1048576), b''):
+                file_sha.update(block)
+
+    return file_sha.hexdigest()
+
+
+def format_id_frequency(totals, df_group, top_n=None):
     """Calculate the frequency for every format identification (name, version, registry key) by different measures
 
     The resulting dataframe is sorted largest to smallest by file_id count
     since the items of most interest are the most common formats.
 
+    If top_n is provided, only the top_n format identifications with the most file_ids are included,
+    followed by a row named "Other" with the combined frequency of the rest.
+    The top_n are selected with a partial sort, so only those rows (and any tied with the last one) are put in order.
+
     Parameters:
         totals : a dictionary with the total number of collections, AIPs, files, and size in ARCHive
         df_group : a dataframe with the information from archive_formats_by_group.csv
+        top_n : optional, the number of format identifications to include (integer), or None to include all
 
     Returns:
         format_ids : a dataframe with rows by format identification and
@@ -157,31 +356,87 @@ def format_id_frequency(totals, df_group):
         sorted largest to smallest by file id count
     """
 
-    # Make series for file_id counts and file_id percentages.
+    # Make series for file_id counts and total size.
     format_count = df_group.groupby(df_group['Format_Identification'])['File_IDs'].sum()
+    size = df_group.groupby(df_group['Format_Identification'])['Size_GB'].sum()
+
+    # If only the most common format identifications are needed, finds the top_n-th largest file_id count
+    # without sorting the rest, and keeps every format identification with at least that count (the candidates).
+    # The candidates include every tie at the cutoff, so a stable sort of just the candidates, largest to smallest,
+    # keeps ties in alphabetical order by format identification (the order from the groupby) and
+    # the first top_n are the same as from sorting everything.
+    # The counts and sizes of the rest are combined into one row named Other.
+    if top_n is not None and top_n < len(format_count):
+        counts = format_count.to_numpy()
+        top_positions = np.array([], dtype=int)
+        if top_n > 0:
+            cutoff = np.partition(-counts, top_n - 1)[top_n - 1]
+            candidates = np.flatnonzero(-counts <= cutoff)
+            top_positions = candidates[np.argsort(-counts[candidates], kind='stable')][:top_n]
+        other_count = counts.sum() - counts[top_positions].sum()
+        other_size = size.sum() - size.iloc[top_positions].sum()
+        format_count = pd.concat([format_count.iloc[top_positions], pd.Series({'Other': other_count}, name='File_IDs')])
+        size = pd.concat([size.iloc[top_positions], pd.Series({'Other': other_size}, name='Size_GB')])
+        format_count.index.name = 'Format_Identification'
+        size.index.name = 'Format_Identification'
+
+    # Make series for file_id percentages.
     format_percentage = (format_count / totals['Files']) * 100
     format_percentage = round(format_percentage, 2)
     format_percentage = format_percentage.rename('File_IDs_Percentage')
 
-    # Make series for total size and size percentages.
-    size = df_group.groupby(df_group['Format_Identification'])['Size_GB'].sum()
+    # Make series for size percentages.
     size_percentage = (size / totals['Size']) * 100
     size_percentage = round(size_percentage, 2)
     size_percentage = size_percentage.rename('Size_GB_Percentage')
 
-    # Combine all the series into a single dataframe and sort largest to smallest by file_ids.
+    # Combine all the series into a single dataframe.
+    # If all format identifications are included, sort largest to smallest by file_ids.
+    # The sort is stable, so ties are in the same order as with top_n (alphabetical).
+    # The top_n are already in that order, with Other last.
     format_ids = pd.concat([format_count, format_percentage, size, size_percentage], axis=1)
-    format_ids = format_ids.sort_values(by='File_IDs', ascending=False)
+    if top_n is None or top_n >= len(format_ids):
+        format_ids = format_ids.sort_values(by='File_IDs', ascending=False, kind='stable')
 
     # Returns the dataframe. Row index is the file_ids and columns are the four frequency measures.
     return format_ids
 
 
-def get_report_paths(report_folder_path):
+def get_aggregates_path(formats_by_aip_path):
+    """Get the path to the aggregates CSV made by merge_format_reports.py at the same time as archive_formats_by_aip.csv
+
+    The aggregates CSV is only used if it was saved after the by_aip CSV, so aggregates from an earlier version
+    of the by_aip CSV with the same date are not used and the counts are calculated from the by_aip CSV instead.
+
+    Parameters:
+        formats_by_aip_path : the path to the archive_formats_by_aip.csv
+
+    Returns:
+        aggregates_path : the path to the archive_formats_aggregates.csv with the same date,
+        or None if it is not there or is older than the by_aip CSV
+    """
+
+    # The aggregates CSV has the same date as the by_aip CSV, so the counts are from the same data.
+    folder, file = os.path.split(formats_by_aip_path)
+    aggregates_path = os.path.join(folder, file.replace("archive_formats_by_aip", "archive_formats_aggregates", 1))
+    if not os.path.exists(aggregates_path) or os.path.getmtime(aggregates_path) < os.path.getmtime(formats_by_aip_path):
+        aggregates_path = None
+
+    return aggregates_path
+
+
+def get_report_paths(report_folder_path, spreadsheet_names=None):
     """Get the path to the three archive_reports used as script input and check for missing files
 
+    Only the frequency spreadsheet uses archive_formats_by_aip.csv and the usage report,
+    so they are only included in the missing list if the frequency spreadsheet will be made.
+    The usage-trend spreadsheet only uses usage reports, so it also needs the usage report but not by_group.
+    If there is more than one usage report, the one with the longest period (start of ARCHive - present)
+    is used, since the others are for the usage-trend spreadsheet.
+
     Parameters:
         report_folder_path : the path to the folder given as the script parameter, where the reports should be
+        spreadsheet_names : optional, a list of the spreadsheets that will be made, or None for all of them
 
     Returns:
         formats_by_aip_path : the path to the archive_formats_by_aip.csv, or None
@@ -197,58 +452,152 @@ def get_report_paths(report_folder_path):
 
     # Searches the report folder for the expected files, and if found updates the variable with the file name.
     # These files include dates, so the entire file name cannot be predicted by the script.
-    for file in os.listdir(report_folder_path):
+    for file in sorted(os.listdir(report_folder_path)):
         if file.startswith("archive_formats_by_aip") and file.endswith(".csv"):
             formats_by_aip_path = os.path.join(report_folder_path, file)
         elif file.startswith("archive_formats_by_group") and file.endswith(".csv"):
             formats_by_group_path = os.path.join(report_folder_path, file)
-        elif file.startswith("usage_report_") and file.endswith(".csv"):
-            usage_path = os.path.join(report_folder_path, file)
 
-    # Tests if all three paths were found, and if not adds the missing ones to a list.
+    # If there is more than one usage report, uses the one with the longest period,
+    # or the most recent one if more than one has the longest period.
+    # Usage reports without the dates in the file name are only used if no usage report has the dates,
+    # in which case the last one in alphabetical order is used.
+    usage_paths = [os.path.join(report_folder_path, file) for file in sorted(os.listdir(report_folder_path))
+                   if file.startswith("usage_report_") and file.endswith(".csv")]
+    dated_paths = [path for path in usage_paths if usage_dates(path)]
+    if len(usage_paths) > 1 and dated_paths:
+        usage_path = max(dated_paths, key=lambda path: (usage_days(path), usage_dates(path)[1]))
+    elif usage_paths:
+        usage_path = usage_paths[-1]
+
+    # Tests if all the needed paths were found, and if not adds the missing ones to a list.
+    if spreadsheet_names is None:
+        spreadsheet_names = ["frequency", "group-overlap", "ranges", "risk"]
+    frequency = "frequency" in spreadsheet_names
+    usage_trend_only = spreadsheet_names == ["usage-trend"]
     missing_list = []
-    if not formats_by_aip_path:
+    if not formats_by_aip_path and frequency:
         missing_list.append("archive_formats_by_aip.csv")
-    if not formats_by_group_path:
+    if not formats_by_group_path and not usage_trend_only:
         missing_list.append("archive_formats_by_group.csv")
-    if not usage_path:
+    if not usage_path and (frequency or "usage-trend" in spreadsheet_names):
         missing_list.append("usage_report.csv")
 
-    # Returns the results. The errors list is empty if all three files were found.
+    # Returns the results. The errors list is empty if all the needed files were found.
     return formats_by_aip_path, formats_by_group_path, usage_path, missing_list
 
 
-def group_overlap(category, df_group):
+def get_usage_paths(report_folder_path):
+    """Get the paths to the usage reports in the report folder for the usage trend, for example one for each year
+
+    A usage report with a period that overlaps the period of a shorter usage report is not included,
+    for example the usage report for the start of ARCHive - present used by the other spreadsheets,
+    so the size for the overlapping time is not counted twice by usage_growth().
+    A usage report without the dates in the file name is not included, since its period is not known.
+
+    Parameters:
+        report_folder_path : the path to the folder given as the script parameter, where the reports should be
+
+    Returns:
+        usage_paths : a list of the paths to the usage reports, in order by date
+    """
+
+    # The file names start with the dates of the report, so alphabetical order is also the order by date.
+    all_paths = [os.path.join(report_folder_path, file) for file in sorted(os.listdir(report_folder_path))
+                 if file.startswith("usage_report_") and file.endswith(".csv")]
+    usage_paths = [path for path in all_paths if usage_dates(path)]
+
+    # If there is more than one usage report, starting with the shortest period,
+    # keeps each usage report that does not overlap one that was already kept.
+    # The dates are YYYY-MM-DD strings, so they can be compared as text.
+    if len(usage_paths) > 1:
+        kept = []
+        for path in sorted(usage_paths, key=usage_days):
+            start, end = usage_dates(path)
+            if all(end < kept_start or start > kept_end for kept_start, kept_end in map(usage_dates, kept)):
+                kept.append(path)
+        usage_paths = [path for path in usage_paths if path in kept]
+
+    return usage_paths
+
+
+def group_membership(categories, df_group):
+    """Calculate which groups have each instance of each category, stored as one bitmask per instance
+
+    Each ARCHive group is one bit in the bitmask, so the bitmask for an instance combines every group that has it.
+    The masks for all the categories are made together, after assigning bits to the groups once.
+
+    Parameters:
+        categories : a list of the columns, for example Format Type, to calculate the group membership for
+        df_group : a dataframe with the information from archive_formats_by_group.csv
+
+    Returns:
+        masks : a dictionary with the category as the key and a series of bitmasks, indexed by instance, as the value
+        group_names : a list of group names in alphabetical order, where the position is that group's bit in the masks
+    """
+
+    # Assigns each group a bit, in alphabetical order by group name.
+    # There are only a few groups, so the bitmasks fit in a 64-bit integer,
+    # but Python integers (which have no size limit) are used if there are ever more than 64 groups.
+    group_codes, group_names = pd.factorize(df_group['Group'], sort=True)
+    dtype = np.uint64 if len(group_names) <= 64 else object
+    group_bits = np.array([1 << position for position in range(len(group_names))], dtype=dtype)
+
+    # Rows without a group (code -1) are skipped, the same as with a pandas groupby,
+    # so they are not given the bit of the last group.
+    has_group = group_codes >= 0
+    row_bits = group_bits[group_codes[has_group]]
+
+    # For each category, combines the bits for every row with the same instance into a single bitmask.
+    # Rows without a value for the category (code -1) are skipped, the same as with a pandas groupby.
+    masks = {}
+    for category in categories:
+        instance_codes, instances = pd.factorize(df_group[category][has_group], sort=True)
+        has_value = instance_codes >= 0
+        category_masks = np.zeros(len(instances), dtype=dtype)
+        np.bitwise_or.at(category_masks, instance_codes[has_value], row_bits[has_value])
+        masks[category] = pd.Series(category_masks, index=pd.Index(instances, name=category))
+
+    return masks, group_names.tolist()
+
+
+def group_overlap(category, df_group, membership=None):
     """Calculate the number of groups and a list of the groups which have each instance of the category
 
     Parameters:
         category : the column, for example Format Type, to subtotal on
         df_group : a dataframe with the information from archive_formats_by_group.csv
+        membership : optional, the masks and group names from group_membership() if they were already calculated
 
     Returns:
         groups_per_category : a dataframe with rows by instance of the category and columns Group_List and Groups.
     """
 
-    # Makes a series with a list of group names for each instance of the category.
-
-    groups_list = df_group.groupby(df_group[category])['Group'].unique()
+    # Gets the group bitmask for each instance of the category, calculating it if it was not provided.
+    if membership is None:
+        membership = group_membership([category], df_group)
+    masks, group_names = membership
+    category_masks = masks[category]
+
+    # Makes a series with the number of groups for each instance of the category,
+    # which is the number of bits that are set in the bitmask.
+    group_bits = category_masks.to_numpy()
+    groups_count = sum((group_bits >> position) & 1 for position in range(len(group_names)))
+    groups_count = pd.Series(groups_count, index=category_masks.index, name='Groups').astype(int)
+
+    # Makes a series with a comma-separated string of the group names for each instance of the category,
+    # for easier readability in Excel. The bitmask is only converted back to group names for this display.
+    groups_list = category_masks.apply(lambda mask: ", ".join([name for position, name in enumerate(group_names)
+                                                                 if (mask >> position) & 1]))
     groups_list = groups_list.rename('Group_List')
 
-    # Makes a series with the number of groups for each instance of the category.
-    groups_count = groups_list.str.len()
-    groups_count = groups_count.rename('Groups')
-
-    # Converts the list from a list to a comma-separated string for easier readability in Excel.
-    # Wait to do this until after groups_count so that the count is correct.
-    groups_list = groups_list.apply(", ".join)
-
     # Combines the count and the list series into a single dataframe.
-    # Had to do these separately to get the counts for each instance separately.
     groups_per_category = pd.concat([groups_count, groups_list], axis=1)
 
     # Sorts the values by the number of groups, largest to smallest.
     # The primary use for this data is to see what the most groups have in common.
-    groups_per_category = groups_per_category.sort_values(by='Groups', ascending=False)
+    # The sort is stable, so instances with the same number of groups stay in alphabetical order.
+    groups_per_category = groups_per_category.sort_values(by='Groups', ascending=False, kind='stable')
 
     # Returns the dataframe. Row index is the category and columns are Groups, Group List.
     return groups_per_category
@@ -282,14 +631,228 @@ def groupby_risk(df_group, groupby_list):
     return df
 
 
-def one_category(category, totals, df_aip, df_group):
+def groupby_risk_batch(df_group, groupby_lists):
+    """Calculate the number of file ids, size in GB, and format identifications for several groupby_lists together
+
+    The data is first summarized once into a dataframe (the cube) with a row for each combination of values
+    of every column in any groupby_list and format identification, with the totals of file ids and size.
+    Each result is then calculated from the cube with groupby_risk(), instead of from all of df_group.
+    Because the cube keeps format identification, the number of unique format identifications is still correct.
+
+    The cube is only smaller than df_group if Group is not in any groupby_list, since df_group has one row
+    per group and format identification. Without Group, the rows for the same format identification in every group
+    are combined, so use groupby_risk() on df_group for subtotals by Group instead of including them here.
+
+    Parameters:
+        df_group : a dataframe with the information from archive_formats_by_group.csv
+        groupby_lists : a list of groupby_list, each a list of the column or columns to subtotal on
+
+    Returns:
+        results : a list of dataframes, one per groupby_list in the same order, the same as from groupby_risk()
+    """
+
+    # Makes a list of every column used in any of the groupby_lists, without duplicates, in the order they are used.
+    cube_columns = []
+    for groupby_list in groupby_lists:
+        for column in groupby_list:
+            if column not in cube_columns:
+                cube_columns.append(column)
+
+    # Makes the cube with the total file ids and size for each combination, including blanks in any column
+    # so that the totals match df_group. Only combinations that are in the data are included (observed=True),
+    # and groupby_risk() adds any missing NARA risk levels back when it groups the cube.
+    cube = df_group.groupby(cube_columns + ['Format_Identification'], observed=True, dropna=False)
+    cube = cube[['File_IDs', 'Size_GB']].sum().reset_index()
+
+    # Calculates each result from the cube.
+    results = [groupby_risk(cube, groupby_list) for groupby_list in groupby_lists]
+
+    return results
+
+
+def make_spreadsheet(spreadsheet, formats_by_aip_path, formats_by_group_path, usage_path, output_folder,
+                     chunk_size=None, cache_folder=None, top_n=None):
+    """Read the ARCHive format reports needed for one spreadsheet and make that spreadsheet
+
+    This is run by each worker when the spreadsheets are made at the same time.
+    Each worker reads the reports from the CSVs instead of receiving a copy of dataframes from the main process,
+    and only reads archive_formats_by_aip.csv if it is needed (for the frequency spreadsheet).
+    Only the columns of archive_formats_by_group.csv that are used by the spreadsheet are read.
+    If merge_format_reports.py made an aggregates CSV for the same date, that is read instead of the by_aip CSV.
+    Otherwise, if merge_format_reports.py also saved the by_aip CSV as one CSV per group (partitions),
+    the partitions are read at the same time to make the same aggregates,
+    or if chunk_size is provided, the by_aip CSV is read in chunks to make the same aggregates.
+
+    If cache_folder is provided, the summaries are saved there with a key for every input file the spreadsheet reads
+    and the script code, along with the size and time of the spreadsheet made from them.
+    When the key has not changed, the summaries are not calculated again: the spreadsheet is skipped if it is
+    the one made from the cached summaries, or saved again from the cached summaries if it is missing or was
+    replaced by another run.
+
+    Parameters:
+        spreadsheet : the name of the spreadsheet to make: frequency, group-overlap, ranges, or risk
+        formats_by_aip_path : the path to the archive_formats_by_aip.csv
+        formats_by_group_path : the path to the archive_formats_by_group.csv
+        usage_path : the path to the ARCHive usage report
+        output_folder : the path to a folder for saving script output, which is also the folder with the script inputs
+        chunk_size : optional, the number of rows to read from the by_aip CSV at a time, or None to read it all at once
+        cache_folder : optional, the path to a folder for the cache of summaries, or None to not use a cache
+        top_n : optional, the number of format identifications to include in the frequency spreadsheet,
+        or None to include all of them
+
+    Returns:
+        spreadsheet : the name of the spreadsheet that was made, or raises a ValueError if the name is not known
+    """
+
+    # The file name of each spreadsheet.
+    workbook_names = {"frequency": "ARCHive-Formats-Analysis_Frequency.xlsx",
+                      "group-overlap": "ARCHive-Formats-Analysis_Group-Overlap.xlsx",
+                      "ranges": "ARCHive-Formats-Analysis_Ranges.xlsx",
+                      "risk": "ARCHive-Formats-Analysis_Risk.xlsx",
+                      "usage-trend": "ARCHive-Formats-Analysis_Usage-Trend.xlsx"}
+    if spreadsheet not in workbook_names:
+        raise ValueError(f"Unknown spreadsheet '{spreadsheet}'")
+
+    # The frequency spreadsheet uses the aggregates CSV or the partitions of the by_aip CSV, if they are current.
+    workbook_path = os.path.join(output_folder, workbook_names[spreadsheet])
+    aggregates_path = None
+    partition_paths = None
+    if spreadsheet == "frequency":
+        aggregates_path = get_aggregates_path(formats_by_aip_path)
+        if not aggregates_path:
+            partition_paths = get_partition_paths(formats_by_aip_path)
+
+    # If there is a cache of the summaries made from the same input files, code, and top_n, uses it instead.
+    # Only the frequency spreadsheet uses the by_aip CSV (or the aggregates or partitions made from it)
+    # and the usage report, and the usage-trend spreadsheet only uses every usage report in the output folder.
+    # The by_aip CSV is not read for the key if the aggregates or partitions are used instead, since they are
+    # only used if they were saved after the by_aip CSV, so the key does not depend on the size of the by_aip CSV.
+    if cache_folder:
+        if spreadsheet == "frequency":
+            input_paths = [formats_by_group_path, usage_path]
+            if aggregates_path:
+                input_paths.append(aggregates_path)
+            elif partition_paths:
+                manifest_path = os.path.join(os.path.splitext(formats_by_aip_path)[0], "manifest.csv")
+                input_paths.extend([manifest_path] + partition_paths)
+            else:
+                input_paths.append(formats_by_aip_path)
+        elif spreadsheet == "usage-trend":
+            input_paths = get_usage_paths(output_folder)
+        else:
+            input_paths = [formats_by_group_path]
+        key = cache_key(input_paths)
+        if spreadsheet == "frequency" and top_n is not None:
+            key += f"_top_{top_n}"
+        cache_path = os.path.join(cache_folder, f"{spreadsheet}.pickle")
+        cached = read_cache(cache_path, key)
+        if cached is not None:
+            if workbook_stamp(workbook_path) != cached['workbook']:
+                save_workbook(cached['sheets'], workbook_path)
+                save_cache(cache_path, key, {'sheets': cached['sheets'], 'workbook': workbook_stamp(workbook_path)})
+            return spreadsheet
+
+    # The usage-trend spreadsheet does not use either format report.
+    # It caches each usage report separately, so only new or changed usage reports are read again.
+    if spreadsheet == "usage-trend":
+        usage_cache = os.path.join(cache_folder, "usage") if cache_folder else None
+        sheets = spreadsheet_usage_trend(get_usage_paths(output_folder), output_folder, usage_cache)
+        if cache_folder:
+            save_cache(cache_path, key, {'sheets': sheets, 'workbook': workbook_stamp(workbook_path)})
+        return spreadsheet
+
+    # Reads the columns of archive_formats_by_group.csv used by the spreadsheet.
+    group_columns = {"frequency": ['Group', 'File_IDs', 'Size_GB', 'Format_Type', 'Format_Standardized_Name',
+                                   'Format_Identification'],
+                     "group-overlap": ['Group', 'Format_Type', 'Format_Standardized_Name', 'Format_Identification'],
+                     "ranges": ['File_IDs', 'Size_GB', 'Format_Standardized_Name', 'Format_Identification'],
+                     "risk": ['Group', 'File_IDs', 'Size_GB', 'Format_Type', 'Format_Identification',
+                              'NARA_Risk_Level', 'NARA_Proposed_Preservation_Plan', 'NARA_Match_Type']}
+    df_group = pd.read_csv(formats_by_group_path, usecols=group_columns[spreadsheet])
+
+    if spreadsheet == "frequency":
+        if aggregates_path:
+            df_aggregates = pd.read_csv(aggregates_path)
+            sheets = spreadsheet_frequency(None, df_group, usage_path, output_folder, top_n, df_aggregates)
+        elif partition_paths:
+            df_aggregates = partition_aggregates(partition_paths)
+            sheets = spreadsheet_frequency(None, df_group, usage_path, output_folder, top_n, df_aggregates)
+        elif chunk_size:
+            df_aggregates = chunked_aggregates(formats_by_aip_path, chunk_size)
+            sheets = spreadsheet_frequency(None, df_group, usage_path, output_folder, top_n, df_aggregates)
+        else:
+            df_aip = pd.read_csv(formats_by_aip_path,
+                                 usecols=['Group', 'Collection', 'AIP', 'Format_Type', 'Format_Standardized_Name'])
+            sheets = spreadsheet_frequency(df_aip, df_group, usage_path, output_folder, top_n)
+    elif spreadsheet == "group-overlap":
+        sheets = spreadsheet_group_overlap(df_group, output_folder)
+    elif spreadsheet == "ranges":
+        sheets = spreadsheet_ranges(df_group, output_folder)
+    else:
+        sheets = spreadsheet_risk(df_group, output_folder)
+
+    # Saves the summaries to the cache, so they can be used the next time if nothing has changed,
+    # with the size and time of the spreadsheet so a spreadsheet made by another run is not mistaken for it.
+    if cache_folder:
+        save_cache(cache_path, key, {'sheets': sheets, 'workbook': workbook_stamp(workbook_path)})
+
+    return spreadsheet
+
+
+def nara_plan_type(plans):
+    """Classify each NARA preservation action plan into a type of plan
+
+    There are only a few dozen different plans, so each unique plan is classified once with the rules
+    and the result is copied to every row with that plan, using the position of the plan in the list of unique plans.
+    This can be used for any dataframe with a NARA_Proposed_Preservation_Plan column, including the by_aip data.
+
+    Parameters:
+        plans : a series with the NARA_Proposed_Preservation_Plan for each row
+
+    Returns:
+        plan_types : a series with the type of plan for each row, with the same index as plans
+    """
+
+    # Rules for the plan types, in the order they are checked. The first rule that matches a plan is used.
+    # Each rule is the type of match (equals or starts with), the text to match, and the plan type.
+    rules = [["startswith", "Depends on version", "Depends on version"],
+             ["startswith", "Further research is required", "Further research required"],
+             ["equals", "Retain", "Retain"],
+             ["startswith", "Retain ", "Retain but act"],
+             ["startswith", "Transform", "Transform"]]
+
+    # Gets a code for each row, which is the position of its plan in the list of unique plans.
+    # Blanks (no plan) have the code -1.
+    codes, unique_plans = pd.factorize(plans)
+
+    # Classifies each unique plan. Plans that do not match any rule are Other.
+    unique_types = []
+    for plan in unique_plans:
+        plan_type = "Other"
+        for match, text, rule_type in rules:
+            if (match == "equals" and plan == text) or (match == "startswith" and plan.startswith(text)):
+                plan_type = rule_type
+                break
+        unique_types.append(plan_type)
+
+    # Copies the plan type to each row using the codes. The last type, No plan, is used for code -1.
+    unique_types.append("No plan")
+    plan_types = pd.Series(np.array(unique_types, dtype=object)[codes], index=plans.index, name='NARA_Plan_Type')
+
+    return plan_types
+
+
+def one_category(category, totals, df_aip, df_group, aggregates=None):
     """Calculate subtotals of collection, AIP, and file_id counts and size in GB per each instance of a category
 
+    If the aggregates are provided, the collection and AIP counts are taken from them instead of df_aip.
+
     Parameters:
         category : the column (e.g., Format Type) to subtotal on
         totals : a dictionary with the total number of collections, AIPs, files, and size in ARCHive
-        df_aip : a dataframe with the information from archive_formats_by_aip.csv
+        df_aip : a dataframe with the information from archive_formats_by_aip.csv, or None if aggregates are used
         df_group : a dataframe with the information from archive_formats_by_group.csv
+        aggregates : optional, a dataframe with the information from archive_formats_aggregates.csv
 
     Returns:
         result : a dataframe with rows by instance of the category and
@@ -297,8 +860,13 @@ def one_category(category, totals, df_aip, df_group):
     """
 
     # Creates a series for each count type (collections, AIPs, and file_ids) and size for each instance of the category.
-    collections = df_aip.groupby(category)['Collection'].nunique()
-    aips = df_aip.groupby(category)['AIP'].nunique()
+    # The collection and AIP counts are from the aggregates made by merge_format_reports.py, if provided.
+    if aggregates is not None:
+        collections = aggregate_counts(aggregates, category)['Collection']
+        aips = aggregate_counts(aggregates, category)['AIP']
+    else:
+        collections = df_aip.groupby(category)['Collection'].nunique()
+        aips = df_aip.groupby(category)['AIP'].nunique()
     files = df_group.groupby(category)['File_IDs'].sum()
     size = df_group.groupby(category)['Size_GB'].sum()
 
@@ -334,49 +902,86 @@ def one_category(category, totals, df_aip, df_group):
     return result
 
 
-def size_ranges(category, df_group):
-    """Calculate the number of instances of the category within each range of total size (0-249 GB, 250-499 GB, etc.)
+def partition_aggregates(partition_paths):
+    """Calculate the unique counts used from archive_formats_by_aip.csv from the CSVs for each group
+
+    The CSVs for each group (partitions) are saved by merge_format_reports.py if it is run with partition.
+    The partitions are read at the same time in separate threads, and only the columns used for the counts are read.
 
     Parameters:
-        category : the column to subtotal on
-        df_group : a dataframe with the information from archive_formats_by_group.csv
+        partition_paths : a list of the paths to the CSVs for each group, from get_partition_paths()
 
     Returns:
-        result : a dataframe with rows by size range and column Total Size (CATEGORY)
+        aggregates : a dataframe with the same columns as archive_formats_aggregates.csv (made by
+        merge_format_reports.py), Category, Instance, Collections, AIPs, Format_Types, and Format_Standardized_Names
     """
 
-    # Makes a series with the total size for each instance of the category, regardless of group.
-    df_cat = df_group.groupby(df_group[category])['Size_GB'].sum()
+    columns = ['Group', 'Collection', 'AIP', 'Format_Type', 'Format_Standardized_Name']
+    with ThreadPoolExecutor() as executor:
+        partitions = executor.map(lambda path: pd.read_csv(path, usecols=columns), partition_paths)
+        aggregates = chunks_to_aggregates(partitions)
+    return aggregates
 
-    # Makes series with the subset of the archive_formats_by_group report data with the specified numbers of file_ids.
-    tier_one = df_cat[(df_cat < 10)]
-    tier_two = df_cat[(df_cat >= 10) & (df_cat < 100)]
-    tier_three = df_cat[(df_cat >= 100) & (df_cat < 500)]
-    tier_four = df_cat[(df_cat >= 500) & (df_cat < 1000)]
-    tier_five = df_cat[(df_cat >= 1000) & (df_cat < 10000)]
-    tier_six = df_cat[(df_cat >= 10000) & (df_cat < 50000)]
-    tier_seven = df_cat[(df_cat >= 50000)]
 
-    # Makes lists with the data for the dataframe: file_id ranges (for index) and the number of instances in each range.
-    size_ranges = ["0-9 GB", "10-99 GB", "100-499 GB", "500-999 GB", "1-9 TB", "10-49 TB", "50+ TB"]
-    instances = [tier_one.count(), tier_two.count(), tier_three.count(), tier_four.count(), tier_five.count(),
-                 tier_six.count(), tier_seven.count()]
+def range_counts(values, edges, labels):
+    """Count the number of values within each range, calculating every range in a single pass
 
-    # Makes a dataframe from the lists.
-    result = pd.DataFrame(instances, columns=[f"Total Size ({category})"], index=size_ranges)
+    Each value is assigned to a range by finding its position within the edges,
+    and then the number of values in every range is counted at once.
+    Finer ranges, such as log-scale deciles, only require more edges and labels and do not add more passes.
 
-    # Returns the dataframe. Row index is the size ranges and column is Total Size (category).
-    return result
+    Parameters:
+        values : a series with the numbers to count, for example the File_IDs or Size_GB for each format
+        edges : a list of the numbers where each range after the first starts, in increasing order
+        labels : a list with a name for each range, which is one longer than the list of edges
 
+    Returns:
+        counts : a list with the number of values in each range, in the same order as labels
+    """
 
-def size_in_tb(usage):
-    """Use data from the usage report to calculate the size in TB each group
+    # Finds the range for each value. The first range includes anything below the first edge,
+    # and a value equal to an edge is in the range which starts with that edge.
+    # Blanks are skipped, since they are not in any range.
+    range_positions = np.searchsorted(edges, values.dropna().to_numpy(), side='right')
+
+    # Counts the number of values in each range, including 0 for any range without values.
+    counts = np.bincount(range_positions, minlength=len(labels)).tolist()
+
+    return counts
+
+
+def read_cache(cache_path, key):
+    """Read summaries from the cache, if they were made from the same input files and code
+
+    Parameters:
+        cache_path : the path to the pickle file with the cached summaries, for example for one spreadsheet
+        key : the cache key calculated with cache_key() for the current input files and code
+
+    Returns:
+        summaries : the summaries saved with save_cache(), for example the list of sheets for a spreadsheet,
+        or None if there is no cache or the key is different
+    """
+
+    # A cache that cannot be read, for example from a different version of pandas, is treated like no cache.
+    try:
+        with open(cache_path, 'rb') as cache_open:
+            cache = pickle.load(cache_open)
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        return None
+
+    if cache.get('key') != key:
+        return None
+    return cache['summaries']
+
+
+def read_usage(usage):
+    """Read the number of files and size in TB of each group from the usage report
 
     Parameters:
         usage : the path to the ARCHive usage report
 
     Returns:
-        sizes : a dataframe with rows by group and column Size
+        usage_df : a dataframe with rows by group and columns Files and Size (in TB)
     """
 
     # Group Names maps the human-friendly version of group names from the usage report to the ARCHive group code
@@ -386,8 +991,8 @@ def size_in_tb(usage):
                    "Hargrett Library": "hargrett", "Map and Government Information Library": "magil",
                    "Richard B. Russell Library": "russell"}
 
-    # Makes a dictionary for the size for each group, gathering all data before converting it to a dataframe.
-    group_size = {}
+    # Makes a dictionary for the files and size for each group, gathering all data before converting it to a dataframe.
+    group_usage = {}
 
     # Gets the data from each row of the usage report.
     # A row can have data on a group, an individual user, or be blank.
@@ -395,7 +1000,7 @@ def size_in_tb(usage):
         usage_read = csv.reader(usage_open)
         for row in usage_read:
 
-            # Parses data (group name, size, and size unit of measurement)from each group's row,
+            # Parses data (group name, files, size, and size unit of measurement) from each group's row,
             # identified by not being blank and having a group name at row[0].
             if row and row[0] in group_names:
                 group = group_names[row[0]]
@@ -412,29 +1017,141 @@ def size_in_tb(usage):
                     print("WARNING! Unexpected unit type:", unit)
 
                 # Adds the results for this group to the dictionary.
-                group_size[group] = size
+                group_usage[group] = [int(row[1]), size]
+
+    # Makes the dictionary into a dataframe so it can be combined with other data.
+    usage_df = pd.DataFrame.from_dict(group_usage, orient="index", columns=["Files", "Size"])
+
+    return usage_df
+
+
+def read_usage_period(usage, cache_folder=None):
+    """Read the files and size in TB of each group from a usage report, with the period of the report
+
+    Parameters:
+        usage : the path to the ARCHive usage report, named usage_report_YYYYMMDD_YYYYMMDD.csv
+        cache_folder : optional, the path to a folder for the cache of each usage report, or None to not use a cache
+
+    Returns:
+        period : a dataframe with one row for each group and columns Period_Start, Period_End, Group, Size_TB, and Files
+    """
+
+    # Reads the usage report, or gets it from the cache if the usage report has not changed.
+    if cache_folder:
+        key = cache_key([usage])
+        cache_path = os.path.join(cache_folder, os.path.basename(usage).replace(".csv", ".pickle"))
+        usage_df = read_cache(cache_path, key)
+        if usage_df is None:
+            usage_df = read_usage(usage)
+            save_cache(cache_path, key, usage_df)
+    else:
+        usage_df = read_usage(usage)
+
+    # Gets the period from the dates in the file name and adds it to every row.
+    # get_usage_paths() only includes usage reports with the dates in the file name.
+    start, end = usage_dates(usage)
+    period = pd.DataFrame({'Period_Start': start, 'Period_End': end,
+                           'Group': usage_df.index, 'Size_TB': usage_df['Size'].to_numpy(),
+                           'Files': usage_df['Files'].to_numpy()})
+
+    return period
+
 
-    # Makes the dictionary into a dataframe so it can be combined with the collection and file_id counts.
-    sizes = pd.DataFrame.from_dict(group_size, orient="index", columns=["Size"])
+def save_cache(cache_path, key, summaries):
+    """Save summaries to the cache, with the key for the input files and code they were made from
+
+    Parameters:
+        cache_path : the path to the pickle file for the cached summaries, for example for one spreadsheet
+        key : the cache key calculated with cache_key()
+        summaries : the summaries to save, for example the list with the dataframe, sheet name,
+        and write_sheet() options for each sheet of a spreadsheet
+
+    Returns: none
+    """
+
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(cache_path, 'wb') as cache_open:
+        pickle.dump({'key': key, 'summaries': summaries}, cache_open)
+
+
+def save_workbook(sheets, workbook_path):
+    """Save dataframes as the sheets of an Excel spreadsheet
+
+    Parameters:
+        sheets : a list with the dataframe, sheet name, and write_sheet() options for each sheet, in order
+        workbook_path : the path for the Excel spreadsheet
+
+    Returns: none
+    """
+
+    workbook = Workbook(write_only=True)
+    for df, sheet_name, options in sheets:
+        write_sheet(workbook, df, sheet_name, **options)
+    workbook.save(workbook_path)
+
+
+def size_ranges(category, df_group):
+    """Calculate the number of instances of the category within each range of total size (0-249 GB, 250-499 GB, etc.)
+
+    Parameters:
+        category : the column to subtotal on
+        df_group : a dataframe with the information from archive_formats_by_group.csv
+
+    Returns:
+        result : a dataframe with rows by size range and column Total Size (CATEGORY)
+    """
+
+    # Makes a series with the total size for each instance of the category, regardless of group.
+    df_cat = df_group.groupby(df_group[category])['Size_GB'].sum()
+
+    # Counts the number of instances in each size range, in GB.
+    # Edges are where each range after the first starts and labels are used for the dataframe index.
+    edges = [10, 100, 500, 1000, 10000, 50000]
+    size_ranges = ["0-9 GB", "10-99 GB", "100-499 GB", "500-999 GB", "1-9 TB", "10-49 TB", "50+ TB"]
+    instances = range_counts(df_cat, edges, size_ranges)
+
+    # Makes a dataframe from the lists.
+    result = pd.DataFrame(instances, columns=[f"Total Size ({category})"], index=size_ranges)
+
+    # Returns the dataframe. Row index is the size ranges and column is Total Size (category).
+    return result
+
+
+def size_in_tb(usage):
+    """Use data from the usage report to calculate the size in TB each group
+
+    Parameters:
+        usage : the path to the ARCHive usage report
+
+    Returns:
+        sizes : a dataframe with rows by group and column Size
+    """
+
+    # Gets the size from the usage report, which also has the number of files.
+    sizes = read_usage(usage)[['Size']]
 
     # Returns the dataframe. Row index is the group_code and the column is Size.
     return sizes
 
 
-def spreadsheet_frequency(df_aip, df_group, usage, output_folder):
+def spreadsheet_frequency(df_aip, df_group, usage, output_folder, top_n=None, aggregates=None):
     """Save counts and percentages of different categories to a spreadsheet named ARCHive-Formats-Analysis_Frequency.xlsx
 
     Parameters:
-        df_aip : a dataframe with the information from archive_formats_by_aip.csv
+        df_aip : a dataframe with the information from archive_formats_by_aip.csv, or None if aggregates are used
         df_group : a dataframe with the information from archive_formats_by_group.csv
         usage : the path to the ARCHive usage report
         output_folder : the path to a folder for saving script output, which is also the folder with the script inputs
+        top_n : optional, the number of format identifications to include in the Format_IDs sheet, or None for all
+        aggregates : optional, a dataframe with the information from archive_formats_aggregates.csv,
+        which is used for collection and AIP counts instead of df_aip
 
-    Returns: none
+    Returns:
+        sheets : a list with the dataframe, sheet name, and write_sheet() options for each sheet in the spreadsheet
     """
 
     # Makes the ARCHive overview dataframe (summary statistics by group).
-    overview = archive_overview(df_aip, df_group, usage)
+    overview = archive_overview(df_aip, df_group, usage, aggregates)
 
     # Saves totals to a dictionary for calculating percentages in other dataframes.
     # Use these totals each time so collection and AIP counts aren't inflated by multiple identifications.
@@ -445,20 +1162,21 @@ def spreadsheet_frequency(df_aip, df_group, usage, output_folder):
                    'Size': overview['Size_GB_Inflated']['total']}
 
     # Makes the format type summary (collection, AIP, file_id, and size counts and percentages).
-    format_types = one_category("Format_Type", totals_dict, df_aip, df_group)
+    format_types = one_category("Format_Type", totals_dict, df_aip, df_group, aggregates)
 
     # Makes the format standardized name summary (collection, AIP, file_id, and size counts and percentages).
-    format_names = one_category("Format_Standardized_Name", totals_dict, df_aip, df_group)
+    format_names = one_category("Format_Standardized_Name", totals_dict, df_aip, df_group, aggregates)
 
     # Makes a format identifications summary (file_id and size count and percentage).
-    format_ids = format_id_frequency(totals_dict, df_group)
+    # If top_n is provided, it only has the most common format identifications and a row for all others.
+    format_ids = format_id_frequency(totals_dict, df_group, top_n)
 
     # Saves each summary as a separate sheet in an Excel spreadsheet.
-    with pd.ExcelWriter(os.path.join(output_folder, f"ARCHive-Formats-Analysis_Frequency.xlsx")) as results:
-        overview.to_excel(results, sheet_name="Group_Overview", index_label="Group")
-        format_types.to_excel(results, sheet_name="Format_Types")
-        format_names.to_excel(results, sheet_name="Format_Names")
-        format_ids.to_excel(results, sheet_name="Format_IDs")
+    sheets = [(overview, "Group_Overview", {"index_label": "Group"}), (format_types, "Format_Types", {}),
+              (format_names, "Format_Names", {}), (format_ids, "Format_IDs", {})]
+    save_workbook(sheets, os.path.join(output_folder, f"ARCHive-Formats-Analysis_Frequency.xlsx"))
+
+    return sheets
 
 
 def spreadsheet_group_overlap(df_group, output_folder):
@@ -468,23 +1186,30 @@ def spreadsheet_group_overlap(df_group, output_folder):
         df_group : a dataframe with the information from archive_formats_by_group.csv
         output_folder : the path to a folder for saving script output, which is also the folder with the script inputs
 
-    Returns: none
+    Returns:
+        sheets : a list with the dataframe, sheet name, and write_sheet() options for each sheet in the spreadsheet
     """
 
+    # Calculates which groups have each format type, format standardized name, and format identification,
+    # all from the same pass through df_group.
+    categories = ['Format_Type', 'Format_Standardized_Name', 'Format_Identification']
+    membership = group_membership(categories, df_group)
+
     # Makes a dataframe with the number of groups and list of groups that have each format type.
-    groups_per_type = group_overlap('Format_Type', df_group)
+    groups_per_type = group_overlap('Format_Type', df_group, membership)
 
     # Makes a dataframe with the number of groups and list of groups that have each format standardized name.
-    groups_per_name = group_overlap('Format_Standardized_Name', df_group)
+    groups_per_name = group_overlap('Format_Standardized_Name', df_group, membership)
 
     # Makes a dataframe with the number of groups and list of groups that have each format identification.
-    groups_per_id = group_overlap('Format_Identification', df_group)
+    groups_per_id = group_overlap('Format_Identification', df_group, membership)
 
     # Saves each dataframe as a separate sheet in an Excel spreadsheet.
-    with pd.ExcelWriter(os.path.join(output_folder, f"ARCHive-Formats-Analysis_Group-Overlap.xlsx")) as results:
-        groups_per_type.to_excel(results, sheet_name="Groups_per_Type")
-        groups_per_name.to_excel(results, sheet_name="Groups_per_Name")
-        groups_per_id.to_excel(results, sheet_name="Groups_per_Format_ID")
+    sheets = [(groups_per_type, "Groups_per_Type", {}), (groups_per_name, "Groups_per_Name", {}),
+              (groups_per_id, "Groups_per_Format_ID", {})]
+    save_workbook(sheets, os.path.join(output_folder, f"ARCHive-Formats-Analysis_Group-Overlap.xlsx"))
+
+    return sheets
 
 
 def spreadsheet_ranges(df_group, output_folder):
@@ -494,7 +1219,8 @@ def spreadsheet_ranges(df_group, output_folder):
         df_group : a dataframe with the information from archive_formats_by_group.csv
         output_folder : the path to a folder for saving script output, which is also the folder with the script inputs
 
-    Returns: none
+    Returns:
+        sheets : a list with the dataframe, sheet name, and write_sheet() options for each sheet in the spreadsheet
     """
 
     # Makes dataframes with the number of format standardized names within different ranges of file_id counts and sizes.
@@ -506,11 +1232,13 @@ def spreadsheet_ranges(df_group, output_folder):
     format_id_sizes = size_ranges('Format_Identification', df_group)
 
     # Saves each dataframe as a separate sheet in an Excel spreadsheet.
-    with pd.ExcelWriter(os.path.join(output_folder, f"ARCHive-Formats-Analysis_Ranges.xlsx")) as results:
-        format_name_ranges.to_excel(results, sheet_name="Format_Name_Ranges", index_label="File_ID Count Range")
-        format_name_sizes.to_excel(results, sheet_name="Format_Name_Sizes", index_label="Size Range")
-        format_id_ranges.to_excel(results, sheet_name="Format_ID_Ranges", index_label="File_ID Count Range")
-        format_id_sizes.to_excel(results, sheet_name="Format_ID_Sizes", index_label="Size Range")
+    sheets = [(format_name_ranges, "Format_Name_Ranges", {"index_label": "File_ID Count Range"}),
+              (format_name_sizes, "Format_Name_Sizes", {"index_label": "Size Range"}),
+              (format_id_ranges, "Format_ID_Ranges", {"index_label": "File_ID Count Range"}),
+              (format_id_sizes, "Format_ID_Sizes", {"index_label": "Size Range"})]
+    save_workbook(sheets, os.path.join(output_folder, f"ARCHive-Formats-Analysis_Ranges.xlsx"))
+
+    return sheets
 
 
 def spreadsheet_risk(df_group, output_folder):
@@ -520,7 +1248,8 @@ def spreadsheet_risk(df_group, output_folder):
         df_group : a dataframe with the information from archive_formats_by_group.csv
         output_folder : the path to a folder for saving script output, which is also the folder with the script inputs
 
-    Returns: none
+    Returns:
+        sheets : a list with the dataframe, sheet name, and write_sheet() options for each sheet in the spreadsheet
     """
 
     # Assigns an order to the NARA risk categories, so results are in order of increasing risk.
@@ -528,72 +1257,336 @@ def spreadsheet_risk(df_group, output_folder):
     df_group['NARA_Risk_Level'] = pd.Categorical(df_group['NARA_Risk_Level'], risk_order, ordered=True)
 
     # Makes a new column to classify the type of NARA preservation action plan.
-    conditions = [(df_group['NARA_Proposed_Preservation_Plan'].notnull()) &
-                  (df_group['NARA_Proposed_Preservation_Plan'].str.startswith("Depends on version")),
-                  (df_group['NARA_Proposed_Preservation_Plan'].notnull()) &
-                  (df_group['NARA_Proposed_Preservation_Plan'].str.startswith("Further research is required")),
-                  df_group['NARA_Proposed_Preservation_Plan'].isnull(),
-                  df_group['NARA_Proposed_Preservation_Plan'] == "Retain",
-                  (df_group['NARA_Proposed_Preservation_Plan'].notnull()) &
-                  (df_group['NARA_Proposed_Preservation_Plan'].str.startswith("Retain ")),
-                  (df_group['NARA_Proposed_Preservation_Plan'].notnull()) &
-                  (df_group['NARA_Proposed_Preservation_Plan'].str.startswith("Transform"))]
-    plan_type = ["Depends on version", "Further research required", "No plan", "Retain", "Retain but act", "Transform"]
-    df_group["NARA_Plan_Type"] = np.select(conditions, plan_type)
+    df_group["NARA_Plan_Type"] = nara_plan_type(df_group['NARA_Proposed_Preservation_Plan'])
 
     # Calculates the dataframe for each risk summary.
     # The first four are the amount at each NARA risk level for different categories of data
     # and the last is the match method between format identifications and NARA risk.
-    archive_risk = groupby_risk(df_group, ['NARA_Risk_Level'])
+    # The department summary is calculated from df_group. The others are calculated together from a cube
+    # without Group, which has one row per format identification instead of one per group and format identification.
     dept_risk = groupby_risk(df_group, ['Group', 'NARA_Risk_Level'])
-    type_risk = groupby_risk(df_group, ['Format_Type', 'NARA_Risk_Level'])
-    plan_risk = groupby_risk(df_group, ['NARA_Plan_Type', 'NARA_Risk_Level'])
-    match = groupby_risk(df_group, ['NARA_Match_Type'])
+    groupby_lists = [['NARA_Risk_Level'], ['Format_Type', 'NARA_Risk_Level'], ['NARA_Plan_Type', 'NARA_Risk_Level'],
+                     ['NARA_Match_Type']]
+    archive_risk, type_risk, plan_risk, match = groupby_risk_batch(df_group, groupby_lists)
 
     # Saves each dataframe as a separate sheet in an Excel spreadsheet.
-    with pd.ExcelWriter(os.path.join(output_folder, "ARCHive-Formats-Analysis_Risk.xlsx")) as results:
-        archive_risk.to_excel(results, sheet_name="ARCHive_Risk_Overview", index=False)
-        dept_risk.to_excel(results, sheet_name="Department_Risk_Overview", index=False)
-        type_risk.to_excel(results, sheet_name="Format_Type_Risk", index=False)
-        plan_risk.to_excel(results, sheet_name="NARA_Plan_Type_Risk", index=False)
-        match.to_excel(results, sheet_name="NARA_Match_Types", index=False)
+    sheets = [(archive_risk, "ARCHive_Risk_Overview", {"index": False}),
+              (dept_risk, "Department_Risk_Overview", {"index": False}),
+              (type_risk, "Format_Type_Risk", {"index": False}),
+              (plan_risk, "NARA_Plan_Type_Risk", {"index": False}),
+              (match, "NARA_Match_Types", {"index": False})]
+    save_workbook(sheets, os.path.join(output_folder, "ARCHive-Formats-Analysis_Risk.xlsx"))
+
+    return sheets
+
+
+def spreadsheet_usage_trend(usage_paths, output_folder, cache_folder=None):
+    """Save the usage from several usage reports to a spreadsheet named ARCHive-Formats-Analysis_Usage-Trend.xlsx
+
+    Parameters:
+        usage_paths : a list of the paths to the ARCHive usage reports, for example one for each year
+        output_folder : the path to a folder for saving script output, which is also the folder with the script inputs
+        cache_folder : optional, the path to a folder for the cache of each usage report, or None to not use a cache
+
+    Returns:
+        sheets : a list with the dataframe, sheet name, and write_sheet() options for each sheet in the spreadsheet
+    """
+
+    # Makes the dataframe with the files and size for each group in each usage report.
+    trend = usage_trend(usage_paths, cache_folder)
+
+    # Makes the dataframe with the total size for each group at the end of each period.
+    growth = usage_growth(trend)
+
+    # Saves each dataframe as a separate sheet in an Excel spreadsheet.
+    sheets = [(trend, "Usage_Trend", {"index": False}), (growth, "Usage_Growth", {"index_label": "Group"})]
+    save_workbook(sheets, os.path.join(output_folder, "ARCHive-Formats-Analysis_Usage-Trend.xlsx"))
+
+    return sheets
+
+
+def usage_dates(usage):
+    """Get the start and end dates of the period of a usage report from its file name
+
+    The file name may have more text after the dates, for example usage_report_YYYYMMDD_YYYYMMDD (1).csv
+    if the usage report was downloaded more than once.
+
+    Parameters:
+        usage : the path to the ARCHive usage report, named usage_report_YYYYMMDD_YYYYMMDD.csv
+
+    Returns:
+        period : a tuple with the start and end dates of the period, formatted YYYY-MM-DD,
+        or None if the file name does not start with two valid dates
+    """
+
+    match = re.match(r"usage_report_(\d{8})_(\d{8})", os.path.basename(usage))
+    if match is None:
+        return None
+    try:
+        period = tuple(pd.to_datetime(date, format="%Y%m%d").strftime("%Y-%m-%d") for date in match.groups())
+    except ValueError:
+        return None
+
+    return period
+
+
+def usage_days(usage):
+    """Calculate the number of days in the period of a usage report, to compare the length of the periods
+
+    Parameters:
+        usage : the path to the ARCHive usage report, named usage_report_YYYYMMDD_YYYYMMDD.csv
+
+    Returns:
+        days : the number of days from the start date to the end date of the period
+    """
+
+    start, end = usage_dates(usage)
+    days = (pd.Timestamp(end) - pd.Timestamp(start)).days
+
+    return days
+
+
+def usage_growth(trend):
+    """Calculate the total size in TB for each group at the end of each period from the usage trend
+
+    Each usage report has the amount ingested during its period, so the total at the end of a period
+    is the sum of that period and all the periods before it. The periods do not overlap,
+    since get_usage_paths() leaves out any usage report that overlaps a shorter one.
+
+    Parameters:
+        trend : a dataframe made by usage_trend(), with the files and size for each group and period
+
+    Returns:
+        growth : a dataframe with rows by group, plus a total row, and a column with the total size (TB)
+        at the end of each period, named with the end date of the period
+    """
+
+    # Makes a dataframe with the size for each group (rows) in each period (columns), with 0 if there was no usage.
+    growth = trend.pivot_table(index='Group', columns='Period_End', values='Size_TB', aggfunc='sum', fill_value=0)
+
+    # Adds each period to the periods before it and rounds to 2 decimal places, since the sums add more decimals.
+    growth = round(growth.cumsum(axis=1), 2)
+    growth.columns.name = None
+
+    # Adds the column totals as a row in the dataframe.
+    growth.loc["total"] = round(growth.sum(), 2)
+
+    return growth
+
+
+def usage_trend(usage_paths, cache_folder=None):
+    """Read the files and size in TB for each group from several usage reports into one dataframe
+
+    The usage reports are read at the same time, each in a separate thread since they are small files.
+    If cache_folder is provided, the result for each usage report is cached with a key for its content,
+    so a usage report is only read again if it (or this script) has changed.
+
+    Parameters:
+        usage_paths : a list of the paths to the ARCHive usage reports, for example one for each year
+        cache_folder : optional, the path to a folder for the cache of each usage report, or None to not use a cache
+
+    Returns:
+        trend : a dataframe with one row for each group in each usage report and
+        columns Period_Start, Period_End, Group, Size_TB, and Files, in order by period and group
+    """
+
+    # Reads each usage report.
+    with ThreadPoolExecutor() as executor:
+        periods = list(executor.map(read_usage_period, usage_paths, [cache_folder] * len(usage_paths)))
+
+    # Combines the usage reports into one dataframe, in order by period and group.
+    if periods:
+        trend = pd.concat(periods, ignore_index=True)
+    else:
+        trend = pd.DataFrame(columns=['Period_Start', 'Period_End', 'Group', 'Size_TB', 'Files'])
+    trend = trend.sort_values(['Period_Start', 'Period_End', 'Group'], ignore_index=True)
+    trend = trend.astype({'Size_TB': float, 'Files': int})
+
+    return trend
+
+
+def workbook_stamp(workbook_path):
+    """Get the size and modification time of a spreadsheet, to tell if it is the one saved with a cache
+
+    Parameters:
+        workbook_path : the path to the spreadsheet
+
+    Returns:
+        stamp : a list with the size in bytes and modification time in nanoseconds, or None if it does not exist
+    """
+
+    if not os.path.exists(workbook_path):
+        return None
+    stats = os.stat(workbook_path)
+    stamp = [stats.st_size, stats.st_mtime_ns]
+
+    return stamp
+
+
+def write_sheet(workbook, df, sheet_name, index=True, index_label=None, chunk_size=10000,
+                max_rows=1048576, max_columns=16384):
+    """Save a dataframe as a sheet in a write-only (streaming) Excel workbook, one chunk of rows at a time
+
+    The layout is the same as pandas to_excel(): header row(s), then one row per dataframe row,
+    with the index in the first column(s) if index is True.
+    A write-only workbook saves each row as it is added instead of keeping every cell in memory,
+    and converting the rows to Excel values one chunk at a time keeps the memory used constant for large sheets.
+    Write-only sheets cannot merge cells, so repeated labels in a header or MultiIndex are left blank instead.
+
+    If the dataframe has more rows or columns than fit in one Excel sheet, it is split across numbered sheets
+    (sheet_name_1, sheet_name_2, etc.), each with the headers and index, instead of the save failing.
+    A sheet named sheet_name_Index is added before them with the rows and columns of the dataframe in each sheet.
+
+    Parameters:
+        workbook : an openpyxl Workbook made with write_only=True
+        df : the dataframe to save
+        sheet_name : the name of the sheet
+        index : optional, if the index is included in the sheet (default True)
+        index_label : optional, the header to use for the index column instead of the index name
+        chunk_size : optional, the number of rows to convert to Excel values at a time (default 10000)
+        max_rows : optional, the number of rows allowed in a sheet, including headers (default is Excel limit)
+        max_columns : optional, the number of columns allowed in a sheet, including the index (default is Excel limit)
+
+    Returns: none
+    """
+
+    # Gets the labels to use for the index column(s).
+    # The index_label replaces the index name(s), and a blank label is used if the index has no name.
+    if index_label is not None:
+        index_names = [index_label] if isinstance(index_label, str) else list(index_label)
+    else:
+        index_names = list(df.index.names)
+    index_width = len(index_names) if index else 0
+
+    # Calculates how many dataframe rows and columns fit in one sheet, after the header rows and index columns.
+    # With one level of columns there is one header row, and with multiple levels there is a row per level
+    # plus a row for the index name(s).
+    if df.columns.nlevels == 1:
+        header_height = 1
+    else:
+        header_height = df.columns.nlevels + (1 if index else 0)
+    rows_per_sheet = max_rows - header_height
+    columns_per_sheet = max_columns - index_width
+
+    # Makes a list of the sheets needed, with the name and the range of dataframe rows and columns for each.
+    # There is always at least one sheet, even if the dataframe is empty.
+    row_starts = range(0, max(len(df), 1), rows_per_sheet)
+    column_starts = range(0, max(len(df.columns), 1), columns_per_sheet)
+    sheets = []
+    for row_start in row_starts:
+        for column_start in column_starts:
+            sheets.append([f"{sheet_name}_{len(sheets) + 1}", row_start, min(row_start + rows_per_sheet, len(df)),
+                           column_start, min(column_start + columns_per_sheet, len(df.columns))])
+
+    # If the dataframe fits in one sheet, it keeps the original sheet name.
+    # Otherwise, adds the index sheet with the rows and columns (starting with 1) that are in each numbered sheet.
+    if len(sheets) == 1:
+        sheets[0][0] = sheet_name
+    else:
+        sheet_index = pd.DataFrame([[name, row_start + 1, row_end, column_start + 1, column_end]
+                                    for name, row_start, row_end, column_start, column_end in sheets],
+                                   columns=["Sheet", "First_Row", "Last_Row", "First_Column", "Last_Column"])
+        write_sheet(workbook, sheet_index, f"{sheet_name}_Index", index=False)
+
+    for name, row_start, row_end, column_start, column_end in sheets:
+        df_sheet = df.iloc[row_start:row_end, column_start:column_end]
+        worksheet = workbook.create_sheet(name)
+
+        # Headers (column names and the index name) are bold, like pandas to_excel().
+        def header_cell(value):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.font = Font(bold=True)
+            return cell
+
+        # Adds the header row(s).
+        # With one level of columns, the index name(s) are in the same row as the column names.
+        # With multiple levels, there is one row per level with the level name in the index column,
+        # followed by a row with the index name(s), and a label that repeats the one to its left is left blank.
+        if df_sheet.columns.nlevels == 1:
+            index_header = [header_cell(index_name) for index_name in index_names] if index else []
+            worksheet.append(index_header + [header_cell(column) for column in df_sheet.columns])
+        else:
+            for level in range(df_sheet.columns.nlevels):
+                row = [None] * index_width
+                if index:
+                    row[-1] = header_cell(df_sheet.columns.names[level])
+                previous = None
+                for column in df_sheet.columns:
+                    row.append(header_cell(column[level] if column[:level + 1] != previous else None))
+                    previous = column[:level + 1]
+                worksheet.append(row)
+            if index:
+                worksheet.append([header_cell(index_name) for index_name in index_names])
+
+        # Adds the data rows, one chunk at a time.
+        # Blanks are saved as empty cells and categorical values are saved as their label.
+        # With a MultiIndex, a label that repeats the one above it (within the same higher level labels) is left blank.
+        previous_index = None
+        for start in range(0, len(df_sheet), chunk_size):
+            chunk = df_sheet.iloc[start:start + chunk_size]
+            values = chunk.astype(object).where(chunk.notna(), None).values.tolist()
+            labels = chunk.index.tolist()
+            for label, row_values in zip(labels, values):
+                if not index:
+                    worksheet.append(row_values)
+                    continue
+                if df_sheet.index.nlevels == 1:
+                    worksheet.append([header_cell(label)] + row_values)
+                else:
+                    row = []
+                    for level in range(df_sheet.index.nlevels):
+                        repeat = previous_index is not None and label[:level + 1] == previous_index[:level + 1]
+                        row.append(header_cell(None if repeat else label[level]))
+                    worksheet.append(row + row_values)
+                    previous_index = label
 
 
 if __name__ == '__main__':
 
-    # Verifies the required argument is present and the path is valid.
+    # Verifies the required argument is present and the path is valid,
+    # and that any optional arguments are the names of spreadsheets.
     # If there was an error, prints the error and exits the script.
     report_folder, error_message = check_argument(sys.argv)
-    if error_message:
-        print(error_message)
-        print("Script usage: python path/archive_reports.py report_folder")
+    spreadsheet_names, top_number, spreadsheet_errors = check_spreadsheets(sys.argv)
+    if error_message or spreadsheet_errors:
+        for error in [error_message] + spreadsheet_errors:
+            if error:
+                print(error)
+        print("Script usage: python path/archive_reports.py report_folder [spreadsheet ...] [top=N]")
         sys.exit(1)
 
-    # Gets paths of the three archive_reports to be analyzed, which are in report_folder.
-    # If any were not found (missing is not empty), prints the missing one(s) and exits the script.
-    formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder)
+    # Gets paths of the archive_reports to be analyzed, which are in report_folder.
+    # If any needed for the spreadsheets were not found (missing is not empty), prints the missing one(s)
+    # and exits the script.
+    formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder,
+                                                                                            spreadsheet_names)
     if len(missing) > 0:
         for file_name in missing:
             print(f"Could not find {file_name} in '{report_folder}'.")
         print("Please add the missing report(s) to the report folder and run this script again.")
         sys.exit(1)
 
-    # Makes dataframes from both ARCHive format archive_reports.
-    df_formats_by_aip = pd.read_csv(formats_by_aip_report)
-    df_formats_by_group = pd.read_csv(formats_by_group_report)
-
-    # Makes a spreadsheet in the folder with the ARCHive archive_reports
-    # with summaries based on counts and percentages of collection, AIP, file ids, and/or size.
-    spreadsheet_frequency(df_formats_by_aip, df_formats_by_group, usage_report, report_folder)
-
-    # Makes a spreadsheet in the folder with the ARCHive archive_reports
-    # with summaries of group overlap for each instance of format type, format name, and format id.
-    spreadsheet_group_overlap(df_formats_by_group, report_folder)
-
-    # Makes a spreadsheet in the folder with the ARCHive archive_reports
-    # with summaries of the number of instances within predetermined ranges of file id counts or size.
-    spreadsheet_ranges(df_formats_by_group, report_folder)
-
-    # Makes a spreadsheet in the folder with the ARCHive archive_reports
-    # with summaries of the amount of content at different NARA risk levels.
-    spreadsheet_risk(df_formats_by_group, report_folder)
+    # If archive_formats_by_aip.csv is too large to read into memory at once (more than 1 GB),
+    # it is read in chunks of 100,000 rows when it is needed for the frequency spreadsheet.
+    chunk_size = None
+    if formats_by_aip_report and os.path.getsize(formats_by_aip_report) > 1000000000:
+        chunk_size = 100000
+
+    # Summaries are cached in a folder within the report folder, so a spreadsheet is only made again
+    # if the reports it uses or this script have changed since the last time it was made.
+    cache_folder = os.path.join(report_folder, "archive_reports_cache")
+
+    # Makes the requested spreadsheets (all four if none were requested) in the folder with the ARCHive archive_reports
+    # at the same time, each in a separate process, since most of the time for each is spent saving the Excel file.
+    #   * frequency: summaries based on counts and percentages of collection, AIP, file ids, and/or size.
+    #   * group-overlap: summaries of group overlap for each instance of format type, format name, and format id.
+    #   * ranges: summaries of the number of instances within predetermined ranges of file id counts or size.
+    #   * risk: summaries of the amount of content at different NARA risk levels.
+    #   * usage-trend: the size of each group in every usage report in the folder, only made if requested.
+    # Calling result() on each future raises any error from making that spreadsheet.
+    with ProcessPoolExecutor(max_workers=len(spreadsheet_names)) as executor:
+        futures = [executor.submit(make_spreadsheet, name, formats_by_aip_report, formats_by_group_report,
+                                   usage_report, report_folder, chunk_size, cache_folder, top_number)
+                   for name in spreadsheet_names]
+        for future in futures:
+            future.result()
@@ -0,0 +1,195 @@
+"""Find the formats that changed for each group between two merged format reports
+
+The reports are two archive_formats_by_group.csv or two archive_formats_by_aip.csv made by merge_format_reports.py,
+for example from the previous and current format analysis. Each group and format identification is compared:
+    * Appeared: the group has the format identification in the current report but not the previous report.
+    * Disappeared: the group has the format identification in the previous report but not the current report.
+    * Changed: the group has the format identification in both, with a different amount.
+The amount is the number of file_ids and size (GB) for by_group reports and the number of AIPs for by_aip reports.
+
+Parameters:
+    previous_formats_csv : the path to the merged format report for the previous analysis
+    current_formats_csv : the path to the merged format report of the same type for the current analysis
+
+Returns:
+    format_changes_PREVIOUS_to_CURRENT.csv : saved in the same folder as current_formats_csv,
+    with one row for each group and format identification that appeared, disappeared, or changed
+"""
+
+import numpy as np
+import os
+import pandas as pd
+import sys
+from format_trends import snapshot_name
+
+
+def check_arguments(argument_list):
+    """Check both required arguments are present and correct
+
+    Parameters:
+        argument_list : the list from sys.argv with the script parameters
+
+    Returns:
+        previous_path : the path to the merged format report for the previous analysis, or None
+        current_path : the path to the merged format report for the current analysis, or None
+        errors : the list of errors, if any, or an empty list
+    """
+
+    # Makes variables with default values to store the results of the function.
+    paths = {"previous_formats_csv": None, "current_formats_csv": None}
+    errors = []
+
+    # Verifies that each required argument is present,
+    # and if it is present that it exists and has the expected filename.
+    for position, name in enumerate(paths, start=1):
+        if len(argument_list) > position:
+            paths[name] = argument_list[position]
+            if not os.path.exists(paths[name]):
+                errors.append(f"{name} '{paths[name]}' does not exist")
+            if snapshot_name(paths[name]) is None:
+                errors.append(f"'{paths[name]}' is not the correct type "
+                              f"(should be archive_formats_by_group_YYYY-MM.csv or archive_formats_by_aip_YYYY-MM.csv)")
+        else:
+            errors.append(f"Required argument {name} is missing")
+
+    # Verifies that both reports are the same type, so they can be compared.
+    previous_path = paths["previous_formats_csv"]
+    current_path = paths["current_formats_csv"]
+    if not errors and snapshot_name(previous_path)[0] != snapshot_name(current_path)[0]:
+        errors.append("previous_formats_csv and current_formats_csv must both be by_group or both be by_aip reports")
+
+    return previous_path, current_path, errors
+
+
+def format_changes(df_previous, df_current, value_columns):
+    """Compare the amount of each format identification for each group between two merged format reports
+
+    The group and format identification of every row in both reports is converted to a number (code),
+    using the same codes for both reports, so the reports are joined on the codes instead of on the text.
+    The amounts for each code are totaled with one pass through each report, and a group and format identification
+    is in the result if it is only in one report or if any amount is different.
+
+    Parameters:
+        df_previous : a dataframe with Group, Format_Identification, and value_columns for the previous analysis,
+        plus AIP if value_columns is empty
+        df_current : a dataframe with Group, Format_Identification, and value_columns for the current analysis,
+        plus AIP if value_columns is empty
+        value_columns : a list of the columns with amounts to compare, for example File_IDs and Size_GB,
+        or an empty list to compare the number of unique AIPs (for by_aip reports)
+
+    Returns:
+        changes : a dataframe with columns Group, Format_Identification, Change (Appeared, Disappeared, or Changed),
+        and the previous amount, current amount, and change in amount for each value,
+        sorted by group and format identification
+    """
+
+    # Gets a code for each row of both reports, which is the same for the same group and format identification.
+    # The codes are the position of the key in a list of the unique keys in both reports.
+    previous_codes, current_codes, keys = key_codes(df_previous, df_current, ['Group', 'Format_Identification'])
+    key_count = len(keys)
+
+    # Calculates the amount for each key in each report. If there are no value columns, the amount is the
+    # number of unique AIPs, since an AIP can have more than one row for the same format identification
+    # (for example, if it matched more than one NARA format). A key is in a report if it has at least one row in it.
+    previous_rows = np.bincount(previous_codes, minlength=key_count)
+    current_rows = np.bincount(current_codes, minlength=key_count)
+    if not value_columns:
+        value_columns = ['AIPs']
+        previous_aips = pd.DataFrame({'Code': previous_codes, 'AIP': df_previous['AIP'].to_numpy()}).drop_duplicates()
+        current_aips = pd.DataFrame({'Code': current_codes, 'AIP': df_current['AIP'].to_numpy()}).drop_duplicates()
+        previous_values = {'AIPs': np.bincount(previous_aips['Code'], minlength=key_count)}
+        current_values = {'AIPs': np.bincount(current_aips['Code'], minlength=key_count)}
+    else:
+        previous_values = {}
+        current_values = {}
+        for column in value_columns:
+            previous_values[column] = np.bincount(previous_codes, weights=df_previous[column].fillna(0).to_numpy(),
+                                                  minlength=key_count)
+            current_values[column] = np.bincount(current_codes, weights=df_current[column].fillna(0).to_numpy(),
+                                                 minlength=key_count)
+
+            # np.bincount totals as decimals, so whole numbers (like File_IDs) are changed back to integers.
+            if pd.api.types.is_integer_dtype(df_previous[column]) and pd.api.types.is_integer_dtype(df_current[column]):
+                previous_values[column] = previous_values[column].round().astype(np.int64)
+                current_values[column] = current_values[column].round().astype(np.int64)
+
+    # Finds the change for each key. Differences are rounded to 3 decimal places (the precision of Size_GB),
+    # so that adding decimals in a different order is not a change.
+    in_previous = previous_rows > 0
+    in_current = current_rows > 0
+    different = np.zeros(key_count, dtype=bool)
+    for column in value_columns:
+        different |= np.round(current_values[column] - previous_values[column], 3) != 0
+    change = np.select([~in_previous, ~in_current, different], ["Appeared", "Disappeared", "Changed"], "Unchanged")
+
+    # Makes a dataframe with the keys that are not unchanged and their amounts.
+    changes = keys.copy()
+    changes['Change'] = change
+    for column in value_columns:
+        changes[f'Previous_{column}'] = previous_values[column]
+        changes[f'Current_{column}'] = current_values[column]
+        changes[f'{column}_Change'] = np.round(current_values[column] - previous_values[column], 3)
+    changes = changes[changes['Change'] != "Unchanged"]
+    changes = changes.sort_values(['Group', 'Format_Identification'], ignore_index=True)
+    return changes
+
+
+def key_codes(df_previous, df_current, key_columns):
+    """Convert the key columns of two dataframes into one number (code) per row, using the same codes for both
+
+    Each key column is converted to codes for the values in both dataframes together, and then the codes
+    for each column are combined, so rows in either dataframe with the same values in every key column
+    have the same code. Blanks are treated as an empty string.
+
+    Parameters:
+        df_previous : a dataframe with the key columns
+        df_current : a dataframe with the key columns
+        key_columns : a list of the columns that together identify a row, for example Group and Format_Identification
+
+    Returns:
+        previous_codes : a numpy array with the code for each row of df_previous
+        current_codes : a numpy array with the code for each row of df_current
+        keys : a dataframe with the key columns and a row for each code, in order by code
+    """
+
+    # Combines the key columns of both dataframes, so each value gets the same code in both.
+    both = pd.concat([df_previous[key_columns], df_current[key_columns]], ignore_index=True).fillna('')
+
+    # Combines the codes for each column. After each column, the combined codes are converted again to codes
+    # for the unique combinations, so they never get larger than the number of rows.
+    codes = np.zeros(len(both), dtype=np.int64)
+    for column in key_columns:
+        column_codes, uniques = pd.factorize(both[column])
+        codes, _ = pd.factorize(codes * len(uniques) + column_codes)
+
+    # Gets the values of the key columns for each code from the first row with that code.
+    _, first_rows = np.unique(codes, return_index=True)
+    keys = both.iloc[first_rows].reset_index(drop=True)
+
+    return codes[:len(df_previous)], codes[len(df_previous):], keys
+
+
+if __name__ == '__main__':
+
+    # Verifies the required arguments are present and the paths are valid.
+    # If there were errors, prints the errors and exits the script.
+    previous_csv, current_csv, errors_list = check_arguments(sys.argv)
+    if len(errors_list) > 0:
+        for error in errors_list:
+            print(error)
+        print("Script usage: python path/compare_reports.py previous_formats_csv current_formats_csv")
+        sys.exit(1)
+
+    # Reads only the columns used for the comparison from each report.
+    # The amounts are the number of file_ids and size for by_group reports and the number of AIPs for by_aip reports.
+    report_type, previous_date = snapshot_name(previous_csv)
+    current_date = snapshot_name(current_csv)[1]
+    values = ['File_IDs', 'Size_GB'] if report_type == "by_group" else []
+    columns = ['Group', 'Format_Identification'] + (values if values else ['AIP'])
+    previous_df = pd.read_csv(previous_csv, usecols=columns)
+    current_df = pd.read_csv(current_csv, usecols=columns)
+
+    # Saves the changes to a CSV in the same folder as the current report.
+    changes_df = format_changes(previous_df, current_df, values)
+    changes_csv = os.path.join(os.path.dirname(current_csv), f"format_changes_{previous_date}_to_{current_date}.csv")
+    changes_df.to_csv(changes_csv, index=False)
@@ -8,15 +8,21 @@ Information included:
     * The percentage of formats at each risk level for each collection
     * The percentage of formats at each risk level for each AIP
     * The formats, and their risk levels, for each collection
+    * The formats, and their risk levels, for each AIP
+    * The number of formats and AIPs with each type of NARA preservation action plan
 
 Parameters:
     current_formats_csv : the path to the "archive_formats_by_aip.csv" made by the merge_format_reports.py
     with data for the current year's analysis
     previous_formats_csv : the path to the "archive_formats_by_aip.csv" made by the merge_format_reports.py
     with data for the previous year's analysis
+    group (optional) : one or more ARCHive groups to make reports for, separated by spaces.
+    If none are provided, a report is made for every group.
 
 Returns:
-    One spreadsheet per ARCHive group in the current_formats_csv
+    One spreadsheet per ARCHive group in the current_formats_csv, or per group provided
+    department_reports_cache : a folder with the parsed CSVs, saved in the same folder as current_formats_csv,
+    so a CSV that has not changed is not read again the next time the script runs
 """
 
 import datetime
@@ -25,10 +31,51 @@ import os
 import pandas as pd
 import re
 import sys
+import time
+from archive_reports import cache_key, nara_plan_type, read_cache, save_cache, write_sheet
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from merge_format_reports import get_partition_paths
+from openpyxl import Workbook
+
+
+def aip_formats(current_df):
+    """Make a list of the formats, organized by decreasing risk, in each AIP
+
+    This has the same information as the Formats table, but for each AIP instead of each collection.
+    It is a list with one row for each format in each AIP instead of a table with a column for each format,
+    since a table would be too large for departments with many AIPs and formats.
+
+    Parameters:
+        current_df : a dataframe with the information from the archive_formats_by_aip.csv for the current year
+
+    Returns:
+        formats : a dataframe with columns Collection, AIP, NARA risk level, and Format (name and risk),
+        with one row for each format in an AIP, sorted by collection, AIP, risk (high to low), and format
+    """
+
+    # Gets the name of the NARA Risk Level column,
+    # which includes the year and so is different each time the analysis is run.
+    current_risk_column = current_df.columns.to_list()[6]
+
+    # Gets which formats are in each AIP, in order by AIP and then by format.
+    row_codes, column_codes, row_labels, column_labels = format_incidence(current_df, 'AIP')
+
+    # Makes the list by converting the codes for each combination back to the AIP, risk level, and format.
+    aips = np.array(row_labels, dtype=object)[row_codes]
+    column_risks = np.array([risk_level for risk_level, format_name in column_labels], dtype=object)
+    column_formats = np.array([format_name for risk_level, format_name in column_labels], dtype=object)
+    aip_collection = current_df.drop_duplicates('AIP').set_index('AIP')['Collection']
+    formats = pd.DataFrame({'Collection': aip_collection.reindex(aips).to_numpy(), 'AIP': aips,
+                            current_risk_column: column_risks[column_codes], 'Format': column_formats[column_codes]})
+
+    # Sorts by collection, keeping the order of the AIPs and formats within each collection.
+    formats = formats.sort_values('Collection', kind='stable', ignore_index=True)
+
+    return formats
 
 
 def check_arguments(argument_list):
-    """Check both required arguments are present and correct
+    """Check both required arguments are present and correct and get the optional groups
 
     Parameters:
         argument_list : the list from sys.argv with the script parameters
@@ -36,6 +83,7 @@ def check_arguments(argument_list):
     Returns:
         current_path : the path to archive_formats_by_aip.csv for the current year, or None
         previous_path : the path to archive_formats_by_aip.csv for the previous year, or None
+        groups : the list of groups to make reports for, or an empty list to make reports for every group
         errors : the list of errors, if any, or an empty list
     """
 
@@ -68,15 +116,19 @@ def check_arguments(argument_list):
     else:
         errors.append("Required argument previous_formats_csv is missing")
 
+    # Any other arguments are the groups to make reports for.
+    groups = argument_list[3:]
+
     # Returns the results. If both arguments are correct, errors is an empty list.
-    return current_path, previous_path, errors
+    return current_path, previous_path, groups, errors
 
 
-def csv_to_dataframe(csv_file):
+def csv_to_dataframe(csv_file, groups=None):
     """Read a CSV into a dataframe, reformat the data, and add additional data
 
     Parameters:
-        csv_file : the path to one of the archive_by_formats_by_aip.csv files
+        csv_file : the path to one of the archive_formats_by_aip.csv files
+        groups : optional, a list of the groups to read from the CSV, or None to read every group
 
     Returns:
         csv_df : a dataframe with the information from the CSV, reformatted and with additional data
@@ -85,11 +137,11 @@ def csv_to_dataframe(csv_file):
     # Reads the CSV into a dataframe, ignoring encoding errors from special characters if necessary.
     # Reads everything as a string to make actions taken on the dataframes predictable.
     try:
-        csv_df = pd.read_csv(csv_file, dtype=str)
+        csv_df = read_groups(csv_file, groups)
     except UnicodeDecodeError:
         print("UnicodeDecodeError when trying to read:", csv_file)
         print("The CSV was read by ignoring encoding errors, so those characters are omitted from the dataframe.")
-        csv_df = pd.read_csv(csv_file, dtype=str, encoding_errors="ignore")
+        csv_df = read_groups(csv_file, groups, encoding_errors="ignore")
 
     # Makes a new column (PRONOM URL) by combining Registry Name and Registry Key, if Registry Name is PRONOM.
     # If the registry is not PRONOM, the column will be given the value "NO VALUE" instead.
@@ -127,9 +179,138 @@ def csv_to_dataframe(csv_file):
     return csv_df
 
 
+def department_report(dept, dept_df, output_folder, date):
+    """Make the Excel spreadsheet with the risk data and data summaries for one department
+
+    Parameters:
+        dept : the name of the department (ARCHive group)
+        dept_df : a dataframe with the information for the department, with the risk change from risk_change()
+        output_folder : the path to the folder where the spreadsheet is saved
+        date : the year and month (YYYYMM) to include in the spreadsheet name
+
+    Returns:
+        seconds : the number of seconds it took to make the spreadsheet
+    """
+
+    start_time = time.perf_counter()
+
+    # Calculates the percentage of formats at each risk level for the department, each collection, and each AIP.
+    risk_tables = risk_level_tables(dept_df, ['AIP', 'Collection', 'Group'])
+
+    # Calculates which formats are in each collection and AIP, sorted first by risk level and then by format.
+    # The AIP formats are a list instead of a table, since there can be too many AIPs and formats for a table.
+    formats = formats_pivot(dept_df)
+    aip_format_list = aip_formats(dept_df)
+
+    # Calculates the number of formats and AIPs with each type of NARA preservation action plan.
+    plan_types = plan_type_table(dept_df)
+
+    # Saves the results to the department risk report in the output folder.
+    # The workbook is write-only, so each sheet is saved as it is written instead of kept in memory.
+    dept_report_path = os.path.join(output_folder, f"{dept}_risk_report_{date}.xlsx")
+    dept_report = Workbook(write_only=True)
+    write_sheet(dept_report, dept_df.sort_values(['Collection', 'AIP']), "AIP_Risk_Data", index=False)
+    write_sheet(dept_report, risk_tables['Group'], "Department_Risk_Levels")
+    write_sheet(dept_report, risk_tables['Collection'], "Collection_Risk_Levels")
+    write_sheet(dept_report, risk_tables['AIP'], "AIP_Risk_Levels")
+    write_sheet(dept_report, formats, "Formats")
+    write_sheet(dept_report, aip_format_list, "AIP_Formats", index=False)
+    write_sheet(dept_report, plan_types, "NARA_Plan_Types")
+    dept_report.save(dept_report_path)
+
+    seconds = time.perf_counter() - start_time
+    return seconds
+
+
+def department_slices(current_df):
+    """Split the current analysis dataframe into one dataframe per department (ARCHive group)
+
+    The dataframe is sorted by group once and each department is a slice of the sorted rows,
+    instead of comparing every row to each department name, which is slow when there are many departments.
+
+    Parameters:
+        current_df : a dataframe with the information from the archive_formats_by_aip.csv for the current year
+
+    Returns:
+        slices : a list of tuples with the department name and a dataframe with the rows for that department,
+        in order by department name
+    """
+
+    # Sorts the rows by department. A stable sort is used so the rows for each department stay in the same order.
+    sorted_df = current_df.sort_values('Group', kind='stable')
+    groups = sorted_df['Group'].to_numpy()
+    if len(groups) == 0:
+        return []
+
+    # Finds the row where each department starts and ends, which is where the group is different from the row before.
+    starts = np.flatnonzero(np.concatenate(([True], groups[1:] != groups[:-1])))
+    ends = np.append(starts[1:], len(groups))
+
+    slices = [(groups[start], sorted_df.iloc[start:end]) for start, end in zip(starts, ends)]
+    return slices
+
+
+def format_incidence(current_df, index_column):
+    """Find which formats are in each collection or AIP, as a list of the combinations that are present
+
+    The index column and formats are converted to numbers (codes), and each combination of codes that is present
+    is listed once. This is a sparse version of a table with rows by index_column and columns by format,
+    which only includes the True values, since most formats are not in most collections or AIPs.
+
+    Parameters:
+        current_df : a dataframe with the information from the archive_formats_by_aip.csv for the current year
+        index_column : the name of the column (Collection or AIP) to find the formats for
+
+    Returns:
+        row_codes : a numpy array with the code of the index_column for each combination, from 0 to rows - 1
+        column_codes : a numpy array with the code of the format for each combination, from 0 to columns - 1
+        row_labels : a list of the index_column values in alphabetical order, which is the order of their codes
+        column_labels : a list of tuples with the NARA risk level and format (name and risk),
+        in order by risk (high to low) and then by format name, which is the order of their codes
+    """
+
+    # Gets the name of the NARA Risk Level column,
+    # which includes the year and so is different each time the analysis is run.
+    current_risk_column = current_df.columns.to_list()[6]
+
+    # Removes rows without a format name or risk level, which cannot be named as a format,
+    # and rows without a value in the index column, which are not in a collection or AIP.
+    df = current_df[current_df['Format_Name'].notna() & current_df[current_risk_column].notna()
+                    & current_df[index_column].notna()]
+
+    # Makes the format, which is the combined format name and NARA risk level, for naming format columns.
+    # It includes the risk, even though that is also a separate row in the table, for readability.
+    formats = df['Format_Name'] + " (" + df[current_risk_column].astype(str) + ")"
+
+    # Gets the codes for the index column and the formats, which are numbered in alphabetical order.
+    row_codes, row_labels = pd.factorize(df[index_column], sort=True)
+    format_codes, format_labels = pd.factorize(formats, sort=True)
+
+    # Orders the formats first by risk (high to low) and then by format name, and changes the codes to that order.
+    # Each format has one risk level, since the risk level is part of the format.
+    format_risk = np.zeros(len(format_labels), dtype=np.int64)
+    format_risk[format_codes] = df[current_risk_column].cat.codes.to_numpy()
+    format_order = np.lexsort((np.arange(len(format_labels)), -format_risk))
+    format_rank = np.empty(len(format_labels), dtype=np.int64)
+    format_rank[format_order] = np.arange(len(format_labels))
+    risk_categories = df[current_risk_column].cat.categories
+    column_labels = [(risk_categories[format_risk[code]], format_labels[code]) for code in format_order]
+
+    # Gets each combination of codes once, since a format may be in a collection or AIP more than once.
+    combinations = np.unique(row_codes * len(format_labels) + format_rank[format_codes])
+    row_codes = combinations // max(len(format_labels), 1)
+    column_codes = combinations % max(len(format_labels), 1)
+
+    return row_codes, column_codes, row_labels.tolist(), column_labels
+
+
 def formats_pivot(current_df):
     """Make a table with the formats, organized by decreasing risk, in each collection
 
+    The table is made from the formats in each collection from format_incidence(), and the columns are sparse,
+    so only the True values are stored. The True and False values are made one chunk of rows at a time
+    when the table is saved to the spreadsheet.
+
     Parameters:
         current_df : a dataframe with the information from the archive_formats_by_aip.csv for the current year
 
@@ -138,33 +319,159 @@ def formats_pivot(current_df):
         with Boolean to indicate if the format is in that collection or not
     """
 
-    # Gets the name fo the NARA Risk Level column,
+    # Gets the name of the NARA Risk Level column,
     # which includes the year and so is different each time the analysis is run.
     current_risk_column = current_df.columns.to_list()[6]
 
-    # Adds a column with combined format name and NARA risk level.
-    # Format is a temporary, for naming format columns for this pivot table.
-    # It includes the risk, even though that is also a separate row for this pivot table, for readability.
-    current_df['Format'] = current_df['Format_Name'] + " (" + current_df[current_risk_column].astype(str) + ")"
+    # Gets which formats are in each collection, in order by format.
+    row_codes, column_codes, row_labels, column_labels = format_incidence(current_df, 'Collection')
+
+    # Makes a sparse True/False column for each format, with True for the collections that have the format.
+    # The combinations are in order by collection and then format, so they are sorted by format first
+    # to find the collections for each format without searching every combination.
+    order = np.argsort(column_codes, kind='stable')
+    bounds = np.searchsorted(column_codes[order], np.arange(len(column_labels) + 1))
+    columns = {}
+    for column_code, (risk_level, format_name) in enumerate(column_labels):
+        in_collection = np.zeros(len(row_labels), dtype=bool)
+        in_collection[row_codes[order[bounds[column_code]:bounds[column_code + 1]]]] = True
+        columns[('Format_Name', risk_level, format_name)] = pd.arrays.SparseArray(in_collection, fill_value=False)
+
+    # Makes the table with rows by collection and columns first by NARA risk level and then by Format.
+    # If there are no formats, the column levels are still made so the table has the same headers.
+    pivot = pd.DataFrame(columns, index=pd.Index(row_labels, name='Collection'))
+    column_levels = [list(level) for level in zip(*columns)] if columns else [[], [], []]
+    pivot.columns = pd.MultiIndex.from_arrays(column_levels, names=[None, current_risk_column, 'Format'])
 
-    # Makes a pivot table with rows by collection and columns first by NARA risk level and then by Format.
-    # Initially, the table has the number of formats in each AIP, but this is converted to True/False
-    # since formats will always appear 0, 1, or 2 (legacy duplication from PUID and no PUID) in an AIP.
-    pivot = pd.pivot_table(current_df, index=['Collection'], columns=[current_risk_column, 'Format'],
-                           values=['Format_Name'], aggfunc=len, fill_value=0).astype(bool)
+    return pivot
 
-    # Orders the format columns first by risk (high to low) and then by format name.
-    pivot.sort_values([current_risk_column, 'Format'], ascending=[False, True], axis=1, inplace=True)
 
-    # Removes the temporary Format column.
-    current_df.drop(['Format'], axis=1, inplace=True)
+def plan_type_table(dept_df):
+    """Calculate the number of formats and AIPs with each type of NARA preservation action plan
 
-    return pivot
+    The plan type is from nara_plan_type() in archive_reports.py, which classifies each unique plan once.
+    Formats are deduplicated the same way as for the risk levels, so each format is counted once.
+
+    Parameters:
+        dept_df : a dataframe with the information for one ARCHive group, with the risk change from risk_change()
+
+    Returns:
+        plan_types : a dataframe with the plan type as the index and columns with the number of formats,
+        percentage of formats, and number of AIPs, in the order of the plan types
+    """
+
+    # Gets the name of the NARA Proposed Preservation Plan column,
+    # which includes the year and so is different each time the analysis is run.
+    plan_column = dept_df.columns.to_list()[7]
+
+    # Adds the plan type for each row.
+    df_plan = dept_df[['AIP', 'Format_Name', 'Format_Version', 'PRONOM_URL']].copy()
+    df_plan['NARA_Plan_Type'] = nara_plan_type(dept_df[plan_column])
+
+    # Removes duplicate formats (based on name and version), keeping the one with a PUID if there is one,
+    # since the NARA match is most likely to be accurate (see risk_level_tables()).
+    df_formats = df_plan.sort_values('PRONOM_URL', kind='stable')
+    df_formats = df_formats.drop_duplicates(subset=['Format_Name', 'Format_Version'], keep='last')
+
+    # Counts the formats and the AIPs with at least one format for each plan type.
+    # The percentage of formats is rounded to 2 decimal places.
+    formats = df_formats.groupby('NARA_Plan_Type').size()
+    aips = df_plan.groupby('NARA_Plan_Type')['AIP'].nunique()
+    plan_types = pd.DataFrame({'Formats': formats, 'AIPs': aips}).fillna(0).astype(int)
+    plan_types.insert(1, 'Formats_%', round(plan_types['Formats'] / plan_types['Formats'].sum() * 100, 2))
+
+    # Puts the plan types in order, from the least to the most action needed, followed by Other and No plan.
+    plan_order = ["Retain", "Retain but act", "Transform", "Depends on version", "Further research required",
+                  "Other", "No plan"]
+    plan_types = plan_types.reindex([plan_type for plan_type in plan_order if plan_type in plan_types.index])
+    plan_types.index.name = 'NARA_Plan_Type'
+
+    return plan_types
+
+
+def read_formats(csv_file, cache_folder=None, groups=None):
+    """Read a CSV into a dataframe with csv_to_dataframe(), or from a cache of that dataframe if the CSV has not changed
+
+    The cached dataframe already has the changes made by csv_to_dataframe(), including PRONOM_URL and the
+    ordered categorical risk level, so a CSV that has not changed since the last time is not read or changed again.
+    The cache always has every group. If there is no cache and only some groups are read, the cache is not made,
+    since it would be missing the other groups. If only some groups are read and merge_format_reports.py saved the
+    CSV as one CSV per group (partitions), the cache is not used, since the key would read all of the CSV
+    and reading only the CSVs for the groups costs less.
+
+    Parameters:
+        csv_file : the path to one of the archive_formats_by_aip.csv files
+        cache_folder : optional, the path to a folder for the cache of dataframes, or None to not use a cache
+        groups : optional, a list of the groups to read, or None to read every group
+
+    Returns:
+        csv_df : a dataframe with the information from the CSV, reformatted and with additional data
+    """
+
+    if cache_folder is None or (groups and get_partition_paths(csv_file) is not None):
+        return csv_to_dataframe(csv_file, groups)
+
+    # The cache is named for the CSV, which includes the date of the analysis, and has a key for the contents
+    # of the CSV and this script, so it is only used if neither has changed.
+    cache_path = os.path.join(cache_folder, os.path.splitext(os.path.basename(csv_file))[0] + ".pickle")
+    key = cache_key([os.path.abspath(__file__), csv_file])
+    csv_df = read_cache(cache_path, key)
+    if csv_df is None:
+        if groups:
+            return csv_to_dataframe(csv_file, groups)
+        csv_df = csv_to_dataframe(csv_file)
+        save_cache(cache_path, key, csv_df)
+
+    # Keeps only the rows for the groups, if any, from the cached dataframe.
+    if groups:
+        csv_df = csv_df[csv_df['Group'].isin(groups)].reset_index(drop=True)
+
+    return csv_df
+
+
+def read_groups(csv_file, groups=None, encoding_errors="strict", chunk_size=100000):
+    """Read a CSV into a dataframe with every column as a string, keeping only the rows for some groups
+
+    If merge_format_reports.py saved the CSV as one CSV per group (partitions), only the CSVs for the groups
+    are read, at the same time. Otherwise, if there are groups, the CSV is read in chunks and the rows for other
+    groups are removed from each chunk before the next chunk is read,
+    so the rows for other groups are never all in memory at once.
+
+    Parameters:
+        csv_file : the path to one of the archive_formats_by_aip.csv files
+        groups : optional, a list of the groups to keep, or None to keep every group
+        encoding_errors : optional, how to handle encoding errors (see pandas read_csv), which is strict by default
+        chunk_size : optional, the number of rows to read at a time if there are groups, which is 100,000 by default
+
+    Returns:
+        csv_df : a dataframe with the rows from the CSV for the groups
+    """
+
+    # Reads the partitions for the groups, if there are partitions. If none of the groups have a partition,
+    # reads just the header of the CSV, so the dataframe has the same columns.
+    partition_paths = get_partition_paths(csv_file, groups)
+    if partition_paths is not None:
+        with ThreadPoolExecutor() as executor:
+            partitions = list(executor.map(lambda path: pd.read_csv(path, dtype=str, encoding_errors=encoding_errors),
+                                           partition_paths))
+        if not partitions:
+            return pd.read_csv(csv_file, dtype=str, encoding_errors=encoding_errors, nrows=0)
+        return pd.concat(partitions, ignore_index=True)
+
+    if not groups:
+        return pd.read_csv(csv_file, dtype=str, encoding_errors=encoding_errors)
+
+    chunks = pd.read_csv(csv_file, dtype=str, encoding_errors=encoding_errors, chunksize=chunk_size)
+    csv_df = pd.concat([chunk[chunk['Group'].isin(groups)] for chunk in chunks], ignore_index=True)
+    return csv_df
 
 
 def risk_change(current_df, previous_df):
     """Update the current analysis dataframe with risk data from the previous analysis and the change between the two
 
+    The type of change is looked up from a table with every combination of previous and current risk level,
+    instead of comparing the risk levels of every row.
+
     Parameters:
         current_df : a dataframe with the information from the archive_formats_by_aip.csv for the current year
         previous_df : a dataframe with the information from the archive_formats_by_aip.csv for the previous year
@@ -180,6 +487,8 @@ def risk_change(current_df, previous_df):
     current_risk = current_df.columns.to_list()[7]
 
     # Adds previous risk data to the current, matching on the AIP and Format_Identification columns.
+    # pd.merge already converts the key columns of both dataframes to shared integer codes before joining,
+    # so converting them first with compare_reports.key_codes() only adds time and memory.
     previous_columns = ['AIP', 'Format_Identification', previous_risk]
     current_df = pd.merge(current_df, previous_df[previous_columns], how="left")
 
@@ -187,67 +496,114 @@ def risk_change(current_df, previous_df):
     current_df.drop(['Format_Identification'], axis=1, inplace=True)
 
     # Adds a column to current with the type of change from previous to current.
-    conditions = [(current_df[previous_risk] != "No Match") & (current_df[previous_risk] > current_df[current_risk]),
-                  (current_df[previous_risk] < current_df[current_risk]) & (current_df[current_risk] != "No Match"),
-                  current_df[previous_risk].isnull(),
-                  (current_df[previous_risk] == "No Match") & (current_df[current_risk] != "No Match"),
-                  (current_df[previous_risk] != "No Match") & (current_df[current_risk] == "No Match"),
-                  current_df[previous_risk] == current_df[current_risk]]
-    change_type = ["Decrease", "Increase", "New Format", "New Match", "Unmatched", "Unchanged"]
-    current_df['Risk_Level_Change'] = np.select(conditions, change_type)
+    # Risk levels are converted to codes, the position of the risk level in the categories or -1 if it is blank,
+    # and the table has a row for each previous risk code and a column for each current risk code, both starting at -1.
+    risk_categories = current_df[current_risk].cat.categories
+    previous_codes = pd.Categorical(current_df[previous_risk], risk_categories, ordered=True).codes
+    current_codes = current_df[current_risk].cat.codes.to_numpy()
+    change_table = risk_change_table(risk_categories)
+    current_df['Risk_Level_Change'] = change_table[previous_codes + 1, current_codes + 1]
 
     return current_df
 
 
-def risk_levels(dept_df, index_column):
-    """Calculate the percentage of formats at each risk level
+def risk_change_table(risk_categories):
+    """Make a table with the type of risk change for every combination of previous and current risk level
+
+    Parameters:
+        risk_categories : the list of NARA risk levels, in order from lowest to highest risk
+
+    Returns:
+        change_table : a numpy array with a row for each previous risk level and a column for each current
+        risk level, both starting with blank, with the type of change for that combination
+    """
+
+    # Makes every combination of previous and current risk level, including blank, which has the code -1.
+    codes = np.arange(-1, len(risk_categories))
+    previous = pd.Series(pd.Categorical.from_codes(np.repeat(codes, len(codes)), risk_categories, ordered=True))
+    current = pd.Series(pd.Categorical.from_codes(np.tile(codes, len(codes)), risk_categories, ordered=True))
+
+    # Calculates the type of change from previous to current for each combination.
+    conditions = [(previous != "No Match") & (previous > current),
+                  (previous < current) & (current != "No Match"),
+                  previous.isnull(),
+                  (previous == "No Match") & (current != "No Match"),
+                  (previous != "No Match") & (current == "No Match"),
+                  previous == current]
+    change_type = ["Decrease", "Increase", "New Format", "New Match", "Unmatched", "Unchanged"]
+    change_table = np.select(conditions, change_type).reshape(len(codes), len(codes))
+
+    return change_table
+
+
+def risk_level_tables(dept_df, index_columns):
+    """Calculate the percentage of formats at each risk level for several units of analysis at once
+
+    The dataframe is sorted once and deduplicated for the smallest unit first (for example AIP),
+    and each larger unit (for example Collection and then Group) is deduplicated from the result of the one before,
+    since a format that is once per AIP is also once per collection after removing the duplicates across AIPs.
+    The formats at each risk level are then counted for every unit with one groupby.
 
     Parameters:
         dept_df : a dataframe with the information for one ARCHive group from the archive_formats_by_aip.csv
-        index_column : the name of the column (Group, Collection, or AIP) to subtotal the formats on
+        index_columns : a list of the columns (Group, Collection, and/or AIP) to subtotal the formats on,
+        in order from the smallest to the largest unit of analysis
 
     Returns:
-        risk : a dataframe with the percentage of formats at each risk level, ordered by highest to lowest risk
+        tables : a dictionary with the index column as the key and a dataframe with the percentage of formats
+        at each risk level as the value, ordered by highest to lowest risk
     """
 
-    # Removes duplicate formats (based on name and version) from the dataframe
-    # within the unit of analysis (index_column).
+    # Gets the name of the NARA Risk Level column,
+    # which includes the year and so is different each time the analysis is run.
+    current_risk_column = dept_df.columns.to_list()[6]
+
+    # Removes duplicate formats (based on name and version) from the dataframe within each unit of analysis.
     # For example, with collections, a format should be counted once per collection.
     # Even the AIP analysis is deduplicated because of formats listed with and without a PUID.
     # If a format with and without a PUID present, the one with the PUID is kept during deduplication
     # since the NARA match is most likely to be accurate. It is the last one after sorting,
     # because the upper case "NO VALUE" for no PRONOM URL is sorted before the lowercase PRONOM URL.
-    subset_list = [index_column] + ['Format_Name', 'Format_Version']
-    df_dedup = dept_df.sort_values('PRONOM_URL').drop_duplicates(subset=subset_list, keep='last')
-
-    # Calculates the number of formats at each risk level.
-    # Including margins=True adds totals for each column and row.
-    current_risk_column = df_dedup.columns.to_list()[6]
-    risk = pd.pivot_table(df_dedup, index=index_column, columns=current_risk_column, values='Format_Name',
-                          margins=True, aggfunc=len, fill_value=0)
-
-    # Renames the column of each row's totals from default All to Formats, to be more intuitive.
-    # Removes the row of each column's totals, which also has the name All,
-    # since it is inflated from formats being in multiple AIPs.
-    risk.rename(columns={'All': 'Formats'}, inplace=True)
-    risk.drop(['All'], axis='index', inplace=True)
-
-    # Adds in columns for any of the four NARA risk levels that are not present in the dataframe,
-    # with a default value of 0 for every row.
-    for risk_level in ["No Match", "High Risk", "Moderate Risk", "Low Risk"]:
-        if risk_level not in risk:
-            risk[risk_level] = 0
+    # The sort is stable, so the rows stay in the same order for each deduplication.
+    df_dedup = dept_df.sort_values('PRONOM_URL', kind='stable')
+    units = []
+    for index_column in index_columns:
+        df_dedup = df_dedup.drop_duplicates(subset=[index_column, 'Format_Name', 'Format_Version'], keep='last')
+        units.append(pd.DataFrame({'Unit': index_column, 'Name': df_dedup[index_column],
+                                   'Risk': df_dedup[current_risk_column]}))
+
+    # Calculates the number of formats at each risk level for every unit of analysis,
+    # with a column for each of the four NARA risk levels even if it is not present in the dataframe.
+    counts = pd.concat(units, ignore_index=True).groupby(['Unit', 'Name', 'Risk'], observed=True).size()
+    risk_order = ["No Match", "High Risk", "Moderate Risk", "Low Risk"]
+    counts = counts.unstack('Risk', fill_value=0).reindex(columns=risk_order, fill_value=0)
 
     # Calculates the percentage of formats at each risk level for each row, rounded to 2 decimal places.
     # Columns are in order from high-low risk.
-    risk['No_Match_%'] = round(risk['No Match'] / risk['Formats'] * 100, 2)
-    risk['High_Risk_%'] = round(risk['High Risk'] / risk['Formats'] * 100, 2)
-    risk['Moderate_Risk_%'] = round(risk['Moderate Risk'] / risk['Formats'] * 100, 2)
-    risk['Low_Risk_%'] = round(risk['Low Risk'] / risk['Formats'] * 100, 2)
+    risk = pd.DataFrame({'Formats': counts.sum(axis=1)})
+    for risk_level in risk_order:
+        risk[f"{risk_level.replace(' ', '_')}_%"] = round(counts[risk_level] / risk['Formats'] * 100, 2)
+
+    # Splits the results into one dataframe for each unit of analysis.
+    tables = {}
+    for index_column in index_columns:
+        tables[index_column] = risk.xs(index_column, level='Unit').rename_axis(index_column)
+
+    return tables
+
+
+def risk_levels(dept_df, index_column):
+    """Calculate the percentage of formats at each risk level
+
+    Parameters:
+        dept_df : a dataframe with the information for one ARCHive group from the archive_formats_by_aip.csv
+        index_column : the name of the column (Group, Collection, or AIP) to subtotal the formats on
 
-    # Removes the columns with format counts, now that the percentages are calculated.
-    risk.drop(['No Match', 'High Risk', 'Moderate Risk', 'Low Risk'], axis=1, inplace=True)
+    Returns:
+        risk : a dataframe with the percentage of formats at each risk level, ordered by highest to lowest risk
+    """
 
+    risk = risk_level_tables(dept_df, [index_column])[index_column]
     return risk
 
 
@@ -255,16 +611,25 @@ if __name__ == '__main__':
 
     # Verifies that both required arguments are present, the paths are valid, and the filenames are correct.
     # If there are any errors, exits the script.
-    current_formats_csv, previous_formats_csv, errors_list = check_arguments(sys.argv)
+    current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(sys.argv)
     if len(errors_list) > 0:
         for error in errors_list:
             print(error)
-        print("Script usage: python path/department_reports.py current_formats_csv previous_formats_csv")
+        print("Script usage: python path/department_reports.py current_formats_csv previous_formats_csv [group ...]")
         sys.exit(1)
 
     # Reads each CSV into a dataframe, with some data cleanup.
-    current_format_df = csv_to_dataframe(current_formats_csv)
-    previous_format_df = csv_to_dataframe(previous_formats_csv)
+    # The dataframes are cached in a folder with the current CSV, so a CSV is only read again if it has changed,
+    # for example the previous year's CSV is read once when the reports are made more than once.
+    # If groups were provided, only the rows for those groups are kept.
+    cache_folder = os.path.join(os.path.dirname(current_formats_csv), "department_reports_cache")
+    current_format_df = read_formats(current_formats_csv, cache_folder, groups_list)
+    previous_format_df = read_formats(previous_formats_csv, cache_folder, groups_list)
+
+    # Prints any groups provided that are not in the current analysis, since there is no report for them.
+    for group in groups_list:
+        if not (current_format_df['Group'] == group).any():
+            print(f"No report for {group}: it is not in current_formats_csv")
 
     # Adds the previous risk and the change in risk since the previous analysis to the current analysis data.
     current_format_df = risk_change(current_format_df, previous_format_df)
@@ -274,25 +639,14 @@ if __name__ == '__main__':
     date = datetime.date.today().strftime("%Y%m")
 
     # For each department, makes an Excel spreadsheet with the risk data and data summaries.
-    for dept in current_format_df['Group'].unique().tolist():
-
-        # Makes a dataframe with the data for the department.
-        df = current_format_df[current_format_df['Group'] == dept].copy()
-
-        # Calculates the percentage of formats at each risk level for the department, each collection, and each AIP.
-        dept_risk = risk_levels(df, 'Group')
-        collection_risk = risk_levels(df, 'Collection')
-        aip_risk = risk_levels(df, 'AIP')
-
-        # Calculates which formats are in each collection and AIP, sorted first by risk level and then by format.
-        formats = formats_pivot(df)
-
-        # Saves the results to the department risk report,
-        # in the same folder as the CSV with ARCHive format data (current_formats_csv).
-        dept_report_path = os.path.join(output_folder, f"{dept}_risk_report_{date}.xlsx")
-        with pd.ExcelWriter(dept_report_path) as dept_report:
-            df.sort_values(['Collection', 'AIP']).to_excel(dept_report, sheet_name="AIP_Risk_Data", index=False)
-            dept_risk.to_excel(dept_report, sheet_name="Department_Risk_Levels")
-            collection_risk.to_excel(dept_report, sheet_name="Collection_Risk_Levels")
-            aip_risk.to_excel(dept_report, sheet_name="AIP_Risk_Levels")
-            formats.to_excel(dept_report, sheet_name="Formats")
+    # The spreadsheets are made at the same time in separate processes, since each department is independent.
+    # The departments with the most rows are started first, so a large department is not started last
+    # and the total time is not much longer than the time for the largest department.
+    # The data is split by department once, instead of searching all the data for each department.
+    dept_slices = sorted(department_slices(current_format_df), key=lambda dept_slice: len(dept_slice[1]), reverse=True)
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(department_report, dept, df, output_folder, date) for dept, df in dept_slices]
+
+        # Prints the time for each department. Calling result() also raises any error from making that spreadsheet.
+        for (dept, df), future in zip(dept_slices, futures):
+            print(f"Made {dept} risk report ({len(df)} rows) in {future.result():.2f} seconds")
@@ -0,0 +1,304 @@
+"""Summarize how the formats in ARCHive have changed across several format analyses
+
+Each merged format report (archive_formats_by_group_YYYY-MM.csv or archive_formats_by_aip_YYYY-MM.csv)
+is added once to a snapshot store, which is a folder with one partition (folder) for each report,
+named with the report type and date. Each column is saved as a separate file in the partition,
+with text columns stored as categories, so a summary only reads the columns it uses from each snapshot
+instead of reading every CSV again. A report is only added again if the CSV has changed.
+
+Parameters:
+    store_folder : the path to the folder for the snapshot store, which is made if it does not exist
+    formats_csv : optional, the path to one or more archive_formats_by_group.csv or archive_formats_by_aip.csv
+    made by the merge_format_reports.py script, separated by spaces, to add to the snapshot store
+
+Returns:
+    ARCHive-Formats-Trends.xlsx : saved in the store_folder, the number of file_ids for each format type,
+    format standardized name, and NARA risk level, and the size for each NARA risk level,
+    in every archive_formats_by_group snapshot in the store
+    ARCHive-Risk-History.csv : saved in the store_folder if there are any archive_formats_by_aip snapshots,
+    the NARA risk level of each format identification in each AIP in every archive_formats_by_aip snapshot
+"""
+
+import os
+import pandas as pd
+import pickle
+import re
+import shutil
+import sys
+from archive_reports import file_hash, save_workbook
+
+
+def check_arguments(argument_list):
+    """Check the required argument store_folder is present and any optional formats_csv are correct
+
+    Parameters:
+        argument_list : the list from sys.argv with the script parameters
+
+    Returns:
+        store_path : the path to the snapshot store folder, or None
+        csv_paths : a list of the paths to the format reports to add to the store, or an empty list
+        errors : the list of errors, if any, or an empty list
+    """
+
+    # Makes variables with default values to store the results of the function.
+    store_path = None
+    csv_paths = []
+    errors = []
+
+    # Verifies that the required argument (store_folder) is present.
+    # It does not need to exist yet, since it is made the first time a report is added.
+    if len(argument_list) > 1:
+        store_path = argument_list[1]
+    else:
+        errors.append("Required argument store_folder is missing")
+
+    # Verifies that any optional arguments (formats_csv) exist and have the expected filename.
+    for csv_path in argument_list[2:]:
+        if not os.path.exists(csv_path):
+            errors.append(f"formats_csv '{csv_path}' does not exist")
+        elif snapshot_name(csv_path) is None:
+            errors.append(f"'{csv_path}' is not the correct type (should be archive_formats_by_group_YYYY-MM.csv "
+                          f"or archive_formats_by_aip_YYYY-MM.csv)")
+        else:
+            csv_paths.append(csv_path)
+
+    return store_path, csv_paths, errors
+
+
+def ingest_snapshot(csv_path, store_folder):
+    """Add a merged format report to the snapshot store, with each column saved as a separate file
+
+    If the report was already added and has not changed, it is not added again.
+    The partition is made in a temporary folder and then renamed, so the store never has a partial snapshot.
+
+    Parameters:
+        csv_path : the path to an archive_formats_by_group.csv or archive_formats_by_aip.csv
+        store_folder : the path to the folder for the snapshot store
+
+    Returns:
+        added : True if the report was added to the store, or False if it was already in the store
+    """
+
+    # Gets the name of the partition for this report, which is the report type and date.
+    report_type, snapshot_date = snapshot_name(csv_path)
+    partition = os.path.join(store_folder, report_type, snapshot_date)
+
+    # Tests if the same report is already in the store.
+    source_hash = file_hash([csv_path])
+    source_path = os.path.join(partition, "_source.txt")
+    if os.path.exists(source_path):
+        with open(source_path) as source_open:
+            if source_open.read() == source_hash:
+                return False
+
+    # Reads the report. Everything is read as text, so format versions are not changed to numbers,
+    # except for the columns with the number of files and size.
+    df = pd.read_csv(csv_path, dtype=str)
+    for column in ('File_IDs', 'Size_GB'):
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column])
+
+    # Saves each column to a separate file in a temporary folder. Text columns are saved as categories,
+    # which store each unique value once, since most columns repeat a small number of values.
+    temp_partition = partition + "_temp"
+    if os.path.exists(temp_partition):
+        shutil.rmtree(temp_partition)
+    os.makedirs(temp_partition)
+    for column in df.columns:
+        values = df[column]
+        if values.dtype == object:
+            values = values.astype('category')
+        with open(os.path.join(temp_partition, f"{column}.pickle"), 'wb') as column_open:
+            pickle.dump(values, column_open)
+    with open(os.path.join(temp_partition, "_source.txt"), 'w') as source_open:
+        source_open.write(source_hash)
+
+    # Replaces the earlier version of this snapshot, if any, with the new partition.
+    if os.path.exists(partition):
+        shutil.rmtree(partition)
+    os.rename(temp_partition, partition)
+
+    return True
+
+
+def read_snapshots(store_folder, report_type, columns):
+    """Read the specified columns from every snapshot of one report type in the snapshot store
+
+    Only the files for the requested columns are read, so the other columns do not use time or memory.
+
+    Parameters:
+        store_folder : the path to the folder for the snapshot store
+        report_type : the type of report, by_group or by_aip
+        columns : a list of the columns to read
+
+    Returns:
+        df : a dataframe with a Snapshot column (the date of the report) and the requested columns,
+        with the rows of every snapshot in order by date
+    """
+
+    # Gets the partitions for the report type, in order by date. Temporary partitions are skipped.
+    type_folder = os.path.join(store_folder, report_type)
+    snapshot_dates = []
+    if os.path.exists(type_folder):
+        snapshot_dates = sorted([name for name in os.listdir(type_folder) if not name.endswith("_temp")])
+
+    # Reads the requested columns from each partition. Text columns are changed back from categories,
+    # since each snapshot has different categories, which cannot be combined as categories.
+    # A column that is not in a snapshot, for example if a column is added to the reports later, is blank.
+    snapshots = []
+    for snapshot_date in snapshot_dates:
+        snapshot = {}
+        for column in columns:
+            column_path = os.path.join(type_folder, snapshot_date, f"{column}.pickle")
+            if os.path.exists(column_path):
+                with open(column_path, 'rb') as column_open:
+                    values = pickle.load(column_open)
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.astype(object)
+                snapshot[column] = values
+        snapshot_df = pd.DataFrame(snapshot).reindex(columns=columns)
+        snapshot_df.insert(0, 'Snapshot', snapshot_date)
+        snapshots.append(snapshot_df)
+
+    # Combines the snapshots into one dataframe.
+    if snapshots:
+        df = pd.concat(snapshots, ignore_index=True)
+    else:
+        df = pd.DataFrame(columns=['Snapshot'] + columns)
+
+    return df
+
+
+def risk_history(store_folder):
+    """Make a table of the NARA risk level of each format in each AIP in every by_aip snapshot in the store
+
+    Every snapshot is read at once and the snapshots are aligned with one reshape, with a row for each
+    AIP and format identification and a column for each snapshot, instead of comparing each pair of snapshots.
+
+    Parameters:
+        store_folder : the path to the folder for the snapshot store
+
+    Returns:
+        history : a dataframe with columns Group, Collection, AIP, Format_Identification, and one for each snapshot date
+        with the NARA risk level in that snapshot, or blank if the AIP did not have that format identification
+    """
+
+    # Reads only the columns for the AIP, format identification, and risk level from each snapshot.
+    key_columns = ['Group', 'Collection', 'AIP', 'Format_Identification']
+    df = read_snapshots(store_folder, 'by_aip', key_columns + ['NARA_Risk_Level'])
+
+    # A format identification can be in an AIP more than once in the same snapshot if it matched more than one
+    # NARA format. The highest risk level is kept, which is the last one after sorting by risk.
+    # A blank risk level is sorted first, so it is only kept if there is no risk level for that format.
+    risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+    df['NARA_Risk_Level'] = pd.Categorical(df['NARA_Risk_Level'], risk_order, ordered=True)
+    df = df.sort_values('NARA_Risk_Level', kind='stable', na_position='first')
+    df = df.drop_duplicates(key_columns + ['Snapshot'], keep='last')
+
+    # Makes a table with a row for each AIP and format identification and a column for each snapshot.
+    history = df.set_index(key_columns + ['Snapshot'])['NARA_Risk_Level'].unstack('Snapshot')
+    history.columns.name = None
+    history = history.reset_index()
+
+    return history
+
+
+def snapshot_name(csv_path):
+    """Get the report type and date from the file name of a merged format report
+
+    Parameters:
+        csv_path : the path to a merged format report, archive_formats_by_group_YYYY-MM.csv
+        or archive_formats_by_aip_YYYY-MM.csv
+
+    Returns:
+        name : a tuple with the report type (by_group or by_aip) and the date (YYYY-MM),
+        or None if the file name does not match
+    """
+
+    match = re.match(r"archive_formats_(by_aip|by_group)_(\d{4}-\d{2})\.csv$", os.path.basename(csv_path))
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
+
+def snapshot_trend(store_folder, category, value='File_IDs'):
+    """Calculate the total of a value for each instance of a category in every by_group snapshot in the store
+
+    Parameters:
+        store_folder : the path to the folder for the snapshot store
+        category : the column to subtotal on, for example Format_Standardized_Name or NARA_Risk_Level
+        value : the column to total, File_IDs or Size_GB
+
+    Returns:
+        trend : a dataframe with rows by instance of the category and a column for each snapshot date,
+        with 0 if an instance is not in a snapshot
+    """
+
+    # Reads only the category and value from each snapshot.
+    df = read_snapshots(store_folder, 'by_group', [category, value])
+
+    # Makes a table with the total for each instance (rows) in each snapshot (columns).
+    trend = df.pivot_table(index=category, columns='Snapshot', values=value, aggfunc='sum', fill_value=0)
+    trend.columns.name = None
+
+    # Puts the NARA risk levels in order of increasing risk, instead of alphabetical order.
+    if category == 'NARA_Risk_Level':
+        risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+        trend = trend.reindex([level for level in risk_order if level in trend.index] +
+                              [level for level in trend.index if level not in risk_order])
+
+    # Rounds Size (GB) to 2 decimal places to make it easier to read.
+    if value == 'Size_GB':
+        trend = round(trend, 2)
+
+    return trend
+
+
+def spreadsheet_trends(store_folder):
+    """Save the trends for format types, format names, and risk levels to ARCHive-Formats-Trends.xlsx
+
+    Parameters:
+        store_folder : the path to the folder for the snapshot store, where the spreadsheet is also saved
+
+    Returns: none
+    """
+
+    # Makes a dataframe for each trend.
+    type_files = snapshot_trend(store_folder, 'Format_Type')
+    name_files = snapshot_trend(store_folder, 'Format_Standardized_Name')
+    risk_files = snapshot_trend(store_folder, 'NARA_Risk_Level')
+    risk_size = snapshot_trend(store_folder, 'NARA_Risk_Level', 'Size_GB')
+
+    # Saves each dataframe as a separate sheet in an Excel spreadsheet.
+    sheets = [(type_files, "Format_Type_File_IDs", {}), (name_files, "Format_Name_File_IDs", {}),
+              (risk_files, "Risk_Level_File_IDs", {}), (risk_size, "Risk_Level_Size_GB", {})]
+    save_workbook(sheets, os.path.join(store_folder, "ARCHive-Formats-Trends.xlsx"))
+
+
+if __name__ == '__main__':
+
+    # Verifies the required argument is present and any reports to add are valid.
+    # If there was an error, prints the error(s) and exits the script.
+    store, csv_list, errors_list = check_arguments(sys.argv)
+    if len(errors_list) > 0:
+        for error in errors_list:
+            print(error)
+        print("Script usage: python path/format_trends.py store_folder [formats_csv ...]")
+        sys.exit(1)
+
+    # Adds each report to the snapshot store, unless it is already there.
+    for csv_file in csv_list:
+        if ingest_snapshot(csv_file, store):
+            print(f"Added {csv_file} to the snapshot store.")
+        else:
+            print(f"{csv_file} is already in the snapshot store.")
+
+    # Makes the spreadsheet with the trends from every by_group snapshot in the store.
+    os.makedirs(store, exist_ok=True)
+    spreadsheet_trends(store)
+
+    # Makes a CSV with the risk level of each format in each AIP in every by_aip snapshot, if there are any.
+    # It is a CSV because it has a row for every AIP and format identification, which can be too many for Excel.
+    aip_history = risk_history(store)
+    if len(aip_history) > 0:
+        aip_history.to_csv(os.path.join(store, "ARCHive-Risk-History.csv"), index=False)
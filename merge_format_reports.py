@@ -3,6 +3,7 @@
 Parameters:
     report_folder : the path to the folder which contains ARCHive's group file format reports and usage report (all CSVs)
     nara_csv : the path to NARA's Digital Preservation Plan spreadsheet (CSV)
+    partition (optional) : the word "partition", to also save archive_formats_by_aip_YYYYMM.csv as one CSV per group
 
 Returns:
 
@@ -16,6 +17,14 @@ Returns:
     format name, format version, registry name, registry key, and format note)
     It is used for aggregating the number of file_ids.
     The numbers are inflated by files that have more than one possible format identification.
+
+    archive_formats_aggregates_YYYYMM.csv: the number of unique collections and AIPs for each group, format type,
+    and format standardized name, and the number of unique format types and format standardized names for each group.
+    It is used by archive_reports.py instead of aggregating archive_formats_by_aip_YYYYMM.csv.
+
+    archive_formats_by_aip_YYYYMM folder (optional): the rows of archive_formats_by_aip_YYYYMM.csv for each group
+    in a separate CSV (group.csv), and manifest.csv with the group, file name, and number of rows of each CSV.
+    It is used by department_reports.py and archive_reports.py to read only the groups they need.
 """
 
 import csv
@@ -24,6 +33,7 @@ import numpy as np
 import os
 import pandas as pd
 import re
+import shutil
 import sys
 
 
@@ -210,7 +220,7 @@ def collection_from_aip(aip_id, group):
 
 
 def check_arguments(argument_list):
-    """Check the required arguments report_folder and nara_csv are present and correct
+    """Check the required arguments report_folder and nara_csv are present and correct, and the optional partition
 
     Parameters:
         argument_list : list from sys.argv with the script parameters
@@ -218,12 +228,14 @@ def check_arguments(argument_list):
     Returns:
         report_path : the path to the folder which contains ARCHive's group file format reports and usage report, or None
         nara_path : the path to NARA's Digital Preservation Plan spreadsheet, or None
+        partition : True if the by_aip CSV should also be saved as one CSV per group, or False
         errors : the list of errors encountered, if any, or an empty list
     """
 
     # Makes variables with default values to store the results of the function.
     report_path = None
     nara_path = None
+    partition = False
     errors = []
 
     # Verifies that the first required argument (report_folder) is present,
@@ -244,8 +256,15 @@ def check_arguments(argument_list):
     else:
         errors.append("Required argument nara_csv is missing")
 
+    # Verifies that the optional argument, if present, is partition.
+    if len(argument_list) > 3:
+        if argument_list[3] == "partition":
+            partition = True
+        else:
+            errors.append(f"Optional argument '{argument_list[3]}' is not partition")
+
     # Returns the results.
-    return report_path, nara_path, errors
+    return report_path, nara_path, partition, errors
 
 
 def csv_to_dataframe(csv_file):
@@ -287,6 +306,36 @@ def csv_to_dataframe(csv_file):
     return df
 
 
+def get_partition_paths(formats_by_aip_path, groups=None):
+    """Get the paths to the CSVs for each group saved from archive_formats_by_aip.csv by save_partitions()
+
+    The partitions are only used if the manifest was saved after the by_aip CSV,
+    so partitions from an earlier version of the by_aip CSV with the same date are not used.
+
+    Parameters:
+        formats_by_aip_path : the path to the archive_formats_by_aip.csv
+        groups : optional, a list of the groups to get the CSVs for, or None to get the CSVs for every group
+
+    Returns:
+        partition_paths : a list of the paths to the CSVs for the groups, in the order of the manifest,
+        or None if there are no partitions for the by_aip CSV
+    """
+
+    # The partitions are in a folder with the same name as the by_aip CSV, without the file extension.
+    partition_folder = os.path.splitext(formats_by_aip_path)[0]
+    manifest_path = os.path.join(partition_folder, "manifest.csv")
+    if not os.path.exists(manifest_path) or os.path.getmtime(manifest_path) < os.path.getmtime(formats_by_aip_path):
+        return None
+
+    # Groups without a CSV (not in the by_aip CSV) are skipped.
+    manifest = pd.read_csv(manifest_path, dtype={'Group': str, 'File': str})
+    if groups:
+        manifest = manifest[manifest['Group'].isin(groups)]
+    partition_paths = [os.path.join(partition_folder, file) for file in manifest['File']]
+
+    return partition_paths
+
+
 def match_nara_risk(df_format, df_nara):
     """Match format identifications to NARA's Digital Preservation Plan spreadsheet
 
@@ -517,6 +566,82 @@ def read_row(row_data, archive_group):
     return aip_rows, group_row
 
 
+def save_aggregates(csv_path, aggregates):
+    """Save the unique counts calculated with update_aggregates() to a CSV
+
+    Parameters:
+        csv_path : the path to the aggregates CSV (archive_formats_aggregates_YYYY-MM.csv)
+        aggregates : a dictionary made by update_aggregates(), with the sets of values for each category instance
+
+    Returns: none
+    """
+
+    # The types and standardized names are only counted for groups, so they are blank for the other categories.
+    header = ["Category", "Instance", "Collections", "AIPs", "Format_Types", "Format_Standardized_Names"]
+    with open(csv_path, "w", newline="") as csv_open:
+        csv_write = csv.writer(csv_open)
+        csv_write.writerow(header)
+        for category in ("Group", "Format_Type", "Format_Standardized_Name"):
+            for (row_category, instance), values in sorted(aggregates.items()):
+                if row_category != category:
+                    continue
+                row = [category, instance, len(values["Collections"]), len(values["AIPs"])]
+                if category == "Group":
+                    row.extend([len(values["Format_Types"]), len(values["Format_Standardized_Names"])])
+                else:
+                    row.extend(["", ""])
+                csv_write.writerow(row)
+
+
+def save_partitions(formats_by_aip_path):
+    """Save the rows for each group in archive_formats_by_aip.csv to a separate CSV, with a manifest
+
+    The by_aip CSV is read one row at a time and each row is saved to the CSV for its group,
+    so the rows are not changed and the by_aip CSV is never all in memory.
+    The CSVs and manifest.csv are saved in a folder with the same name as the by_aip CSV.
+    If the folder already exists, for example from running the script earlier in the month, it is replaced.
+
+    Parameters:
+        formats_by_aip_path : the path to the archive_formats_by_aip.csv, after NARA risk is added
+
+    Returns: none
+    """
+
+    # Makes an empty folder for the partitions.
+    partition_folder = os.path.splitext(formats_by_aip_path)[0]
+    if os.path.exists(partition_folder):
+        shutil.rmtree(partition_folder)
+    os.makedirs(partition_folder)
+
+    # Saves each row to the CSV for its group, starting each CSV with the header of the by_aip CSV.
+    # The CSVs stay open until every row is saved, since rows for a group may not all be together.
+    partitions = {}
+    try:
+        with open(formats_by_aip_path, newline="") as aip_open:
+            aip_read = csv.reader(aip_open)
+            header = next(aip_read)
+            group_index = header.index("Group")
+            for row in aip_read:
+                group = row[group_index]
+                if group not in partitions:
+                    partition_open = open(os.path.join(partition_folder, f"{group}.csv"), "w", newline="")
+                    partitions[group] = {"open": partition_open, "write": csv.writer(partition_open), "rows": 0}
+                    partitions[group]["write"].writerow(header)
+                partitions[group]["write"].writerow(row)
+                partitions[group]["rows"] += 1
+    finally:
+        for partition in partitions.values():
+            partition["open"].close()
+
+    # Saves the manifest, with the group, file name, and number of rows of each CSV.
+    # It is saved last, so there is only a manifest if every CSV was saved.
+    with open(os.path.join(partition_folder, "manifest.csv"), "w", newline="") as manifest_open:
+        manifest_write = csv.writer(manifest_open)
+        manifest_write.writerow(["Group", "File", "Rows"])
+        for group in sorted(partitions):
+            manifest_write.writerow([group, f"{group}.csv", partitions[group]["rows"]])
+
+
 def save_to_csv(csv_path, rows):
     """Save rows to a specified CSV
 
@@ -585,15 +710,44 @@ def standardize_format(format_name):
         sys.exit()
 
 
+def update_aggregates(aggregates, aip_rows):
+    """Add the collections, AIPs, format types, and format standardized names from rows for the "by aip" CSV to sets
+
+    The sets are used to count the unique values for each group, format type, and format standardized name,
+    which archive_reports.py uses instead of reading the entire "by aip" CSV.
+    Only the sets are kept in memory, not the rows.
+
+    Parameters:
+        aggregates : a dictionary with (category, instance) for keys and a dictionary of sets for values,
+        which is updated by this function
+        aip_rows : a list of lists, where each list is a row for the "by aip" CSV, made by read_report()
+
+    Returns: none
+    """
+
+    for aip_row in aip_rows:
+        group, collection_id, aip, format_type, format_standard = aip_row[:5]
+        for category, instance in (("Group", group), ("Format_Type", format_type),
+                                   ("Format_Standardized_Name", format_standard)):
+            values = aggregates.setdefault((category, instance), {"Collections": set(), "AIPs": set(),
+                                                                  "Format_Types": set(),
+                                                                  "Format_Standardized_Names": set()})
+            values["Collections"].add(collection_id)
+            values["AIPs"].add(aip)
+            if category == "Group":
+                values["Format_Types"].add(format_type)
+                values["Format_Standardized_Names"].add(format_standard)
+
+
 if __name__ == '__main__':
 
     # Verifies the required argument is present and the path is valid.
     # If there was an error, prints the error and exits the script.
-    report_folder, nara_csv, errors_list = check_arguments(sys.argv)
+    report_folder, nara_csv, partition_aip, errors_list = check_arguments(sys.argv)
     if len(errors_list) > 0:
         for error in errors_list:
             print(error)
-        print("Script usage: python path/merge_format_reports.py report_folder nara_csv")
+        print("Script usage: python path/merge_format_reports.py report_folder nara_csv [partition]")
         sys.exit(1)
 
     # Increases the size of CSV fields to handle long AIP lists.
@@ -609,6 +763,7 @@ if __name__ == '__main__':
     today = datetime.datetime.now().strftime("%Y-%m")
     aip_csv = os.path.join(report_folder, f"archive_formats_by_aip_{today}.csv")
     group_csv = os.path.join(report_folder, f"archive_formats_by_group_{today}.csv")
+    aggregates_csv = os.path.join(report_folder, f"archive_formats_aggregates_{today}.csv")
 
     # Adds headers to the CSVs.
     save_to_csv(aip_csv, "aip_csv_header")
@@ -616,6 +771,9 @@ if __name__ == '__main__':
 
     # Gets data from each ARCHive group format report and calculates additional information based on that data.
     # The information is saved to one or both CSV files.
+    # The unique collections, AIPs, format types, and format standardized names are also gathered
+    # while the rows are read, to save as the aggregates CSV.
+    aggregates_dict = {}
     for report in os.listdir(report_folder):
 
         # Skips the file if it is not a format report.
@@ -630,6 +788,19 @@ if __name__ == '__main__':
         save_to_csv(aip_csv, aip_report_list)
         save_to_csv(group_csv, group_report_list)
 
+        # Adds the report's collections, AIPs, format types, and format standardized names to the aggregates.
+        update_aggregates(aggregates_dict, aip_report_list)
+
     # Adds risk information from the NARA Preservation Action Plans CSV to both format CSVs.
     add_nara_risk(aip_csv, nara_csv)
     add_nara_risk(group_csv, nara_csv)
+
+    # Saves the number of unique collections, AIPs, format types, and format standardized names
+    # for each group, format type, and format standardized name.
+    # It is saved after the by_aip CSV is final, since archive_reports.py does not use aggregates older than it.
+    save_aggregates(aggregates_csv, aggregates_dict)
+
+    # If partition was provided, also saves the by_aip CSV as one CSV per group,
+    # so scripts that only need some groups do not have to read every group.
+    if partition_aip:
+        save_partitions(aip_csv)
@@ -37,5 +37,30 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(result, expected, "Problem with test for archive overview")
 
 
+    def test_aggregates(self):
+        """
+        Test for using the aggregates CSV made by merge_format_reports.py instead of archive_formats_by_aip.csv.
+        The aggregates were made from the same archive_formats_by_aip.csv as the other test,
+        so the result should be the same.
+        """
+        # Makes the variables used for function input.
+        df_aggregates = pd.read_csv(os.path.join("archive_overview", "archive_formats_aggregates_2023-08.csv"))
+        df_formats_by_group = pd.read_csv(os.path.join("archive_overview", "archive_formats_by_group_2023-08.csv"))
+        usage_report = os.path.join("archive_overview", "usage_report_20171101_20211101.csv")
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        overview = archive_overview(None, df_formats_by_group, usage_report, df_aggregates)
+        result = [overview.columns.tolist()] + overview.reset_index().values.tolist()
+
+        # Tests if overview has the expected values.
+        expected = [["Size_TB", "Size_GB_Inflated", "Collections", "AIPs", "File_IDs", "Format_Types",
+                     "Format_Standardized_Names", "Format_Identifications"],
+                    ["bmac", 554.0, 326822.42, 1.0, 20.0, 6607.0, 2.0, 2.0, 2.0],
+                    ["dlg", 10.6, 3231.06, 9.0, 29.0, 264332.0, 3.0, 5.0, 8.0],
+                    ["hargrett", 0.15, 143.97, 2.0, 47.0, 5507.0, 2.0, 3.0, 6.0],
+                    ["total", 564.75, 330197.44999999995, 12.0, 96.0, 276446.0, 4.0, 7.0, 12.0]]
+        self.assertEqual(result, expected, "Problem with test for aggregates")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests for the function cache_key(),
+which calculates a key for the cache of a spreadsheet from the content of its input files and the script.
+
+For input, tests use CSVs made in the test, which are deleted after each test.
+"""
+import os
+import unittest
+from archive_reports import cache_key
+
+
+def make_csv(csv_path, text):
+    """
+    Makes a CSV with the provided text to use for function input.
+    """
+    with open(csv_path, "w") as csv_open:
+        csv_open.write(text)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the CSVs made by the test, if they were made."""
+        for csv_path in ("cache_key_1.csv", "cache_key_2.csv"):
+            if os.path.exists(csv_path):
+                os.remove(csv_path)
+
+    def test_same_content(self):
+        """
+        Test for two files with the same content but different names, which have the same key.
+        """
+        # Makes the variables used for function input.
+        make_csv("cache_key_1.csv", "Group,File_IDs\ndlg,5\n")
+        make_csv("cache_key_2.csv", "Group,File_IDs\ndlg,5\n")
+
+        # Runs the function being tested.
+        key_1 = cache_key(["cache_key_1.csv"])
+        key_2 = cache_key(["cache_key_2.csv"])
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(key_1, key_2, "Problem with test for same content")
+
+    def test_different_content(self):
+        """
+        Test for a file that is changed, which has a different key after the change.
+        """
+        # Makes the variable used for function input and runs the function being tested before and after a change.
+        make_csv("cache_key_1.csv", "Group,File_IDs\ndlg,5\n")
+        key_before = cache_key(["cache_key_1.csv"])
+        make_csv("cache_key_1.csv", "Group,File_IDs\ndlg,6\n")
+        key_after = cache_key(["cache_key_1.csv"])
+
+        # Tests if the function output has the expected value.
+        self.assertNotEqual(key_before, key_after, "Problem with test for different content")
+
+    def test_multiple_files(self):
+        """
+        Test for more than one file, where the key changes if any of the files change.
+        """
+        # Makes the variables used for function input and runs the function being tested before and after a change.
+        make_csv("cache_key_1.csv", "Group,File_IDs\ndlg,5\n")
+        make_csv("cache_key_2.csv", "Group,Size_GB\ndlg,1.5\n")
+        key_before = cache_key(["cache_key_1.csv", "cache_key_2.csv"])
+        make_csv("cache_key_2.csv", "Group,Size_GB\ndlg,2.5\n")
+        key_after = cache_key(["cache_key_1.csv", "cache_key_2.csv"])
+
+        # Tests if the function output has the expected value.
+        self.assertNotEqual(key_before, key_after, "Problem with test for multiple files")
+
+
+if __name__ == '__main__':
+    unittest.main()
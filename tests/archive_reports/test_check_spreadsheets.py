@@ -0,0 +1,114 @@
+"""
+Tests for the function check_spreadsheets(),
+which checks the optional script arguments with the names of the spreadsheets to make and top=N.
+
+For input, tests use lists with the same format as sys.argv.
+"""
+import unittest
+from archive_reports import check_spreadsheets
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_none(self):
+        """
+        Test for no optional arguments, which makes all the spreadsheets except usage-trend.
+        """
+        # Runs the function being tested.
+        spreadsheet_names, top_n, errors = check_spreadsheets(["archive_reports.py", "report_folder"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["frequency", "group-overlap", "ranges", "risk"],
+                         "Problem with test for none, spreadsheet_names")
+        self.assertEqual(top_n, None, "Problem with test for none, top_n")
+        self.assertEqual(errors, [], "Problem with test for none, errors")
+
+    def test_one(self):
+        """
+        Test for one spreadsheet.
+        """
+        # Runs the function being tested.
+        spreadsheet_names, top_n, errors = check_spreadsheets(["archive_reports.py", "report_folder", "risk"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["risk"], "Problem with test for one, spreadsheet_names")
+        self.assertEqual(errors, [], "Problem with test for one, errors")
+
+    def test_multiple(self):
+        """
+        Test for more than one spreadsheet, including one that is repeated, which is only included once.
+        """
+        # Runs the function being tested.
+        argument_list = ["archive_reports.py", "report_folder", "ranges", "frequency", "ranges"]
+        spreadsheet_names, top_n, errors = check_spreadsheets(argument_list)
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["ranges", "frequency"],
+                         "Problem with test for multiple, spreadsheet_names")
+        self.assertEqual(errors, [], "Problem with test for multiple, errors")
+
+    def test_usage_trend(self):
+        """
+        Test for the usage-trend spreadsheet, which is only made when it is requested.
+        """
+        # Runs the function being tested.
+        spreadsheet_names, top_n, errors = check_spreadsheets(["archive_reports.py", "report_folder", "usage-trend"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["usage-trend"], "Problem with test for usage trend, spreadsheet_names")
+        self.assertEqual(errors, [], "Problem with test for usage trend, errors")
+
+    def test_error(self):
+        """
+        Test for an argument that is not the name of a spreadsheet.
+        """
+        # Runs the function being tested.
+        argument_list = ["archive_reports.py", "report_folder", "risk", "overlap"]
+        spreadsheet_names, top_n, errors = check_spreadsheets(argument_list)
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["risk"], "Problem with test for error, spreadsheet_names")
+        expected = ["Spreadsheet 'overlap' is not one of frequency, group-overlap, ranges, risk, usage-trend"]
+        self.assertEqual(errors, expected, "Problem with test for error, errors")
+
+    def test_top_n(self):
+        """
+        Test for top=N with a spreadsheet name.
+        """
+        # Runs the function being tested.
+        spreadsheet_names, top_n, errors = check_spreadsheets(["archive_reports.py", "report_folder", "frequency",
+                                                               "top=25"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["frequency"], "Problem with test for top n, spreadsheet_names")
+        self.assertEqual(top_n, 25, "Problem with test for top n, top_n")
+        self.assertEqual(errors, [], "Problem with test for top n, errors")
+
+    def test_top_n_only(self):
+        """
+        Test for top=N without any spreadsheet names, which makes all the spreadsheets except usage-trend.
+        """
+        # Runs the function being tested.
+        spreadsheet_names, top_n, errors = check_spreadsheets(["archive_reports.py", "report_folder", "top=10"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(spreadsheet_names, ["frequency", "group-overlap", "ranges", "risk"],
+                         "Problem with test for top n only, spreadsheet_names")
+        self.assertEqual(top_n, 10, "Problem with test for top n only, top_n")
+        self.assertEqual(errors, [], "Problem with test for top n only, errors")
+
+    def test_top_n_error(self):
+        """
+        Test for top= that is not followed by a whole number.
+        """
+        # Runs the function being tested.
+        spreadsheet_names, top_n, errors = check_spreadsheets(["archive_reports.py", "report_folder", "top=ten"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(top_n, None, "Problem with test for top n error, top_n")
+        self.assertEqual(errors, ["'top=ten' is not top= followed by a whole number"],
+                         "Problem with test for top n error, errors")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Tests for the function chunked_aggregates(),
+which calculates the unique counts from archive_formats_by_aip.csv by reading it in chunks.
+
+Test input is read from CSVs in other test folders, which also have the aggregates CSV made by
+merge_format_reports.py from the same data, to check the result is the same as reading all of the CSV at once.
+"""
+import os
+import pandas as pd
+import unittest
+from archive_reports import chunked_aggregates
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_one_chunk(self):
+        """
+        Test for a chunk size larger than the CSV, so it is read all at once.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        aggregates = chunked_aggregates(os.path.join("one_category", "archive_formats_by_aip_2003-01.csv"))
+        result = [aggregates.columns.tolist()] + aggregates.fillna("BLANK").values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Category", "Instance", "Collections", "AIPs", "Format_Types", "Format_Standardized_Names"],
+                    ["Group", "bmac", 1, 1, 1, 1],
+                    ["Group", "dlg", 4, 6, 3, 4],
+                    ["Group", "hargrett", 2, 4, 2, 3],
+                    ["Format_Type", "audio", 1, 1, "BLANK", "BLANK"],
+                    ["Format_Type", "image", 3, 7, "BLANK", "BLANK"],
+                    ["Format_Type", "video", 2, 2, "BLANK", "BLANK"],
+                    ["Format_Type", "web_archive", 1, 1, "BLANK", "BLANK"],
+                    ["Format_Standardized_Name", "JP2", 1, 2, "BLANK", "BLANK"],
+                    ["Format_Standardized_Name", "JPEG", 1, 2, "BLANK", "BLANK"],
+                    ["Format_Standardized_Name", "Matroska", 2, 2, "BLANK", "BLANK"],
+                    ["Format_Standardized_Name", "TIFF", 3, 5, "BLANK", "BLANK"],
+                    ["Format_Standardized_Name", "WARC", 1, 1, "BLANK", "BLANK"],
+                    ["Format_Standardized_Name", "Waveform Audio", 1, 1, "BLANK", "BLANK"]]
+        self.assertEqual(result, expected, "Problem with test for one chunk")
+
+    def test_many_chunks(self):
+        """
+        Test for a small chunk size, so values for the same instance are in many chunks.
+        The result should be the same as the aggregates CSV made from all of the data.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        aggregates = chunked_aggregates(os.path.join("archive_overview", "archive_formats_by_aip_2023-08.csv"), 5)
+        result = [aggregates.columns.tolist()] + aggregates.fillna("BLANK").values.tolist()
+
+        # Tests if the function output has the expected values.
+        df = pd.read_csv(os.path.join("archive_overview", "archive_formats_aggregates_2023-08.csv"))
+        expected = [df.columns.tolist()] + df.fillna("BLANK").values.tolist()
+        self.assertEqual(result, expected, "Problem with test for many chunks")
+
+    def test_empty(self):
+        """
+        Test for a CSV with only the header, which has no counts.
+        """
+        # Makes a CSV with only the header to use for function input.
+        csv_path = os.path.join("one_category", "archive_formats_by_aip_empty.csv")
+        with open(csv_path, "w") as csv_open:
+            csv_open.write("Group,Collection,AIP,Format_Type,Format_Standardized_Name,Format_Identification\n")
+
+        # Runs the function being tested and deletes the CSV.
+        aggregates = chunked_aggregates(csv_path, 5)
+        os.remove(csv_path)
+
+        # Tests if the function output has the expected values.
+        result = [aggregates.columns.tolist()] + aggregates.values.tolist()
+        expected = [["Category", "Instance", "Collections", "AIPs", "Format_Types", "Format_Standardized_Names"]]
+        self.assertEqual(result, expected, "Problem with test for empty")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Tests for the function file_hash(),
+which calculates the SHA-256 hash of the contents of one or more files.
+It is used for the cache keys in this script and the snapshot store in format_trends.py.
+
+For input, tests use CSVs made in the test, which are deleted after each test.
+"""
+import os
+import unittest
+from archive_reports import file_hash
+
+
+def make_csv(csv_path, text):
+    """
+    Makes a CSV with the provided text to use for function input.
+    """
+    with open(csv_path, "w", newline="") as csv_open:
+        csv_open.write(text)
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the CSVs made by the test, if they were made."""
+        for csv_path in ("file_hash_1.csv", "file_hash_2.csv"):
+            if os.path.exists(csv_path):
+                os.remove(csv_path)
+
+    def test_multiple_files(self):
+        """
+        Test for two files, which have the hash of their contents one after the other.
+        """
+        # Makes the variables used for function input.
+        make_csv("file_hash_1.csv", "Group,File_IDs\ndlg,5\n")
+        make_csv("file_hash_2.csv", "Group,Size_GB\ndlg,1.5\n")
+
+        # Runs the function being tested.
+        result = file_hash(["file_hash_1.csv", "file_hash_2.csv"])
+
+        # Tests if the function output has the expected value.
+        expected = "12f8a95502658b81311adf7ecc5e5aa7b9e530d9368ab7414f85cbdd6ebcd832"
+        self.assertEqual(result, expected, "Problem with test for multiple files")
+
+    def test_one_file(self):
+        """
+        Test for one file.
+        """
+        # Makes the variable used for function input.
+        make_csv("file_hash_1.csv", "Group,File_IDs\ndlg,5\n")
+
+        # Runs the function being tested.
+        result = file_hash(["file_hash_1.csv"])
+
+        # Tests if the function output has the expected value.
+        expected = "d99a0fc9342fc672a4c36dbaf0f0ffc9280d92663bde52c21e61838b43ab5084"
+        self.assertEqual(result, expected, "Problem with test for one file")
+
+
+if __name__ == '__main__':
+    unittest.main()
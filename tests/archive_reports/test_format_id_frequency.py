@@ -33,6 +33,85 @@ class MyTestCase(unittest.TestCase):
                     ["JPEG EXIF|2.1|x-fmt/390", 195, 8.52, 130.0, 3.91]]
         self.assertEqual(result, expected, "Problem with test for format id frequency")
 
+    def test_top_n(self):
+        """
+        Test for only including the most common format identification, with the rest combined into Other.
+        """
+        # Makes the variables used for function input.
+        totals_dict = {"Collections": 7, "AIPs": 14, "Files": 2290, "Size": 3326.99}
+        df_formats_by_group = pd.read_csv(os.path.join("format_id_frequency", "archive_formats_by_group_2023-08.csv"))
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        format_ids = format_id_frequency(totals_dict, df_formats_by_group, top_n=1)
+        result = [format_ids.columns.tolist()] + format_ids.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["File_IDs", "File_IDs_Percentage", "Size_GB", "Size_GB_Percentage"],
+                    ["Tagged Image File Format|6|fmt/353", 735, 32.10, 1540.2, 46.29],
+                    ["Other", 840, 36.68, 1617.702, 48.62]]
+        self.assertEqual(result, expected, "Problem with test for top n")
+
+    def test_top_n_all(self):
+        """
+        Test for a top_n that is at least the number of format identifications, so there is no Other row.
+        """
+        # Makes the variables used for function input.
+        totals_dict = {"Collections": 7, "AIPs": 14, "Files": 2290, "Size": 3326.99}
+        df_formats_by_group = pd.read_csv(os.path.join("format_id_frequency", "archive_formats_by_group_2023-08.csv"))
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        format_ids = format_id_frequency(totals_dict, df_formats_by_group, top_n=3)
+        result = [format_ids.columns.tolist()] + format_ids.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["File_IDs", "File_IDs_Percentage", "Size_GB", "Size_GB_Percentage"],
+                    ["Tagged Image File Format|6|fmt/353", 735, 32.10, 1540.2, 46.29],
+                    ["Matroska|NO VALUE|NO VALUE", 645, 28.17, 1487.702, 44.72],
+                    ["JPEG EXIF|2.1|x-fmt/390", 195, 8.52, 130.0, 3.91]]
+        self.assertEqual(result, expected, "Problem with test for top n, all")
+
+    def test_top_n_ties(self):
+        """
+        Test for a tie at the top_n cutoff, which includes the tied format identification that is first alphabetically.
+        """
+        # Makes the variables used for function input. Format identifications C and D have the same count.
+        totals_dict = {"Collections": 4, "AIPs": 4, "Files": 100, "Size": 100}
+        df_formats_by_group = pd.DataFrame({"Group": ["dlg", "dlg", "dlg", "dlg", "dlg"],
+                                            "File_IDs": [10, 20, 20, 40, 10],
+                                            "Size_GB": [10, 20, 20, 40, 10],
+                                            "Format_Identification": ["E", "D", "C", "A", "B"]})
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        format_ids = format_id_frequency(totals_dict, df_formats_by_group, top_n=2)
+        result = [format_ids.columns.tolist()] + format_ids.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["File_IDs", "File_IDs_Percentage", "Size_GB", "Size_GB_Percentage"],
+                    ["A", 40, 40.0, 40, 40.0],
+                    ["C", 20, 20.0, 20, 20.0],
+                    ["Other", 40, 40.0, 40, 40.0]]
+        self.assertEqual(result, expected, "Problem with test for top n, ties")
+
+    def test_ties(self):
+        """
+        Test for ties when all format identifications are included,
+        which are in the same order (alphabetical) as when top_n is used.
+        """
+        # Makes the variables used for function input. Format identifications B, C, D, and E have the same count.
+        totals_dict = {"Collections": 4, "AIPs": 4, "Files": 100, "Size": 100}
+        df_formats_by_group = pd.DataFrame({"Group": ["dlg", "dlg", "dlg", "dlg", "dlg"],
+                                            "File_IDs": [15, 15, 15, 40, 15],
+                                            "Size_GB": [15, 15, 15, 40, 15],
+                                            "Format_Identification": ["E", "D", "C", "A", "B"]})
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        format_ids = format_id_frequency(totals_dict, df_formats_by_group)
+        result = format_ids.index.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = ["A", "B", "C", "D", "E"]
+        self.assertEqual(result, expected, "Problem with test for ties")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests for the function get_aggregates_path(),
+which finds the aggregates CSV made by merge_format_reports.py with the same date as archive_formats_by_aip.csv.
+
+For input, tests use files in the archive_reports folder of this script repo.
+"""
+
+import os
+import unittest
+from archive_reports import get_aggregates_path
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_missing(self):
+        """
+        Test for a folder without an aggregates CSV, which returns None.
+        """
+        # Runs the function being tested.
+        aggregates_path = get_aggregates_path(os.path.join("script", "archive_formats_by_aip_2023-08.csv"))
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(aggregates_path, None, "Problem with test for missing")
+
+    def test_present(self):
+        """
+        Test for a folder with an aggregates CSV with the same date.
+        """
+        # Makes the aggregates CSV newer than the by_aip CSV, as it is when made by merge_format_reports.py.
+        # The times of the test files depend on when they were copied, so they are set by the test.
+        aip_path = os.path.join("one_category", "archive_formats_by_aip_2003-01.csv")
+        expected = os.path.join("one_category", "archive_formats_aggregates_2003-01.csv")
+        new_time = os.path.getmtime(aip_path) + 60
+        os.utime(expected, (new_time, new_time))
+
+        # Runs the function being tested.
+        aggregates_path = get_aggregates_path(aip_path)
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(aggregates_path, expected, "Problem with test for present")
+
+    def test_old(self):
+        """
+        Test for a folder with an aggregates CSV with the same date that is older than the by_aip CSV,
+        for example if the by_aip CSV was made again, which returns None.
+        """
+        # Makes the aggregates CSV older than the by_aip CSV.
+        aip_path = os.path.join("one_category", "archive_formats_by_aip_2003-01.csv")
+        old_time = os.path.getmtime(aip_path) - 60
+        os.utime(os.path.join("one_category", "archive_formats_aggregates_2003-01.csv"), (old_time, old_time))
+
+        # Runs the function being tested.
+        aggregates_path = get_aggregates_path(aip_path)
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(aggregates_path, None, "Problem with test for old")
+
+    def test_different_date(self):
+        """
+        Test for a folder with an aggregates CSV, but not one with the same date, which returns None.
+        """
+        # Runs the function being tested.
+        aggregates_path = get_aggregates_path(os.path.join("one_category", "archive_formats_by_aip_2003-02.csv"))
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(aggregates_path, None, "Problem with test for different date")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -85,6 +85,90 @@ class MyTestCase(unittest.TestCase):
         expected = ["usage_report.csv"]
         self.assertEqual(missing, expected, "Problem with test for missing usage report")
 
+    def test_missing_not_needed(self):
+        """
+        Test for when the formats_by_aip report is missing but only the risk and ranges spreadsheets will be made,
+        which do not need it, so it is not included in the missing list.
+        """
+        # Runs the function being tested.
+        report_folder_path = os.path.join("get_report_paths", "missing_formats_by_aip")
+        formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder_path,
+                                                                                                ["risk", "ranges"])
+
+        # Tests that the value of missing is correct.
+        expected = []
+        self.assertEqual(missing, expected, "Problem with test for missing not needed")
+
+    def test_missing_needed(self):
+        """
+        Test for when the usage report is missing and the frequency spreadsheet will be made, which needs it.
+        """
+        # Runs the function being tested.
+        report_folder_path = os.path.join("get_report_paths", "missing_usage")
+        formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder_path,
+                                                                                                ["frequency"])
+
+        # Tests that the value of missing is correct.
+        expected = ["usage_report.csv"]
+        self.assertEqual(missing, expected, "Problem with test for missing needed")
+
+    def test_usage_trend_only(self):
+        """
+        Test for when the formats_by_group report is missing but only the usage-trend spreadsheet will be made,
+        which only needs usage reports, so it is not included in the missing list.
+        """
+        # Runs the function being tested.
+        report_folder_path = os.path.join("get_report_paths", "missing_formats_by_group")
+        formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder_path,
+                                                                                                ["usage-trend"])
+
+        # Tests that the value of missing is correct.
+        expected = []
+        self.assertEqual(missing, expected, "Problem with test for usage trend only")
+
+
+    def test_overlapping_usage(self):
+        """
+        Test for when there is a usage report for the start of ARCHive - present and a usage report for each year,
+        where the usage report with the longest period is used even though it is first in alphabetical order.
+        """
+        # Runs the function being tested.
+        report_folder_path = os.path.join("get_report_paths", "overlapping_usage")
+        formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder_path)
+
+        # Tests that the value of usage_report is correct.
+        expected = os.path.join("get_report_paths", "overlapping_usage", "usage_report_20171101_20211101.csv")
+        self.assertEqual(usage_report, expected, "Problem with test for overlapping usage")
+
+
+    def test_undated_usage(self):
+        """
+        Test for when there is more than one usage report and one does not have the dates in the file name,
+        which is not used, and one has more text after the dates, which is used since it has the longest period.
+        """
+        # Runs the function being tested.
+        report_folder_path = os.path.join("get_report_paths", "undated_usage")
+        formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder_path)
+
+        # Tests that the value of usage_report is correct.
+        expected = os.path.join("get_report_paths", "undated_usage", "usage_report_20171101_20211101 (1).csv")
+        self.assertEqual(usage_report, expected, "Problem with test for undated usage")
+
+    def test_undated_usage_only(self):
+        """
+        Test for when the only usage report does not have the dates in the file name, which is still used,
+        and only the risk spreadsheet will be made.
+        """
+        # Runs the function being tested.
+        report_folder_path = os.path.join("get_report_paths", "undated_usage_only")
+        formats_by_aip_report, formats_by_group_report, usage_report, missing = get_report_paths(report_folder_path,
+                                                                                                 ["risk"])
+
+        # Tests that the values of usage_report and missing are correct.
+        result = [usage_report, missing]
+        expected = [os.path.join("get_report_paths", "undated_usage_only", "usage_report_download.csv"), []]
+        self.assertEqual(result, expected, "Problem with test for undated usage only")
+
 
 if __name__ == '__main__':
     unittest.main()
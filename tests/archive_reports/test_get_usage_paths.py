@@ -0,0 +1,77 @@
+"""
+Tests for the function get_usage_paths(),
+which finds the paths to every usage report in the report folder.
+
+For input, tests use report folders in the repo for this script.
+"""
+
+import os
+import unittest
+from archive_reports import get_usage_paths
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_multiple(self):
+        """
+        Test for a folder with a usage report for each of three years, which are in order by date.
+        """
+        # Runs the function being tested.
+        usage_paths = get_usage_paths("usage_trend")
+
+        # Tests if the function output has the expected values.
+        expected = [os.path.join("usage_trend", "usage_report_20210101_20211231.csv"),
+                    os.path.join("usage_trend", "usage_report_20220101_20221231.csv"),
+                    os.path.join("usage_trend", "usage_report_20230101_20231231.csv")]
+        self.assertEqual(usage_paths, expected, "Problem with test for multiple")
+
+    def test_overlapping(self):
+        """
+        Test for a folder with a usage report for the start of ARCHive - present and a usage report for each year,
+        where the usage report for the start of ARCHive - present overlaps the 2021 usage report and is not included.
+        """
+        # Runs the function being tested.
+        usage_paths = get_usage_paths(os.path.join("get_report_paths", "overlapping_usage"))
+
+        # Tests if the function output has the expected values.
+        expected = [os.path.join("get_report_paths", "overlapping_usage", "usage_report_20210101_20211231.csv"),
+                    os.path.join("get_report_paths", "overlapping_usage", "usage_report_20220101_20221231.csv"),
+                    os.path.join("get_report_paths", "overlapping_usage", "usage_report_20230101_20231231.csv")]
+        self.assertEqual(usage_paths, expected, "Problem with test for overlapping")
+
+    def test_undated(self):
+        """
+        Test for a folder with a usage report without the dates in the file name, which is not included,
+        and a usage report with more text after the dates, which overlaps the 2021 usage report and is not included.
+        """
+        # Runs the function being tested.
+        usage_paths = get_usage_paths(os.path.join("get_report_paths", "undated_usage"))
+
+        # Tests if the function output has the expected values.
+        expected = [os.path.join("get_report_paths", "undated_usage", "usage_report_20210101_20211231.csv")]
+        self.assertEqual(usage_paths, expected, "Problem with test for undated")
+
+    def test_one(self):
+        """
+        Test for a folder with one usage report and other reports, which are not included.
+        """
+        # Runs the function being tested.
+        usage_paths = get_usage_paths(os.path.join("get_report_paths", "all_present"))
+
+        # Tests if the function output has the expected values.
+        expected = [os.path.join("get_report_paths", "all_present", "usage_report_20171101_20211101.csv")]
+        self.assertEqual(usage_paths, expected, "Problem with test for one")
+
+    def test_none(self):
+        """
+        Test for a folder without a usage report.
+        """
+        # Runs the function being tested.
+        usage_paths = get_usage_paths(os.path.join("get_report_paths", "missing_usage"))
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(usage_paths, [], "Problem with test for none")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests for the function group_membership(),
+which calculates a bitmask of the groups that have each instance of one or more categories.
+
+For input, tests use files in the archive_reports folder of this script repo.
+"""
+
+import numpy as np
+import os
+import pandas as pd
+import unittest
+from archive_reports import group_membership
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_blank_group(self):
+        """
+        Test for rows without a group, which are not included in any mask,
+        including an instance that is only in a row without a group.
+        The bits are 1 for bmac and 2 for dlg.
+        """
+        # Makes the variable used for function input.
+        df_formats_by_group = pd.DataFrame({"Group": ["bmac", "dlg", np.NaN, np.NaN],
+                                            "Format_Type": ["audio", "image", "text", "audio"]})
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        masks, group_names = group_membership(['Format_Type'], df_formats_by_group)
+        result = [[index, int(mask)] for index, mask in masks['Format_Type'].items()]
+
+        # Tests if the function output has the expected values.
+        expected = [["audio", 1], ["image", 2]]
+        self.assertEqual(result, expected, "Problem with test for blank group")
+
+    def test_group_names(self):
+        """
+        Test for the list of group names, which are in alphabetical order to give each group a bit.
+        """
+        # Makes the variable used for function input.
+        df_formats_by_group = pd.read_csv(os.path.join("group_membership", "archive_formats_by_group_2002-01.csv"))
+
+        # Runs the function being tested.
+        masks, group_names = group_membership(['Format_Type'], df_formats_by_group)
+
+        # Tests if the function output has the expected values.
+        expected = ["bmac", "dlg", "hargrett"]
+        self.assertEqual(group_names, expected, "Problem with test for group names")
+
+    def test_multiple_categories(self):
+        """
+        Test for calculating the masks for three categories at once.
+        The bits are 1 for bmac, 2 for dlg, and 4 for hargrett.
+        """
+        # Makes the variable used for function input.
+        df_formats_by_group = pd.read_csv(os.path.join("group_membership", "archive_formats_by_group_2002-01.csv"))
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        categories = ['Format_Type', 'Format_Standardized_Name', 'Format_Identification']
+        masks, group_names = group_membership(categories, df_formats_by_group)
+        result = {category: [[index, int(mask)] for index, mask in masks[category].items()] for category in masks}
+
+        # Tests if the function output has the expected values.
+        expected = {"Format_Type": [["audio", 1], ["image", 6], ["video", 7]],
+                    "Format_Standardized_Name": [["JP2", 2], ["JPEG", 6], ["Matroska", 7], ["WAVE", 1]],
+                    "Format_Identification": [["JPEG 2000 JP2|NO VALUE|x-fmt/392", 2],
+                                              ["JPEG File Interchange Format|1|fmt/42", 6],
+                                              ["Matroska|NO VALUE|NO VALUE", 7],
+                                              ["Wave|NO VALUE|NO VALUE", 1]]}
+        self.assertEqual(result, expected, "Problem with test for multiple categories")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for the function groupby_risk_batch(),
+which makes the same dataframes as groupby_risk() for several groupby_lists,
+calculated from one summary of the data.
+
+Test input is read from a CSV instead of being made in the test to be as close to production as possible.
+"""
+import os
+import pandas as pd
+import unittest
+from archive_reports import groupby_risk, groupby_risk_batch, nara_plan_type
+
+
+def read_dataframe():
+    """
+    Reads the test CSV, assigns order to the NARA risk categories, and adds NARA_Plan_Type.
+    In production, this is done as part of the spreadsheet_risk() function.
+    """
+    df = pd.read_csv(os.path.join("groupby_risk_batch", "archive_formats_by_group_2015-01.csv"))
+    risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+    df['NARA_Risk_Level'] = pd.Categorical(df['NARA_Risk_Level'], risk_order, ordered=True)
+    df['NARA_Plan_Type'] = nara_plan_type(df['NARA_Proposed_Preservation_Plan'])
+    return df
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_archive(self):
+        """
+        Test for the risk overview for all of ARCHive, including format identifications in more than one group.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        archive_risk = groupby_risk_batch(read_dataframe(), [['NARA_Risk_Level']])[0]
+        result = [archive_risk.columns.tolist()] + archive_risk.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["NARA_Risk_Level", "File_IDs", "Size_GB", "Format_Identifications"],
+                    ["Low Risk", 4593, 479.83, 10],
+                    ["Moderate Risk", 37478, 605575.12, 11],
+                    ["High Risk", 168, 0.59, 6],
+                    ["No Match", 37, 0.01, 3]]
+        self.assertEqual(result, expected, "Problem with test for archive")
+
+    def test_same_as_groupby_risk(self):
+        """
+        Test that all five groupby_lists used for the risk spreadsheet have the same result as groupby_risk().
+        """
+        # Makes the variables used for function input.
+        df = read_dataframe()
+        groupby_lists = [['NARA_Risk_Level'], ['Group', 'NARA_Risk_Level'], ['Format_Type', 'NARA_Risk_Level'],
+                         ['NARA_Plan_Type', 'NARA_Risk_Level'], ['NARA_Match_Type']]
+
+        # Runs the function being tested and groupby_risk() for each groupby_list, converting each into a list.
+        batch = groupby_risk_batch(df, groupby_lists)
+        result = [[risk.columns.tolist()] + risk.values.tolist() for risk in batch]
+        expected = []
+        for groupby_list in groupby_lists:
+            risk = groupby_risk(df, groupby_list)
+            expected.append([risk.columns.tolist()] + risk.values.tolist())
+
+        # Tests if the function output is the same as groupby_risk().
+        self.assertEqual(result, expected, "Problem with test for same as groupby_risk")
+
+
+if __name__ == '__main__':
+    unittest.main()
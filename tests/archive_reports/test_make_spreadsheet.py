@@ -0,0 +1,260 @@
+"""
+Tests for the function make_spreadsheet(),
+which reads the ARCHive format reports needed for one spreadsheet and makes that spreadsheet.
+It is what each worker runs when the spreadsheets are made at the same time.
+
+Input variations for the content of the spreadsheets are tested with the spreadsheet_* functions.
+"""
+import csv
+import os
+import pandas as pd
+import pickle
+import shutil
+import unittest
+from archive_reports import make_spreadsheet
+from merge_format_reports import save_aggregates, update_aggregates
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the Excel spreadsheets and cache folder produced by the function, if they are made by the test."""
+        for file_name in ("ARCHive-Formats-Analysis_Frequency.xlsx", "ARCHive-Formats-Analysis_Ranges.xlsx",
+                          "ARCHive-Formats-Analysis_Risk.xlsx"):
+            file_path = os.path.join("make_spreadsheet", file_name)
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        for folder in ("cache", "frequency_input"):
+            if os.path.exists(os.path.join("make_spreadsheet", folder)):
+                shutil.rmtree(os.path.join("make_spreadsheet", folder))
+        if os.path.exists(os.path.join("usage_trend", "ARCHive-Formats-Analysis_Usage-Trend.xlsx")):
+            os.remove(os.path.join("usage_trend", "ARCHive-Formats-Analysis_Usage-Trend.xlsx"))
+        if os.path.exists(os.path.join("usage_trend", "cache")):
+            shutil.rmtree(os.path.join("usage_trend", "cache"))
+
+    def test_cache_aggregates(self):
+        """
+        Test for making the frequency spreadsheet a second time with the cache, after an aggregates CSV was saved,
+        which is a different input, so the summaries are calculated again.
+        """
+        # Makes a copy of the input files, so the aggregates CSV can be added without changing the test files.
+        input_folder = os.path.join("make_spreadsheet", "frequency_input")
+        shutil.copytree("spreadsheet_frequency", input_folder)
+        aip_path = os.path.join(input_folder, "archive_formats_by_aip_2023-08.csv")
+        group_path = os.path.join(input_folder, "archive_formats_by_group_2023-08.csv")
+        usage_path = os.path.join(input_folder, "usage_report_20171101_20211101.csv")
+        cache_folder = os.path.join("make_spreadsheet", "cache")
+        cache_path = os.path.join(cache_folder, "frequency.pickle")
+
+        # Runs the function being tested, saves an aggregates CSV newer than the by_aip CSV,
+        # and runs the function again, getting the cache key each time.
+        make_spreadsheet("frequency", aip_path, group_path, usage_path, "make_spreadsheet", cache_folder=cache_folder)
+        with open(cache_path, 'rb') as cache_open:
+            first_key = pickle.load(cache_open)['key']
+        aggregates = {}
+        with open(aip_path, newline="") as aip_open:
+            aip_read = csv.reader(aip_open)
+            next(aip_read)
+            update_aggregates(aggregates, aip_read)
+        aggregates_path = os.path.join(input_folder, "archive_formats_aggregates_2023-08.csv")
+        save_aggregates(aggregates_path, aggregates)
+        os.utime(aggregates_path, (os.path.getmtime(aip_path) + 60, os.path.getmtime(aip_path) + 60))
+        make_spreadsheet("frequency", aip_path, group_path, usage_path, "make_spreadsheet", cache_folder=cache_folder)
+        with open(cache_path, 'rb') as cache_open:
+            second_key = pickle.load(cache_open)['key']
+
+        # Tests if the cache key changed.
+        self.assertNotEqual(first_key, second_key, "Problem with test for cache aggregates")
+
+    def test_cache_aggregates_by_aip(self):
+        """
+        Test for making the frequency spreadsheet a second time with the cache, when an aggregates CSV is used
+        and the by_aip CSV changed but is still older than the aggregates CSV,
+        which does not change the key since the by_aip CSV is not read.
+        """
+        # Makes a copy of the input files with an aggregates CSV newer than the by_aip CSV.
+        input_folder = os.path.join("make_spreadsheet", "frequency_input")
+        shutil.copytree("spreadsheet_frequency", input_folder)
+        aip_path = os.path.join(input_folder, "archive_formats_by_aip_2023-08.csv")
+        group_path = os.path.join(input_folder, "archive_formats_by_group_2023-08.csv")
+        usage_path = os.path.join(input_folder, "usage_report_20171101_20211101.csv")
+        cache_folder = os.path.join("make_spreadsheet", "cache")
+        cache_path = os.path.join(cache_folder, "frequency.pickle")
+        aggregates = {}
+        with open(aip_path, newline="") as aip_open:
+            aip_read = csv.reader(aip_open)
+            next(aip_read)
+            update_aggregates(aggregates, aip_read)
+        aggregates_path = os.path.join(input_folder, "archive_formats_aggregates_2023-08.csv")
+        save_aggregates(aggregates_path, aggregates)
+        os.utime(aggregates_path, (os.path.getmtime(aip_path) + 60, os.path.getmtime(aip_path) + 60))
+
+        # Runs the function being tested, adds a row to the by_aip CSV without making it newer than the aggregates,
+        # and runs the function again, getting the cache key each time.
+        make_spreadsheet("frequency", aip_path, group_path, usage_path, "make_spreadsheet", cache_folder=cache_folder)
+        with open(cache_path, 'rb') as cache_open:
+            first_key = pickle.load(cache_open)['key']
+        aip_time = os.path.getmtime(aip_path)
+        with open(aip_path, "a", newline="") as aip_open:
+            aip_open.write("dlg,zhj_tecc,zhj_tecc_new,audio,Waveform Audio,Waveform Audio|NO VALUE|NO VALUE,"
+                           "Waveform Audio,NO VALUE,NO VALUE,NO VALUE,NO VALUE,No Match,,No Match,,No NARA Match\n")
+        os.utime(aip_path, (aip_time, aip_time))
+        make_spreadsheet("frequency", aip_path, group_path, usage_path, "make_spreadsheet", cache_folder=cache_folder)
+        with open(cache_path, 'rb') as cache_open:
+            second_key = pickle.load(cache_open)['key']
+
+        # Tests if the cache key is the same.
+        self.assertEqual(first_key, second_key, "Problem with test for cache aggregates by aip")
+
+    def test_cache_missing_spreadsheet(self):
+        """
+        Test for making the ranges spreadsheet a second time with the cache, after the spreadsheet was deleted,
+        which saves the spreadsheet from the cached summaries.
+        """
+        # Runs the function being tested, deletes the spreadsheet, and runs the function again.
+        group_path = os.path.join("make_spreadsheet", "archive_formats_by_group_2023-08.csv")
+        cache_folder = os.path.join("make_spreadsheet", "cache")
+        workbook_path = os.path.join("make_spreadsheet", "ARCHive-Formats-Analysis_Ranges.xlsx")
+        make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet", cache_folder=cache_folder)
+        df_first = pd.read_excel(workbook_path, "Format_ID_Sizes")
+        os.remove(workbook_path)
+        make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet", cache_folder=cache_folder)
+
+        # Tests if the spreadsheet was made again with the same values.
+        df_second = pd.read_excel(workbook_path, "Format_ID_Sizes")
+        result = [df_second.columns.tolist()] + df_second.values.tolist()
+        expected = [df_first.columns.tolist()] + df_first.values.tolist()
+        self.assertEqual(result, expected, "Problem with test for cache missing spreadsheet")
+
+    def test_cache_replaced_spreadsheet(self):
+        """
+        Test for making the ranges spreadsheet with the cache, after the spreadsheet was replaced by a run
+        without the cache, which saves the spreadsheet again from the cached summaries.
+        """
+        # Runs the function being tested with the cache, without the cache, and with the cache again,
+        # getting the time the spreadsheet was last changed after the run without the cache and the last run.
+        group_path = os.path.join("make_spreadsheet", "archive_formats_by_group_2023-08.csv")
+        cache_folder = os.path.join("make_spreadsheet", "cache")
+        workbook_path = os.path.join("make_spreadsheet", "ARCHive-Formats-Analysis_Ranges.xlsx")
+        make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet", cache_folder=cache_folder)
+        make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet")
+        replaced_time = os.stat(workbook_path).st_mtime_ns
+        make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet", cache_folder=cache_folder)
+        last_time = os.stat(workbook_path).st_mtime_ns
+
+        # Tests if the spreadsheet was saved again.
+        self.assertNotEqual(replaced_time, last_time, "Problem with test for cache replaced spreadsheet")
+
+    def test_cache_unchanged(self):
+        """
+        Test for making the ranges spreadsheet a second time with the cache, when nothing changed,
+        which does not save the spreadsheet again.
+        """
+        # Runs the function being tested twice, getting the time the spreadsheet was last changed each time.
+        group_path = os.path.join("make_spreadsheet", "archive_formats_by_group_2023-08.csv")
+        cache_folder = os.path.join("make_spreadsheet", "cache")
+        workbook_path = os.path.join("make_spreadsheet", "ARCHive-Formats-Analysis_Ranges.xlsx")
+        make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet", cache_folder=cache_folder)
+        first_time = os.stat(workbook_path).st_mtime_ns
+        name = make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet", cache_folder=cache_folder)
+        second_time = os.stat(workbook_path).st_mtime_ns
+
+        # Tests if the function returned the name of the spreadsheet and did not save the spreadsheet again.
+        self.assertEqual(name, "ranges", "Problem with test for cache unchanged, name")
+        self.assertEqual(first_time, second_time, "Problem with test for cache unchanged, spreadsheet")
+
+    def test_frequency_top_n(self):
+        """
+        Test for making the frequency spreadsheet with top_n, so the Format_IDs sheet only has the most common
+        format identifications and a row for the rest (Other).
+        """
+        # Runs the function being tested.
+        aip_path = os.path.join("spreadsheet_frequency", "archive_formats_by_aip_2023-08.csv")
+        group_path = os.path.join("spreadsheet_frequency", "archive_formats_by_group_2023-08.csv")
+        usage_path = os.path.join("spreadsheet_frequency", "usage_report_20171101_20211101.csv")
+        name = make_spreadsheet("frequency", aip_path, group_path, usage_path, "make_spreadsheet", top_n=2)
+
+        # Tests if the function returned the name of the spreadsheet.
+        self.assertEqual(name, "frequency", "Problem with test for frequency top n, name")
+
+        # Tests if the Format_IDs sheet has the top 2 format identifications and Other.
+        df = pd.read_excel(os.path.join("make_spreadsheet", "ARCHive-Formats-Analysis_Frequency.xlsx"), "Format_IDs")
+        result = [len(df), df.iloc[-1, 0]]
+        expected = [3, "Other"]
+        self.assertEqual(result, expected, "Problem with test for frequency top n, Format_IDs")
+
+    def test_ranges(self):
+        """
+        Test for making the ranges spreadsheet, which only needs archive_formats_by_group.csv.
+        The other report paths are None, so the test would error if the function tried to read them.
+        """
+        # Runs the function being tested.
+        group_path = os.path.join("make_spreadsheet", "archive_formats_by_group_2023-08.csv")
+        name = make_spreadsheet("ranges", None, group_path, None, "make_spreadsheet")
+
+        # Tests if the function returned the name of the spreadsheet.
+        self.assertEqual(name, "ranges", "Problem with test for ranges, name")
+
+        # Tests if the spreadsheet was made with the expected sheets.
+        result = pd.ExcelFile(os.path.join("make_spreadsheet", "ARCHive-Formats-Analysis_Ranges.xlsx"))
+        sheets = result.sheet_names
+        result.close()
+        expected = ["Format_Name_Ranges", "Format_Name_Sizes", "Format_ID_Ranges", "Format_ID_Sizes"]
+        self.assertEqual(sheets, expected, "Problem with test for ranges, sheets")
+
+    def test_risk(self):
+        """
+        Test for making the risk spreadsheet, which only reads the columns of archive_formats_by_group.csv it needs.
+        The other report paths are None, so the test would error if the function tried to read them.
+        """
+        # Runs the function being tested.
+        group_path = os.path.join("make_spreadsheet", "archive_formats_by_group_2023-08.csv")
+        name = make_spreadsheet("risk", None, group_path, None, "make_spreadsheet")
+
+        # Tests if the function returned the name of the spreadsheet.
+        self.assertEqual(name, "risk", "Problem with test for risk, name")
+
+        # Tests if the spreadsheet was made with the expected sheets.
+        result = pd.ExcelFile(os.path.join("make_spreadsheet", "ARCHive-Formats-Analysis_Risk.xlsx"))
+        sheets = result.sheet_names
+        result.close()
+        expected = ["ARCHive_Risk_Overview", "Department_Risk_Overview", "Format_Type_Risk", "NARA_Plan_Type_Risk",
+                    "NARA_Match_Types"]
+        self.assertEqual(sheets, expected, "Problem with test for risk, sheets")
+
+    def test_usage_trend(self):
+        """
+        Test for making the usage-trend spreadsheet with the cache, which uses every usage report in the
+        output folder and caches each one. The format report paths are None, so the test would error
+        if the function tried to read them.
+        """
+        # Runs the function being tested.
+        cache_folder = os.path.join("usage_trend", "cache")
+        name = make_spreadsheet("usage-trend", None, None, None, "usage_trend", cache_folder=cache_folder)
+
+        # Tests if the function returned the name of the spreadsheet.
+        self.assertEqual(name, "usage-trend", "Problem with test for usage trend, name")
+
+        # Tests if the spreadsheet was made with the expected sheets.
+        result = pd.ExcelFile(os.path.join("usage_trend", "ARCHive-Formats-Analysis_Usage-Trend.xlsx"))
+        sheets = result.sheet_names
+        result.close()
+        self.assertEqual(sheets, ["Usage_Trend", "Usage_Growth"], "Problem with test for usage trend, sheets")
+
+        # Tests if the cache has the spreadsheet and each usage report.
+        cache_files = sorted(os.listdir(cache_folder)) + sorted(os.listdir(os.path.join(cache_folder, "usage")))
+        expected = ["usage", "usage-trend.pickle", "usage_report_20210101_20211231.pickle",
+                    "usage_report_20220101_20221231.pickle", "usage_report_20230101_20231231.pickle"]
+        self.assertEqual(cache_files, expected, "Problem with test for usage trend, cache")
+
+    def test_unknown(self):
+        """
+        Test for a spreadsheet name that is not one of the four spreadsheets, which raises an error.
+        """
+        group_path = os.path.join("make_spreadsheet", "archive_formats_by_group_2023-08.csv")
+        with self.assertRaises(ValueError):
+            make_spreadsheet("formats", None, group_path, None, "make_spreadsheet")
+
+
+if __name__ == '__main__':
+    unittest.main()
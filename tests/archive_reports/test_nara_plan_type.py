@@ -0,0 +1,56 @@
+"""
+Tests for the function nara_plan_type(),
+which classifies each NARA preservation action plan into a type of plan.
+
+For input, tests use series made in the test. The plans are based on NARA's Digital Preservation Plan spreadsheet.
+"""
+import numpy as np
+import pandas as pd
+import unittest
+from archive_reports import nara_plan_type
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_all_types(self):
+        """
+        Test for a plan of each type, including a blank (No plan) and a plan that does not match any rule (Other).
+        """
+        # Makes the variable used for function input.
+        plans = pd.Series(["Depends on version. Transform 1.0 to 2.0",
+                           "Further research is required.",
+                           np.NaN,
+                           "Retain",
+                           "Retain but transform to PDF/A if possible",
+                           "Transform to TIFF",
+                           "Keep"])
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        result = nara_plan_type(plans).tolist()
+
+        # Tests if the function output has the expected values.
+        expected = ["Depends on version", "Further research required", "No plan", "Retain", "Retain but act",
+                    "Transform", "Other"]
+        self.assertEqual(result, expected, "Problem with test for all types")
+
+    def test_repeated_plans(self):
+        """
+        Test for plans that are repeated, which are classified once and copied to every row with that plan.
+        The index of the input is kept.
+        """
+        # Makes the variable used for function input.
+        plans = pd.Series(["Retain", "Transform to WAVE", "Retain", np.NaN, "Transform to WAVE", np.NaN],
+                          index=[10, 11, 12, 13, 14, 15])
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        plan_types = nara_plan_type(plans)
+        result = [plan_types.index.tolist(), plan_types.tolist()]
+
+        # Tests if the function output has the expected values.
+        expected = [[10, 11, 12, 13, 14, 15],
+                    ["Retain", "Transform", "Retain", "No plan", "Transform", "No plan"]]
+        self.assertEqual(result, expected, "Problem with test for repeated plans")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -62,5 +62,32 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(result, expected, "Problem with test for format type")
 
 
+    def test_aggregates(self):
+        """
+        Test for making the format standardized name subtotals with the collection and AIP counts
+        from the aggregates CSV made by merge_format_reports.py, instead of archive_formats_by_aip.csv.
+        The aggregates were made from archive_formats_by_aip_2003-01.csv, so the result is the same as that test.
+        """
+        # Makes the variables used for function input.
+        totals_dict = {'Collections': 7, 'AIPs': 11, 'Files': 2545, 'Size': 6100}
+        df_aggregates = pd.read_csv(os.path.join("one_category", "archive_formats_aggregates_2003-01.csv"))
+        df_formats_by_group = pd.read_csv(os.path.join("one_category", "archive_formats_by_group_2003-01.csv"))
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        format_names = one_category('Format_Standardized_Name', totals_dict, None, df_formats_by_group, df_aggregates)
+        result = [format_names.columns.tolist()] + format_names.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Collections", "Collections_Percentage", "AIPs", "AIPs_Percentage", "File_IDs",
+                     "File_IDs_Percentage", "Size_GB", "Size_GB_Percentage"],
+                    ["JP2", 1, 14.29, 2, 18.18, 190, 7.47, 776.817, 12.73],
+                    ["JPEG", 1, 14.29, 2, 18.18, 340, 13.36, 40.898, 0.67],
+                    ["Matroska", 2, 28.57, 2, 18.18, 555, 21.81, 3919.702, 64.26],
+                    ["TIFF", 3, 42.86, 5, 45.45, 1160, 45.58, 874.539, 14.34],
+                    ["WARC", 1, 14.29, 1, 9.09, 220, 8.64, 138.1, 2.26],
+                    ["Waveform Audio", 1, 14.29, 1, 9.09, 80, 3.14, 290.147, 4.76]]
+        self.assertEqual(result, expected, "Problem with test for aggregates")
+
+
 if __name__ == '__main__':
     unittest.main()
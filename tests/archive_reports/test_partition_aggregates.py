@@ -0,0 +1,59 @@
+"""
+Tests for the function partition_aggregates(),
+which calculates the unique counts from archive_formats_by_aip.csv by reading the CSV for each group.
+
+Test input is a CSV from another test folder, which is partitioned by the test with save_partitions()
+from merge_format_reports.py. The folder also has the aggregates CSV made by merge_format_reports.py
+from the same data, to check the result is the same as reading all of the CSV at once.
+"""
+import os
+import pandas as pd
+import shutil
+import unittest
+from archive_reports import partition_aggregates
+from merge_format_reports import get_partition_paths, save_partitions
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Saves the by_aip CSV as one CSV per group, to use for function input.
+        """
+        self.aip_csv = os.path.join("archive_overview", "archive_formats_by_aip_2023-08.csv")
+        save_partitions(self.aip_csv)
+
+    def tearDown(self):
+        """
+        Deletes the partition folder made by the test.
+        """
+        shutil.rmtree(os.path.join("archive_overview", "archive_formats_by_aip_2023-08"))
+
+    def test_all_partitions(self):
+        """
+        Test for reading every partition, which should be the same as the aggregates CSV made from all of the data.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        aggregates = partition_aggregates(get_partition_paths(self.aip_csv))
+        result = [aggregates.columns.tolist()] + aggregates.fillna("BLANK").values.tolist()
+
+        # Tests if the function output has the expected values.
+        df = pd.read_csv(os.path.join("archive_overview", "archive_formats_aggregates_2023-08.csv"))
+        expected = [df.columns.tolist()] + df.fillna("BLANK").values.tolist()
+        self.assertEqual(result, expected, "Problem with test for all partitions")
+
+    def test_one_partition(self):
+        """
+        Test for reading the partition for one group, which only has counts for that group.
+        """
+        # Runs the function being tested.
+        aggregates = partition_aggregates(get_partition_paths(self.aip_csv, ["bmac"]))
+
+        # Tests if the function output has the expected groups.
+        result = aggregates[aggregates['Category'] == 'Group']['Instance'].tolist()
+        expected = ["bmac"]
+        self.assertEqual(result, expected, "Problem with test for one partition")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the function range_counts(),
+which counts the number of values within each range defined by a list of edges.
+
+For input, tests use series made in the test, since the function only needs a list of numbers.
+"""
+
+import numpy as np
+import pandas as pd
+import unittest
+from archive_reports import range_counts
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_edges(self):
+        """
+        Test for values that are equal to an edge, which are in the range that starts with that edge.
+        """
+        # Makes the variable used for function input.
+        values = pd.Series([9, 10, 99, 100, 999, 1000])
+
+        # Runs the function being tested.
+        result = range_counts(values, [10, 100, 1000], ["1-9", "10-99", "100-999", "1000+"])
+
+        # Tests if the function output has the expected values.
+        expected = [1, 2, 2, 1]
+        self.assertEqual(result, expected, "Problem with test for edges")
+
+    def test_empty_ranges(self):
+        """
+        Test for ranges without any values, including the first and last range, which should be 0.
+        """
+        # Makes the variable used for function input.
+        values = pd.Series([25.5, 50, 75.25])
+
+        # Runs the function being tested.
+        result = range_counts(values, [10, 100], ["0-9 GB", "10-99 GB", "100+ GB"])
+
+        # Tests if the function output has the expected values.
+        expected = [0, 3, 0]
+        self.assertEqual(result, expected, "Problem with test for empty ranges")
+
+    def test_fine_ranges(self):
+        """
+        Test for a larger number of ranges, in this case log-scale ranges with two per power of ten.
+        """
+        # Makes the variable used for function input.
+        values = pd.Series([1, 4, 5, 12, 60, 300, 700, 5000])
+
+        # Runs the function being tested.
+        edges = [5, 10, 50, 100, 500, 1000]
+        labels = ["1-4", "5-9", "10-49", "50-99", "100-499", "500-999", "1000+"]
+        result = range_counts(values, edges, labels)
+
+        # Tests if the function output has the expected values.
+        expected = [2, 1, 1, 1, 1, 1, 1]
+        self.assertEqual(result, expected, "Problem with test for fine ranges")
+
+    def test_blank(self):
+        """
+        Test for a blank value, which is not counted in any range.
+        """
+        # Makes the variable used for function input.
+        values = pd.Series([5, np.NaN, 500])
+
+        # Runs the function being tested.
+        result = range_counts(values, [10, 100], ["1-9", "10-99", "100+"])
+
+        # Tests if the function output has the expected values.
+        expected = [1, 0, 1]
+        self.assertEqual(result, expected, "Problem with test for blank")
+
+
+if __name__ == '__main__':
+    unittest.main()
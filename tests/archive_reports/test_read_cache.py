@@ -0,0 +1,81 @@
+"""
+Tests for the function read_cache(),
+which reads the summaries for a spreadsheet saved with save_cache() if the key has not changed.
+
+For input, tests use dataframes made in the test, which are saved to a cache folder deleted after each test.
+"""
+import os
+import pandas as pd
+import shutil
+import unittest
+from archive_reports import read_cache, save_cache
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the cache folder made by the test, if it was made."""
+        if os.path.exists("read_cache_test"):
+            shutil.rmtree("read_cache_test")
+
+    def test_same_key(self):
+        """
+        Test for reading the cache with the key it was saved with, which returns the sheets.
+        """
+        # Makes the cache used for function input.
+        cache_path = os.path.join("read_cache_test", "risk.pickle")
+        df = pd.DataFrame({"NARA_Risk_Level": ["Low Risk", "High Risk"], "File_IDs": [5, 10]})
+        save_cache(cache_path, "key1", [(df, "ARCHive_Risk_Overview", {"index": False})])
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        sheets = read_cache(cache_path, "key1")
+        result = [[sheet_name, options, df.values.tolist()] for df, sheet_name, options in sheets]
+
+        # Tests if the function output has the expected values.
+        expected = [["ARCHive_Risk_Overview", {"index": False}, [["Low Risk", 5], ["High Risk", 10]]]]
+        self.assertEqual(result, expected, "Problem with test for same key")
+
+    def test_different_key(self):
+        """
+        Test for reading the cache with a different key than it was saved with, which returns None.
+        """
+        # Makes the cache used for function input.
+        cache_path = os.path.join("read_cache_test", "risk.pickle")
+        df = pd.DataFrame({"NARA_Risk_Level": ["Low Risk", "High Risk"], "File_IDs": [5, 10]})
+        save_cache(cache_path, "key1", [(df, "ARCHive_Risk_Overview", {"index": False})])
+
+        # Runs the function being tested.
+        sheets = read_cache(cache_path, "key2")
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(sheets, None, "Problem with test for different key")
+
+    def test_no_cache(self):
+        """
+        Test for reading a cache that was not made, which returns None.
+        """
+        # Runs the function being tested.
+        sheets = read_cache(os.path.join("read_cache_test", "risk.pickle"), "key1")
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(sheets, None, "Problem with test for no cache")
+
+    def test_not_readable(self):
+        """
+        Test for a cache file that cannot be read, which returns None.
+        """
+        # Makes the cache used for function input.
+        os.mkdir("read_cache_test")
+        cache_path = os.path.join("read_cache_test", "risk.pickle")
+        with open(cache_path, "w") as cache_open:
+            cache_open.write("not a pickle")
+
+        # Runs the function being tested.
+        sheets = read_cache(cache_path, "key1")
+
+        # Tests if the function output has the expected value.
+        self.assertEqual(sheets, None, "Problem with test for not readable")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+"""
+Test for the function read_usage(),
+which finds the number of files and size of each group in the usage report, with the size converted to TB.
+
+For input, tests use files in the archive_reports folder of this script repo.
+Variations in size units are tested with size_in_tb(), which uses this function.
+"""
+
+import os
+import unittest
+from archive_reports import read_usage
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_usage_report(self):
+        """
+        Test for a usage report with rows for groups, users, and blank rows.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        usage_df = read_usage(os.path.join("usage_trend", "usage_report_20210101_20211231.csv"))
+        result = [usage_df.columns.tolist()] + usage_df.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Files", "Size"], ["bmac", 100, 2.0], ["hargrett", 50, 0.5]]
+        self.assertEqual(result, expected, "Problem with test for usage report")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ For input, tests use files in the archive_reports folder of this script repo.
 """
 import os
 import pandas as pd
+import shutil
 import subprocess
 import unittest
 
@@ -14,7 +15,7 @@ class MyTestCase(unittest.TestCase):
 
     def tearDown(self):
         """
-        Deletes the Excel spreadsheets produced by the script, if made by the test.
+        Deletes the Excel spreadsheets and the cache folder produced by the script, if made by the test.
         """
         file_paths = [os.path.join("script", "ARCHive-Formats-Analysis_Frequency.xlsx"),
                       os.path.join("script", "ARCHive-Formats-Analysis_Group-Overlap.xlsx"),
@@ -25,6 +26,9 @@ class MyTestCase(unittest.TestCase):
             if os.path.exists(file_path):
                 os.remove(file_path)
 
+        if os.path.exists(os.path.join("script", "archive_reports_cache")):
+            shutil.rmtree(os.path.join("script", "archive_reports_cache"))
+
     def test_script(self):
         """
         Test for running the script on a report_folder with all expected archive_reports,
@@ -129,7 +133,7 @@ class MyTestCase(unittest.TestCase):
         # Tests if the Groups per Name sheet has the expected values.
         result_group_name = [df_group_name.columns.tolist()] + df_group_name.values.tolist()
         expected_group_name = [["Format_Standardized_Name", "Groups", "Group_List"],
-                               ["JPEG", 2, "hargrett, dlg"],
+                               ["JPEG", 2, "dlg, hargrett"],
                                ["Matroska", 2, "bmac, dlg"],
                                ["TIFF", 2, "dlg, hargrett"],
                                ["JP2", 1, "dlg"],
@@ -280,6 +284,22 @@ class MyTestCase(unittest.TestCase):
                           ["PRONOM and Version", 5240, 4.67, 4]]
         self.assertEqual(result_match, expected_match, "Problem with test for correct input, NARA Match Types")
 
+    def test_one_spreadsheet(self):
+        """
+        Test for running the script with the optional argument to only make the risk spreadsheet.
+        """
+        # Runs the script.
+        script_path = os.path.join("..", "..", "archive_reports.py")
+        subprocess.run(f"python {script_path} script risk", shell=True)
+
+        # Tests that only the risk spreadsheet was made.
+        result = [os.path.exists(os.path.join("script", "ARCHive-Formats-Analysis_Frequency.xlsx")),
+                  os.path.exists(os.path.join("script", "ARCHive-Formats-Analysis_Group-Overlap.xlsx")),
+                  os.path.exists(os.path.join("script", "ARCHive-Formats-Analysis_Ranges.xlsx")),
+                  os.path.exists(os.path.join("script", "ARCHive-Formats-Analysis_Risk.xlsx"))]
+        expected = [False, False, False, True]
+        self.assertEqual(result, expected, "Problem with test for one spreadsheet")
+
     def test_missing_argument(self):
         """
         Test for running the script without the required argument.
@@ -295,7 +315,7 @@ class MyTestCase(unittest.TestCase):
         output = subprocess.run(f"python {script_path}", shell=True, stdout=subprocess.PIPE)
         msg_result = output.stdout.decode("utf-8")
         msg_expected = "Required argument report_folder is missing\r\n" \
-                       "Script usage: python path/archive_reports.py report_folder\r\n"
+                       "Script usage: python path/archive_reports.py report_folder [spreadsheet ...] [top=N]\r\n"
         self.assertEqual(msg_result, msg_expected, "Problem with test for missing argument, message")
 
     def test_missing_input(self):
@@ -0,0 +1,58 @@
+"""
+Test for the function spreadsheet_usage_trend(),
+which makes a spreadsheet with the files and size of each group in several usage reports,
+and the total size of each group at the end of each period.
+"""
+import os
+import pandas as pd
+import unittest
+from archive_reports import get_usage_paths, spreadsheet_usage_trend
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the Excel spreadsheet produced by the function, if it is made by the test."""
+        file_path = os.path.join("usage_trend", "ARCHive-Formats-Analysis_Usage-Trend.xlsx")
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    def test_spreadsheet_usage_trend(self):
+        """
+        Test for the function working correctly.
+        Variations of input are tested with usage_trend() and usage_growth().
+        """
+        # Runs the function being tested.
+        spreadsheet_usage_trend(get_usage_paths("usage_trend"), "usage_trend")
+
+        # Reads the entire Excel file into pandas, and then each sheet into a separate dataframe.
+        # Reading all the sheets at once so the Excel file can be closed,
+        # allowing it to be deleted even if there are errors during the tests.
+        result = pd.ExcelFile(os.path.join("usage_trend", "ARCHive-Formats-Analysis_Usage-Trend.xlsx"))
+        df_trend = pd.read_excel(result, "Usage_Trend")
+        df_growth = pd.read_excel(result, "Usage_Growth")
+        result.close()
+
+        # Tests the values in the Usage_Trend sheet are correct.
+        result_trend = [df_trend.columns.tolist()] + df_trend.values.tolist()
+        expected_trend = [["Period_Start", "Period_End", "Group", "Size_TB", "Files"],
+                          ["2021-01-01", "2021-12-31", "bmac", 2.0, 100],
+                          ["2021-01-01", "2021-12-31", "hargrett", 0.5, 50],
+                          ["2022-01-01", "2022-12-31", "dlg", 0.25, 10],
+                          ["2022-01-01", "2022-12-31", "hargrett", 1.5, 25],
+                          ["2023-01-01", "2023-12-31", "bmac", 3.25, 200],
+                          ["2023-01-01", "2023-12-31", "hargrett", 0.01, 5]]
+        self.assertEqual(result_trend, expected_trend, "Problem with test for Usage_Trend")
+
+        # Tests the values in the Usage_Growth sheet are correct.
+        result_growth = [df_growth.columns.tolist()] + df_growth.values.tolist()
+        expected_growth = [["Group", "2021-12-31", "2022-12-31", "2023-12-31"],
+                           ["bmac", 2.0, 2.0, 5.25],
+                           ["dlg", 0.0, 0.25, 0.25],
+                           ["hargrett", 0.5, 2.0, 2.01],
+                           ["total", 2.5, 4.25, 7.51]]
+        self.assertEqual(result_growth, expected_growth, "Problem with test for Usage_Growth")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for the function usage_growth(),
+which calculates the total size of each group at the end of each period from the usage trend.
+
+For input, tests use dataframes made in the test, with the same columns as the output of usage_trend().
+"""
+
+import pandas as pd
+import unittest
+from archive_reports import usage_growth
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_growth(self):
+        """
+        Test for three periods, including a group that is not in every period.
+        """
+        # Makes the variable used for function input.
+        trend = pd.DataFrame([["2021-01-01", "2021-12-31", "bmac", 2.0, 100],
+                              ["2021-01-01", "2021-12-31", "hargrett", 0.5, 50],
+                              ["2022-01-01", "2022-12-31", "dlg", 0.25, 10],
+                              ["2022-01-01", "2022-12-31", "hargrett", 1.5, 25],
+                              ["2023-01-01", "2023-12-31", "bmac", 3.25, 200],
+                              ["2023-01-01", "2023-12-31", "hargrett", 0.01, 5]],
+                             columns=["Period_Start", "Period_End", "Group", "Size_TB", "Files"])
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        growth = usage_growth(trend)
+        result = [growth.columns.tolist()] + growth.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["2021-12-31", "2022-12-31", "2023-12-31"],
+                    ["bmac", 2.0, 2.0, 5.25],
+                    ["dlg", 0.0, 0.25, 0.25],
+                    ["hargrett", 0.5, 2.0, 2.01],
+                    ["total", 2.5, 4.25, 7.51]]
+        self.assertEqual(result, expected, "Problem with test for growth")
+
+    def test_one_period(self):
+        """
+        Test for one period, which is the same as the size in that period.
+        """
+        # Makes the variable used for function input.
+        trend = pd.DataFrame([["2021-01-01", "2021-12-31", "bmac", 2.0, 100],
+                              ["2021-01-01", "2021-12-31", "hargrett", 0.5, 50]],
+                             columns=["Period_Start", "Period_End", "Group", "Size_TB", "Files"])
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        growth = usage_growth(trend)
+        result = [growth.columns.tolist()] + growth.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["2021-12-31"], ["bmac", 2.0], ["hargrett", 0.5], ["total", 2.5]]
+        self.assertEqual(result, expected, "Problem with test for one period")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Tests for the function usage_trend(),
+which combines the files and size of each group from several usage reports into one dataframe.
+
+For input, tests use files in the archive_reports folder of this script repo.
+"""
+
+import os
+import shutil
+import unittest
+from archive_reports import get_usage_paths, usage_trend
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the cache folder made by the test, if it was made."""
+        if os.path.exists(os.path.join("usage_trend", "cache")):
+            shutil.rmtree(os.path.join("usage_trend", "cache"))
+
+    def test_trend(self):
+        """
+        Test for three usage reports, each for one year, without a cache.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        trend = usage_trend(get_usage_paths("usage_trend"))
+        result = [trend.columns.tolist()] + trend.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Period_Start", "Period_End", "Group", "Size_TB", "Files"],
+                    ["2021-01-01", "2021-12-31", "bmac", 2.0, 100],
+                    ["2021-01-01", "2021-12-31", "hargrett", 0.5, 50],
+                    ["2022-01-01", "2022-12-31", "dlg", 0.25, 10],
+                    ["2022-01-01", "2022-12-31", "hargrett", 1.5, 25],
+                    ["2023-01-01", "2023-12-31", "bmac", 3.25, 200],
+                    ["2023-01-01", "2023-12-31", "hargrett", 0.01, 5]]
+        self.assertEqual(result, expected, "Problem with test for trend")
+
+    def test_cache(self):
+        """
+        Test for three usage reports with a cache, run twice so the second time uses the cache.
+        """
+        # Runs the function being tested twice and converts the output into a list for easier comparison.
+        cache_folder = os.path.join("usage_trend", "cache")
+        usage_trend(get_usage_paths("usage_trend"), cache_folder)
+        trend = usage_trend(get_usage_paths("usage_trend"), cache_folder)
+        result = [trend.columns.tolist()] + trend.values.tolist()
+
+        # Tests if the cache has a file for each usage report.
+        cache_files = sorted(os.listdir(cache_folder))
+        expected_files = ["usage_report_20210101_20211231.pickle", "usage_report_20220101_20221231.pickle",
+                          "usage_report_20230101_20231231.pickle"]
+        self.assertEqual(cache_files, expected_files, "Problem with test for cache, cache files")
+
+        # Tests if the function output has the expected values.
+        expected = [["Period_Start", "Period_End", "Group", "Size_TB", "Files"],
+                    ["2021-01-01", "2021-12-31", "bmac", 2.0, 100],
+                    ["2021-01-01", "2021-12-31", "hargrett", 0.5, 50],
+                    ["2022-01-01", "2022-12-31", "dlg", 0.25, 10],
+                    ["2022-01-01", "2022-12-31", "hargrett", 1.5, 25],
+                    ["2023-01-01", "2023-12-31", "bmac", 3.25, 200],
+                    ["2023-01-01", "2023-12-31", "hargrett", 0.01, 5]]
+        self.assertEqual(result, expected, "Problem with test for cache, trend")
+
+    def test_none(self):
+        """
+        Test for no usage reports, which is a dataframe with only the columns.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        trend = usage_trend([])
+        result = [trend.columns.tolist()] + trend.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Period_Start", "Period_End", "Group", "Size_TB", "Files"]]
+        self.assertEqual(result, expected, "Problem with test for none")
+
+
+if __name__ == '__main__':
+    unittest.main()
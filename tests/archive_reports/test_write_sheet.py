@@ -0,0 +1,147 @@
+"""
+Tests for the function write_sheet(),
+which saves a dataframe as a sheet in a write-only Excel workbook, one chunk of rows at a time.
+
+For input, tests use dataframes made in the test.
+The spreadsheet is saved to the folder with the tests and deleted after each test.
+"""
+import os
+import pandas as pd
+import unittest
+from archive_reports import write_sheet
+from openpyxl import Workbook
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the Excel spreadsheet produced by the test, if it was made."""
+        if os.path.exists("write_sheet_test.xlsx"):
+            os.remove("write_sheet_test.xlsx")
+
+    def test_index_label(self):
+        """
+        Test for a sheet that includes the index, with an index label.
+        """
+        # Runs the function being tested.
+        df = pd.DataFrame({"File_IDs": [5, 10], "Size_GB": [1.5, 2.25]}, index=["bmac", "dlg"])
+        workbook = Workbook(write_only=True)
+        write_sheet(workbook, df, "Test", index_label="Group")
+        workbook.save("write_sheet_test.xlsx")
+
+        # Tests if the sheet has the expected values.
+        df_result = pd.read_excel("write_sheet_test.xlsx", "Test")
+        result = [df_result.columns.tolist()] + df_result.values.tolist()
+        expected = [["Group", "File_IDs", "Size_GB"],
+                    ["bmac", 5, 1.5],
+                    ["dlg", 10, 2.25]]
+        self.assertEqual(result, expected, "Problem with test for index label")
+
+    def test_multiindex_columns(self):
+        """
+        Test for a sheet with multiple levels of columns, which are saved the same way as pandas to_excel().
+        The output of this test was compared to the output of to_excel(), which merges the repeated labels.
+        """
+        # Runs the function being tested.
+        columns = pd.MultiIndex.from_tuples([("Format_Name", "Low Risk", "JPEG"), ("Format_Name", "Low Risk", "TIFF"),
+                                             ("Format_Name", "High Risk", "GZIP")], names=[None, "Risk", "Format"])
+        df = pd.DataFrame([[True, False, True], [False, True, False]], columns=columns,
+                          index=pd.Index(["coll-1", "coll-2"], name="Collection"))
+        workbook = Workbook(write_only=True)
+        write_sheet(workbook, df, "Test")
+        workbook.save("write_sheet_test.xlsx")
+
+        # Tests if the sheet has the expected values.
+        df_result = pd.read_excel("write_sheet_test.xlsx", "Test")
+        expected_df = df.copy()
+        expected_df.to_excel("write_sheet_test.xlsx", sheet_name="Test")
+        df_expected = pd.read_excel("write_sheet_test.xlsx", "Test")
+        result = [df_result.columns.tolist()] + df_result.values.tolist()
+        expected = [df_expected.columns.tolist()] + df_expected.values.tolist()
+        self.assertEqual(result, expected, "Problem with test for multiindex columns")
+
+    def test_no_index_chunks(self):
+        """
+        Test for a sheet without the index, written in chunks smaller than the number of rows.
+        Includes a categorical column, which is saved as the labels.
+        """
+        # Runs the function being tested.
+        risk_order = ["Low Risk", "High Risk", "No Match"]
+        risk = pd.Categorical(["Low Risk", "No Match", "High Risk"], risk_order, ordered=True)
+        df = pd.DataFrame({"NARA_Risk_Level": risk, "File_IDs": [1, 2, 3]})
+        workbook = Workbook(write_only=True)
+        write_sheet(workbook, df, "Test", index=False, chunk_size=2)
+        workbook.save("write_sheet_test.xlsx")
+
+        # Tests if the sheet has the expected values.
+        df_result = pd.read_excel("write_sheet_test.xlsx", "Test")
+        result = [df_result.columns.tolist()] + df_result.values.tolist()
+        expected = [["NARA_Risk_Level", "File_IDs"],
+                    ["Low Risk", 1],
+                    ["No Match", 2],
+                    ["High Risk", 3]]
+        self.assertEqual(result, expected, "Problem with test for no index, chunks")
+
+
+    def test_shard_columns(self):
+        """
+        Test for a dataframe with more columns than fit in a sheet, which is split across numbered sheets.
+        Each sheet includes the index.
+        """
+        # Runs the function being tested.
+        # With max_columns of 3, there are 2 dataframe columns per sheet after the index column.
+        df = pd.DataFrame([[1, 2, 3], [4, 5, 6]], columns=["A", "B", "C"], index=pd.Index(["x", "y"], name="Row"))
+        workbook = Workbook(write_only=True)
+        write_sheet(workbook, df, "Test", max_columns=3)
+        workbook.save("write_sheet_test.xlsx")
+
+        # Tests if the spreadsheet has the expected sheets.
+        excel = pd.ExcelFile("write_sheet_test.xlsx")
+        sheets = excel.sheet_names
+        df_index = pd.read_excel(excel, "Test_Index")
+        df_1 = pd.read_excel(excel, "Test_1")
+        df_2 = pd.read_excel(excel, "Test_2")
+        excel.close()
+        self.assertEqual(sheets, ["Test_Index", "Test_1", "Test_2"], "Problem with test for shard columns, sheets")
+
+        # Tests if each sheet has the expected values.
+        result = [df_index.values.tolist(), df_1.values.tolist(), df_2.values.tolist()]
+        expected = [[["Test_1", 1, 2, 1, 2], ["Test_2", 1, 2, 3, 3]],
+                    [["x", 1, 2], ["y", 4, 5]],
+                    [["x", 3], ["y", 6]]]
+        self.assertEqual(result, expected, "Problem with test for shard columns, values")
+
+    def test_shard_rows(self):
+        """
+        Test for a dataframe with more rows than fit in a sheet, which is split across numbered sheets.
+        Each sheet includes the header.
+        """
+        # Runs the function being tested.
+        # With max_rows of 3, there are 2 dataframe rows per sheet after the header.
+        df = pd.DataFrame({"AIP": ["aip-1", "aip-2", "aip-3", "aip-4", "aip-5"], "Formats": [1, 2, 3, 4, 5]})
+        workbook = Workbook(write_only=True)
+        write_sheet(workbook, df, "Test", index=False, max_rows=3)
+        workbook.save("write_sheet_test.xlsx")
+
+        # Tests if the spreadsheet has the expected sheets.
+        excel = pd.ExcelFile("write_sheet_test.xlsx")
+        sheets = excel.sheet_names
+        df_index = pd.read_excel(excel, "Test_Index")
+        df_sheets = [pd.read_excel(excel, f"Test_{number}") for number in (1, 2, 3)]
+        excel.close()
+        expected_sheets = ["Test_Index", "Test_1", "Test_2", "Test_3"]
+        self.assertEqual(sheets, expected_sheets, "Problem with test for shard rows, sheets")
+
+        # Tests if each sheet has the expected values.
+        result = [[df_index.columns.tolist()] + df_index.values.tolist()]
+        result += [[df_sheet.columns.tolist()] + df_sheet.values.tolist() for df_sheet in df_sheets]
+        expected = [[["Sheet", "First_Row", "Last_Row", "First_Column", "Last_Column"],
+                     ["Test_1", 1, 2, 1, 2], ["Test_2", 3, 4, 1, 2], ["Test_3", 5, 5, 1, 2]],
+                    [["AIP", "Formats"], ["aip-1", 1], ["aip-2", 2]],
+                    [["AIP", "Formats"], ["aip-3", 3], ["aip-4", 4]],
+                    [["AIP", "Formats"], ["aip-5", 5]]]
+        self.assertEqual(result, expected, "Problem with test for shard rows, values")
+
+
+if __name__ == '__main__':
+    unittest.main()
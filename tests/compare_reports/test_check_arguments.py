@@ -0,0 +1,72 @@
+"""
+Tests for the function check_arguments(),
+which verifies both required arguments are present and correct.
+
+For input, tests use lists with the same format as sys.argv and files in the compare_reports folder of this script repo.
+"""
+
+import os
+import unittest
+from compare_reports import check_arguments
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_correct(self):
+        """
+        Test for two by_group reports that exist.
+        """
+        # Runs the function being tested.
+        csv_1 = os.path.join("script", "archive_formats_by_group_2021-11.csv")
+        csv_2 = os.path.join("script", "archive_formats_by_group_2023-11.csv")
+        previous_path, current_path, errors = check_arguments(["compare_reports.py", csv_1, csv_2])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(previous_path, csv_1, "Problem with test for correct, previous_path")
+        self.assertEqual(current_path, csv_2, "Problem with test for correct, current_path")
+        self.assertEqual(errors, [], "Problem with test for correct, errors")
+
+    def test_missing(self):
+        """
+        Test for no arguments.
+        """
+        # Runs the function being tested.
+        previous_path, current_path, errors = check_arguments(["compare_reports.py"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(previous_path, None, "Problem with test for missing, previous_path")
+        self.assertEqual(current_path, None, "Problem with test for missing, current_path")
+        expected = ["Required argument previous_formats_csv is missing",
+                    "Required argument current_formats_csv is missing"]
+        self.assertEqual(errors, expected, "Problem with test for missing, errors")
+
+    def test_path_errors(self):
+        """
+        Test for a previous_formats_csv that does not exist and a current_formats_csv that is the wrong type.
+        """
+        # Runs the function being tested.
+        csv_1 = os.path.join("script", "archive_formats_by_group_2019-11.csv")
+        previous_path, current_path, errors = check_arguments(["compare_reports.py", csv_1, "test_check_arguments.py"])
+
+        # Tests if the function output has the expected values.
+        expected = [f"previous_formats_csv '{csv_1}' does not exist",
+                    "'test_check_arguments.py' is not the correct type "
+                    "(should be archive_formats_by_group_YYYY-MM.csv or archive_formats_by_aip_YYYY-MM.csv)"]
+        self.assertEqual(errors, expected, "Problem with test for path errors, errors")
+
+    def test_different_types(self):
+        """
+        Test for a by_group report and a by_aip report, which cannot be compared.
+        """
+        # Runs the function being tested.
+        csv_1 = os.path.join("script", "archive_formats_by_group_2021-11.csv")
+        csv_2 = os.path.join("script", "archive_formats_by_aip_2023-11.csv")
+        previous_path, current_path, errors = check_arguments(["compare_reports.py", csv_1, csv_2])
+
+        # Tests if the function output has the expected values.
+        expected = ["previous_formats_csv and current_formats_csv must both be by_group or both be by_aip reports"]
+        self.assertEqual(errors, expected, "Problem with test for different types, errors")
+
+
+if __name__ == '__main__':
+    unittest.main()
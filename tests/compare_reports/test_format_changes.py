@@ -0,0 +1,104 @@
+"""
+Tests for the function format_changes(),
+which compares the amount of each format identification for each group between two merged format reports.
+
+For input, tests use dataframes made in the test, since the function only needs a few columns.
+"""
+
+import pandas as pd
+import unittest
+from compare_reports import format_changes
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_by_group(self):
+        """
+        Test for by_group reports, with each type of change and a format identification that is unchanged.
+        """
+        # Makes the variables used for function input.
+        columns = ["Group", "Format_Identification", "File_IDs", "Size_GB"]
+        df_previous = pd.DataFrame([["dlg", "PDF|1.4|fmt/18", 50, 1.1],
+                                    ["dlg", "TIFF|6.0|NO VALUE", 2000, 80.25],
+                                    ["hargrett", "TIFF|6.0|NO VALUE", 10, 0.5]], columns=columns)
+        df_current = pd.DataFrame([["dlg", "JPEG|1.01|fmt/43", 5, 0.01],
+                                   ["dlg", "TIFF|6.0|NO VALUE", 3000, 120.5],
+                                   ["hargrett", "TIFF|6.0|NO VALUE", 10, 0.5]], columns=columns)
+
+        # Runs the function being tested.
+        changes = format_changes(df_previous, df_current, ["File_IDs", "Size_GB"])
+
+        # Tests if the function output has the expected values.
+        result = [changes.columns.tolist()] + changes.values.tolist()
+        expected = [["Group", "Format_Identification", "Change", "Previous_File_IDs", "Current_File_IDs",
+                     "File_IDs_Change", "Previous_Size_GB", "Current_Size_GB", "Size_GB_Change"],
+                    ["dlg", "JPEG|1.01|fmt/43", "Appeared", 0, 5, 5, 0.0, 0.01, 0.01],
+                    ["dlg", "PDF|1.4|fmt/18", "Disappeared", 50, 0, -50, 1.1, 0.0, -1.1],
+                    ["dlg", "TIFF|6.0|NO VALUE", "Changed", 2000, 3000, 1000, 80.25, 120.5, 40.25]]
+        self.assertEqual(result, expected, "Problem with test for by group")
+
+    def test_by_aip(self):
+        """
+        Test for by_aip reports, where the amount is the number of AIPs.
+        """
+        # Makes the variables used for function input.
+        columns = ["Group", "AIP", "Format_Identification"]
+        df_previous = pd.DataFrame([["dlg", "dlg_1", "PDF|1.4|fmt/18"], ["dlg", "dlg_1", "TIFF|6.0|NO VALUE"],
+                                    ["dlg", "dlg_2", "TIFF|6.0|NO VALUE"], ["hargrett", "harg_1", "TIFF|6.0|NO VALUE"]],
+                                   columns=columns)
+        df_current = pd.DataFrame([["dlg", "dlg_1", "PDF|1.4|fmt/18"], ["dlg", "dlg_1", "TIFF|6.0|NO VALUE"],
+                                   ["dlg", "dlg_2", "TIFF|6.0|NO VALUE"], ["dlg", "dlg_3", "TIFF|6.0|NO VALUE"]],
+                                  columns=columns)
+
+        # Runs the function being tested.
+        changes = format_changes(df_previous, df_current, [])
+
+        # Tests if the function output has the expected values.
+        result = [changes.columns.tolist()] + changes.values.tolist()
+        expected = [["Group", "Format_Identification", "Change", "Previous_AIPs", "Current_AIPs", "AIPs_Change"],
+                    ["dlg", "TIFF|6.0|NO VALUE", "Changed", 2, 3, 1],
+                    ["hargrett", "TIFF|6.0|NO VALUE", "Disappeared", 1, 0, -1]]
+        self.assertEqual(result, expected, "Problem with test for by aip")
+
+    def test_by_aip_duplicate_rows(self):
+        """
+        Test for by_aip reports where an AIP has more than one row for the same format identification,
+        for example from matching more than one NARA format, which is only counted once.
+        """
+        # Makes the variables used for function input.
+        columns = ["Group", "AIP", "Format_Identification"]
+        df_previous = pd.DataFrame([["dlg", "dlg_1", "PDF|1.4|fmt/18"], ["dlg", "dlg_2", "PDF|1.4|fmt/18"]],
+                                   columns=columns)
+        df_current = pd.DataFrame([["dlg", "dlg_1", "PDF|1.4|fmt/18"], ["dlg", "dlg_1", "PDF|1.4|fmt/18"],
+                                   ["dlg", "dlg_2", "PDF|1.4|fmt/18"], ["dlg", "dlg_2", "PDF|1.4|fmt/18"],
+                                   ["dlg", "dlg_3", "PDF|1.4|fmt/18"]], columns=columns)
+
+        # Runs the function being tested.
+        changes = format_changes(df_previous, df_current, [])
+
+        # Tests if the function output has the expected values.
+        result = [changes.columns.tolist()] + changes.values.tolist()
+        expected = [["Group", "Format_Identification", "Change", "Previous_AIPs", "Current_AIPs", "AIPs_Change"],
+                    ["dlg", "PDF|1.4|fmt/18", "Changed", 2, 3, 1]]
+        self.assertEqual(result, expected, "Problem with test for by aip duplicate rows")
+
+    def test_unchanged(self):
+        """
+        Test for reports with the same amounts in a different order, so there are no changes.
+        """
+        # Makes the variables used for function input.
+        columns = ["Group", "Format_Identification", "File_IDs", "Size_GB"]
+        df_previous = pd.DataFrame([["dlg", "PDF|1.4|fmt/18", 50, 1.1],
+                                    ["dlg", "TIFF|6.0|NO VALUE", 2000, 80.25]], columns=columns)
+        df_current = pd.DataFrame([["dlg", "TIFF|6.0|NO VALUE", 2000, 80.25],
+                                   ["dlg", "PDF|1.4|fmt/18", 50, 1.1]], columns=columns)
+
+        # Runs the function being tested.
+        changes = format_changes(df_previous, df_current, ["File_IDs", "Size_GB"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(changes.values.tolist(), [], "Problem with test for unchanged")
+
+
+if __name__ == '__main__':
+    unittest.main()
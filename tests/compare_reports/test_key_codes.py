@@ -0,0 +1,69 @@
+"""
+Tests for the function key_codes(),
+which converts the key columns of two dataframes into one code per row, using the same codes for both.
+
+For input, tests use dataframes made in the test, since the function only needs a few columns.
+"""
+
+import numpy as np
+import pandas as pd
+import unittest
+from compare_reports import key_codes
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_shared_keys(self):
+        """
+        Test for keys in both dataframes, keys in only one, and a key repeated within a dataframe.
+        """
+        # Makes the variables used for function input.
+        df_previous = pd.DataFrame([["dlg", "PDF|1.4|fmt/18"], ["dlg", "TIFF"], ["dlg", "TIFF"]],
+                                   columns=["Group", "Format_Identification"])
+        df_current = pd.DataFrame([["hargrett", "TIFF"], ["dlg", "TIFF"]], columns=["Group", "Format_Identification"])
+
+        # Runs the function being tested.
+        previous_codes, current_codes, keys = key_codes(df_previous, df_current, ["Group", "Format_Identification"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(previous_codes.tolist(), [0, 1, 1], "Problem with test for shared keys, previous_codes")
+        self.assertEqual(current_codes.tolist(), [2, 1], "Problem with test for shared keys, current_codes")
+        expected_keys = [["dlg", "PDF|1.4|fmt/18"], ["dlg", "TIFF"], ["hargrett", "TIFF"]]
+        self.assertEqual(keys.values.tolist(), expected_keys, "Problem with test for shared keys, keys")
+
+    def test_same_parts(self):
+        """
+        Test for keys made of the same values in a different combination, which have different codes.
+        """
+        # Makes the variables used for function input.
+        df_previous = pd.DataFrame([["a", "b"], ["b", "a"]], columns=["Group", "Format_Identification"])
+        df_current = pd.DataFrame([["a", "a"], ["b", "a"]], columns=["Group", "Format_Identification"])
+
+        # Runs the function being tested.
+        previous_codes, current_codes, keys = key_codes(df_previous, df_current, ["Group", "Format_Identification"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(previous_codes.tolist(), [0, 1], "Problem with test for same parts, previous_codes")
+        self.assertEqual(current_codes.tolist(), [2, 1], "Problem with test for same parts, current_codes")
+        expected_keys = [["a", "b"], ["b", "a"], ["a", "a"]]
+        self.assertEqual(keys.values.tolist(), expected_keys, "Problem with test for same parts, keys")
+
+    def test_blank(self):
+        """
+        Test for a blank in a key column, which is treated as an empty string.
+        """
+        # Makes the variables used for function input.
+        df_previous = pd.DataFrame([["dlg", np.NaN]], columns=["Group", "Format_Identification"])
+        df_current = pd.DataFrame([["dlg", np.NaN], ["dlg", "TIFF"]], columns=["Group", "Format_Identification"])
+
+        # Runs the function being tested.
+        previous_codes, current_codes, keys = key_codes(df_previous, df_current, ["Group", "Format_Identification"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(previous_codes.tolist(), [0], "Problem with test for blank, previous_codes")
+        self.assertEqual(current_codes.tolist(), [0, 1], "Problem with test for blank, current_codes")
+        self.assertEqual(keys.values.tolist(), [["dlg", ""], ["dlg", "TIFF"]], "Problem with test for blank, keys")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests the entire script compare_reports.py,
+which makes a CSV with the formats that changed for each group between two merged format reports.
+
+For input, tests use files in the compare_reports folder of this script repo.
+"""
+
+import os
+import pandas as pd
+import subprocess
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Deletes the CSVs produced by the script, if made by the test.
+        """
+        for file_name in ("format_changes_2021-11_to_2023-11.csv", "format_changes_2023-11_to_2023-11.csv"):
+            if os.path.exists(os.path.join("script", file_name)):
+                os.remove(os.path.join("script", file_name))
+
+    def test_by_group(self):
+        """
+        Test for running the script with two by_group reports.
+        """
+        # Runs the script.
+        script_path = os.path.join("..", "..", "compare_reports.py")
+        csv_1 = os.path.join("script", "archive_formats_by_group_2021-11.csv")
+        csv_2 = os.path.join("script", "archive_formats_by_group_2023-11.csv")
+        subprocess.run(f"python {script_path} {csv_1} {csv_2}", shell=True)
+
+        # Tests if the CSV has the expected values.
+        df = pd.read_csv(os.path.join("script", "format_changes_2021-11_to_2023-11.csv"))
+        result = [df.columns.tolist()] + df.values.tolist()
+        expected = [["Group", "Format_Identification", "Change", "Previous_File_IDs", "Current_File_IDs",
+                     "File_IDs_Change", "Previous_Size_GB", "Current_Size_GB", "Size_GB_Change"],
+                    ["bmac", "QuickTime|NO VALUE|NO VALUE", "Changed", 100, 150, 50, 500.5, 750.25, 249.75],
+                    ["dlg", "JPEG File Interchange Format|1.01|fmt/43", "Appeared", 0, 5, 5, 0.0, 0.01, 0.01],
+                    ["dlg", "PDF|1.4|fmt/18", "Disappeared", 50, 0, -50, 1.1, 0.0, -1.1],
+                    ["dlg", "Tagged Image File Format|6.0|NO VALUE", "Changed", 2000, 3000, 1000, 80.25, 120.5, 40.25],
+                    ["hargrett", "Plain text|NO VALUE|x-fmt/111", "Appeared", 0, 20, 20, 0.0, 2.5, 2.5],
+                    ["hargrett", "Tagged Image File Format|6.0|NO VALUE", "Disappeared", 10, 0, -10, 0.5, 0.0, -0.5]]
+        self.assertEqual(result, expected, "Problem with test for by group")
+
+    def test_by_aip(self):
+        """
+        Test for running the script with two by_aip reports, which compares the number of AIPs.
+        """
+        # Runs the script.
+        script_path = os.path.join("..", "..", "compare_reports.py")
+        csv_1 = os.path.join("script", "archive_formats_by_aip_2021-11.csv")
+        csv_2 = os.path.join("script", "archive_formats_by_aip_2023-11.csv")
+        subprocess.run(f"python {script_path} {csv_1} {csv_2}", shell=True)
+
+        # Tests if the CSV has the expected values.
+        df = pd.read_csv(os.path.join("script", "format_changes_2021-11_to_2023-11.csv"))
+        result = [df.columns.tolist()] + df.values.tolist()
+        expected = [["Group", "Format_Identification", "Change", "Previous_AIPs", "Current_AIPs", "AIPs_Change"],
+                    ["dlg", "Tagged Image File Format|6.0|NO VALUE", "Changed", 2, 3, 1],
+                    ["hargrett", "Plain text|NO VALUE|x-fmt/111", "Appeared", 0, 1, 1],
+                    ["hargrett", "Tagged Image File Format|6.0|NO VALUE", "Disappeared", 1, 0, -1]]
+        self.assertEqual(result, expected, "Problem with test for by aip")
+
+    def test_no_changes(self):
+        """
+        Test for running the script with the same report twice, which makes a CSV with only the column names.
+        """
+        # Runs the script.
+        script_path = os.path.join("..", "..", "compare_reports.py")
+        csv_path = os.path.join("script", "archive_formats_by_group_2023-11.csv")
+        subprocess.run(f"python {script_path} {csv_path} {csv_path}", shell=True)
+
+        # Tests if the CSV has the expected values.
+        df = pd.read_csv(os.path.join("script", "format_changes_2023-11_to_2023-11.csv"))
+        result = [df.columns.tolist()] + df.values.tolist()
+        expected = [["Group", "Format_Identification", "Change", "Previous_File_IDs", "Current_File_IDs",
+                     "File_IDs_Change", "Previous_Size_GB", "Current_Size_GB", "Size_GB_Change"]]
+        self.assertEqual(result, expected, "Problem with test for no changes")
+
+    def test_missing_argument(self):
+        """
+        Test for running the script without the required arguments, which exits the script.
+        """
+        script_path = os.path.join("..", "..", "compare_reports.py")
+        with self.assertRaises(subprocess.CalledProcessError):
+            subprocess.run(f"python {script_path}", shell=True, check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
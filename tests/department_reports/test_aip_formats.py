@@ -0,0 +1,115 @@
+"""
+Tests for the function aip_formats(),
+which makes a list of the formats, organized by decreasing risk, in each AIP.
+Returns a dataframe.
+
+NARA risk levels in the data were assigned to get the testing variation needed and are not necessarily accurate.
+The Hargrett format identification information is accurate, other than a format may not be part of the specified AIP.
+"""
+import numpy as np
+import pandas as pd
+import unittest
+from department_reports import aip_formats
+
+
+def make_df(rows_list):
+    """
+    Makes a dataframe from the provided rows to use as input for tests. The columns are the same each time.
+    Returns the dataframe.
+    """
+
+    columns_list = ["Group", "Collection", "AIP", "Format_Name", "Format_Version", "PRONOM_URL",
+                    "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan",
+                    "2021_NARA_Risk_Level", "Risk_Level_Change"]
+    df = pd.DataFrame(rows_list, columns=columns_list)
+
+    # Makes the NARA Risk Level columns ordered categorical, so risk levels can be sorted.
+    # In production, this is done as part of csv_to_dataframe().
+    risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+    df['2023_NARA_Risk_Level'] = pd.Categorical(df['2023_NARA_Risk_Level'], risk_order, ordered=True)
+    df['2021_NARA_Risk_Level'] = pd.Categorical(df['2021_NARA_Risk_Level'], risk_order, ordered=True)
+
+    return df
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_aips_multiple(self):
+        """
+        Test for multiple AIPs per collection when there are multiple formats per AIP and NARA risk level.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-ms3796", "harg-ms3796er0007", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0002", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0002", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0001", "GZIP Format", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["hargrett", "harg-ms3796", "harg-ms3796er0007", "NEF EXIF", "NO VALUE", "NO VALUE",
+                 "No Match", np.NaN, "No Match", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        formats = aip_formats(df)
+
+        # Tests that formats contains the correct information.
+        result = [formats.columns.tolist()] + formats.values.tolist()
+        expected = [["Collection", "AIP", "2023_NARA_Risk_Level", "Format"],
+                    ["harg-ms3770", "harg-ms3770er0001", "High Risk", "GZIP Format (High Risk)"],
+                    ["harg-ms3770", "harg-ms3770er0002", "Moderate Risk", "xml (Moderate Risk)"],
+                    ["harg-ms3770", "harg-ms3770er0002", "Low Risk", "Plain text (Low Risk)"],
+                    ["harg-ms3796", "harg-ms3796er0007", "No Match", "NEF EXIF (No Match)"],
+                    ["harg-ms3796", "harg-ms3796er0007", "Moderate Risk", "xml (Moderate Risk)"]]
+        self.assertEqual(result, expected, "Problem with test for multiple AIPs, multiple formats")
+
+    def test_blank_aip(self):
+        """
+        Test for a row without an AIP, which is not included in the list
+        instead of being listed for another AIP in the same collection.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-ms3770", "harg-ms3770er0001", "GZIP Format", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", np.NaN, "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0002", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        formats = aip_formats(df)
+
+        # Tests that formats contains the correct information.
+        result = [formats.columns.tolist()] + formats.values.tolist()
+        expected = [["Collection", "AIP", "2023_NARA_Risk_Level", "Format"],
+                    ["harg-ms3770", "harg-ms3770er0001", "High Risk", "GZIP Format (High Risk)"],
+                    ["harg-ms3770", "harg-ms3770er0002", "Low Risk", "Plain text (Low Risk)"]]
+        self.assertEqual(result, expected, "Problem with test for blank AIP")
+
+    def test_puid_duplicates(self):
+        """
+        Test for when the same format is repeated in an AIP, once with and once without a PUID,
+        which is only listed once for the AIP.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-0000", "harg-0000-web-202007-0001", "GZIP Format", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["hargrett", "harg-0000", "harg-0000-web-202007-0001", "GZIP Format", "NO VALUE",
+                 "https://www.nationalarchives.gov.uk/PRONOM/x-fmt/266", "High Risk", "Retain", "High Risk",
+                 "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        formats = aip_formats(df)
+
+        # Tests that formats contains the correct information.
+        result = [formats.columns.tolist()] + formats.values.tolist()
+        expected = [["Collection", "AIP", "2023_NARA_Risk_Level", "Format"],
+                    ["harg-0000", "harg-0000-web-202007-0001", "High Risk", "GZIP Format (High Risk)"]]
+        self.assertEqual(result, expected, "Problem with test for PUID duplicates")
+
+
+if __name__ == '__main__':
+    unittest.main()
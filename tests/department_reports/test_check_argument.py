@@ -2,7 +2,7 @@
 Tests for the function check_arguments(),
 which verifies that both required arguments are present, the paths are valid,
 and they have the expected data based on the filenames.
-Returns both arguments and a list of errors.
+Returns both arguments, the list of groups from any optional arguments, and a list of errors.
 
 For input, tests use a list of argument values. In production, this would be the contents of sys.argv.
 """
@@ -23,7 +23,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of current_formats_csv is correct.
         expected_format = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
@@ -35,6 +36,10 @@ class MyTestCase(unittest.TestCase):
         self.assertEqual(previous_formats_csv, expected_previous,
                          "Problem with test for both arguments correct, previous_formats_csv")
 
+        # Tests that the value of groups_list is correct.
+        expected_groups = []
+        self.assertEqual(groups_list, expected_groups, "Problem with test for both arguments correct, groups_list")
+
         # Tests that the value of errors_list is correct.
         expected_list = []
         self.assertEqual(errors_list, expected_list, "Problem with test for both arguments correct, errors_list")
@@ -47,7 +52,8 @@ class MyTestCase(unittest.TestCase):
         # Makes the variables used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("error", "archive_formats_by_aip_2023-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg])
+        argument_list = [script_path, first_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of current_formats_csv is correct.
         expected_format = os.path.join("error", "archive_formats_by_aip_2023-08.csv")
@@ -73,7 +79,8 @@ class MyTestCase(unittest.TestCase):
         # Makes the variables used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "department_reports.py")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, second_arg])
+        argument_list = [script_path, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = ["Required argument previous_formats_csv is missing"]
@@ -89,7 +96,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_group_2023-08.csv")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"'{first_arg}' is not the correct type (should be archive_formats_by_aip_date.csv)"]
@@ -105,7 +113,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.xlsx")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"'{first_arg}' is not the correct type (should be archive_formats_by_aip_date.csv)"]
@@ -121,7 +130,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("path_error", "name_error.csv")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"current_formats_csv '{first_arg}' does not exist",
@@ -138,12 +148,32 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("path_error", "archive_formats_by_aip_2023-08.csv")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"current_formats_csv '{first_arg}' does not exist"]
         self.assertEqual(errors_list, expected_list, "Problem with test for current_formats_csv path error")
 
+    def test_groups(self):
+        """
+        Test for when the required arguments are correct and there are optional arguments with groups.
+        """
+        # Makes the variables used for function input and runs the function being tested.
+        script_path = os.path.join(sys.path[1], "department_reports.py")
+        first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
+        second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.csv")
+        argument_list = [script_path, first_arg, second_arg, "bmac", "hargrett"]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
+
+        # Tests that the value of groups_list is correct.
+        expected_groups = ["bmac", "hargrett"]
+        self.assertEqual(groups_list, expected_groups, "Problem with test for groups, groups_list")
+
+        # Tests that the value of errors_list is correct.
+        expected_list = []
+        self.assertEqual(errors_list, expected_list, "Problem with test for groups, errors_list")
+
     def test_previous_missing(self):
         """
         Test for when the second required argument previous_formats_csv is missing.
@@ -152,7 +182,8 @@ class MyTestCase(unittest.TestCase):
         # Makes the variables used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg])
+        argument_list = [script_path, first_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = ["Required argument previous_formats_csv is missing"]
@@ -168,7 +199,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
         second_arg = os.path.join("check_arguments", "archive_formats_by_group_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"'{second_arg}' is not the correct type (should be archive_formats_by_aip_date.csv)"]
@@ -184,7 +216,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
         second_arg = os.path.join("check_arguments", "archive_formats_by_aip_2021-08.xlsx")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"'{second_arg}' is not the correct type (should be archive_formats_by_aip_date.csv)"]
@@ -200,7 +233,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
         second_arg = os.path.join("path_error", "name_error.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"previous_formats_csv '{second_arg}' does not exist",
@@ -217,7 +251,8 @@ class MyTestCase(unittest.TestCase):
         script_path = os.path.join(sys.path[1], "department_reports.py")
         first_arg = os.path.join("check_arguments", "archive_formats_by_aip_2023-08.csv")
         second_arg = os.path.join("path error", "archive_formats_by_aip_2021-08.csv")
-        current_formats_csv, previous_formats_csv, errors_list = check_arguments([script_path, first_arg, second_arg])
+        argument_list = [script_path, first_arg, second_arg]
+        current_formats_csv, previous_formats_csv, groups_list, errors_list = check_arguments(argument_list)
 
         # Tests that the value of errors_list is correct.
         expected_list = [f"previous_formats_csv '{second_arg}' does not exist"]
@@ -31,6 +31,27 @@ class MyTestCase(unittest.TestCase):
                      "Matroska", "NO VALUE", "NO VALUE", "No Match", np.NaN]]
         self.assertEqual(result, expected, "Problem with test for encoding error")
 
+    def test_groups(self):
+        """
+        Test for a CSV with multiple groups, reading only some of the groups.
+        """
+        # Runs the function being tested.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        format_df = csv_to_dataframe(format_csv, ["bmac", "dlg"])
+
+        # Tests that the dataframe contains the correct information.
+        result = [format_df.columns.to_list()] + format_df.values.tolist()
+        expected = [["Group", "Collection", "AIP", "Format_Identification", "Format_Name", "Format_Version",
+                     "PRONOM_URL", "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan"],
+                    ["dlg", "arl_acl", "arl_acl_acl332", "Tagged Image File Format|6|fmt/353",
+                     "Tagged Image File Format", "6", "https://www.nationalarchives.gov.uk/PRONOM/fmt/353",
+                     "Low Risk", "Retain"],
+                    ["bmac", "peabody", "bmac_51021enr-1a", "Wave|NO VALUE|NO VALUE", "Wave",
+                     "NO VALUE", "NO VALUE", "Low Risk", "Retain"],
+                    ["dlg", "zhj_tecc", "zhj_tecc_rml-ohp-001", "Waveform Audio|NO VALUE|NO VALUE",
+                     "Waveform Audio", "NO VALUE", "NO VALUE", "Low Risk", "Retain"]]
+        self.assertEqual(result, expected, "Problem with test for groups")
+
     def test_multi_groups(self):
         """
         Test for a CSV with multiple groups.
@@ -0,0 +1,80 @@
+"""
+Tests for the function department_report(),
+which makes the Excel spreadsheet with the risk data and data summaries for one department.
+Returns the number of seconds it took to make the spreadsheet.
+
+NARA risk levels in the data were assigned to get the testing variation needed and are not necessarily accurate.
+"""
+import os
+import pandas as pd
+import unittest
+from department_reports import department_report
+
+
+def make_df(rows_list):
+    """
+    Makes a dataframe from the provided rows to use as input for tests. The columns are the same each time.
+    Returns the dataframe.
+    """
+
+    columns_list = ["Group", "Collection", "AIP", "Format_Name", "Format_Version", "PRONOM_URL",
+                    "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan",
+                    "2021_NARA_Risk_Level", "Risk_Level_Change"]
+    df = pd.DataFrame(rows_list, columns=columns_list)
+
+    # Makes the NARA Risk Level columns ordered categorical, so risk levels can be sorted.
+    # In production, this is done as part of csv_to_dataframe().
+    risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+    df['2023_NARA_Risk_Level'] = pd.Categorical(df['2023_NARA_Risk_Level'], risk_order, ordered=True)
+    df['2021_NARA_Risk_Level'] = pd.Categorical(df['2021_NARA_Risk_Level'], risk_order, ordered=True)
+
+    return df
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Deletes the Excel spreadsheet produced by the function, if it was made by the test.
+        """
+        if os.path.exists("hargrett_risk_report_202311.xlsx"):
+            os.remove("hargrett_risk_report_202311.xlsx")
+
+    def test_department_report(self):
+        """
+        Test for making the spreadsheet for one department with two collections.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-0000", "harg-0000-web-202007-0002", "GZIP Format", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["hargrett", "harg-0000", "harg-0000-web-202007-0002", "TIFF EXIF", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0002", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Moderate Risk", "Decrease"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        seconds = department_report("hargrett", df, ".", "202311")
+
+        # Tests that the time is a number of seconds.
+        self.assertGreater(seconds, 0, "Problem with test for department report, seconds")
+
+        # Tests that the spreadsheet has the expected sheets.
+        report = pd.ExcelFile("hargrett_risk_report_202311.xlsx")
+        sheets = report.sheet_names
+        expected_sheets = ["AIP_Risk_Data", "Department_Risk_Levels", "Collection_Risk_Levels", "AIP_Risk_Levels",
+                           "Formats", "AIP_Formats", "NARA_Plan_Types"]
+        self.assertEqual(sheets, expected_sheets, "Problem with test for department report, sheets")
+
+        # Tests that the Collection_Risk_Levels sheet has the expected values.
+        df_collection = pd.read_excel(report, "Collection_Risk_Levels")
+        report.close()
+        result = [df_collection.columns.tolist()] + df_collection.values.tolist()
+        expected = [["Collection", "Formats", "No_Match_%", "High_Risk_%", "Moderate_Risk_%", "Low_Risk_%"],
+                    ["harg-0000", 2, 0, 50, 0, 50],
+                    ["harg-ms3770", 1, 0, 0, 0, 100]]
+        self.assertEqual(result, expected, "Problem with test for department report, Collection_Risk_Levels")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+Tests for the function department_slices(),
+which splits the current analysis dataframe into one dataframe per department (ARCHive group).
+Returns a list of tuples with the department name and dataframe.
+
+For input, tests use dataframes made in the test, since the function only needs the Group column and a few others.
+"""
+import pandas as pd
+import unittest
+from department_reports import department_slices
+
+
+def slices_to_list(slices):
+    """
+    Converts the function output to a list with the department name and rows of each slice, for comparison.
+    """
+    return [[dept, df.values.tolist()] for dept, df in slices]
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_mixed_order(self):
+        """
+        Test for departments whose rows are not next to each other, which keep their original order in each slice.
+        """
+        # Makes a dataframe to use as test input.
+        df = pd.DataFrame([["russell", "rbrl-025", "rbrl-025-er-000001"],
+                           ["bmac", "bmac_wsb", "bmac_wsb_01"],
+                           ["russell", "rbrl-025", "rbrl-025-er-000002"],
+                           ["hargrett", "harg-0000", "harg-0000-web-202007-0002"],
+                           ["bmac", "bmac_wsb", "bmac_wsb_02"],
+                           ["russell", "rbrl-001", "rbrl-001-er-000001"]],
+                          columns=["Group", "Collection", "AIP"])
+
+        # Runs the function being tested.
+        slices = department_slices(df)
+
+        # Tests if the function output has the expected values.
+        result = slices_to_list(slices)
+        expected = [["bmac", [["bmac", "bmac_wsb", "bmac_wsb_01"], ["bmac", "bmac_wsb", "bmac_wsb_02"]]],
+                    ["hargrett", [["hargrett", "harg-0000", "harg-0000-web-202007-0002"]]],
+                    ["russell", [["russell", "rbrl-025", "rbrl-025-er-000001"],
+                                 ["russell", "rbrl-025", "rbrl-025-er-000002"],
+                                 ["russell", "rbrl-001", "rbrl-001-er-000001"]]]]
+        self.assertEqual(result, expected, "Problem with test for mixed order")
+
+    def test_one_department(self):
+        """
+        Test for a dataframe with only one department, which is returned as one slice.
+        """
+        # Makes a dataframe to use as test input.
+        df = pd.DataFrame([["hargrett", "harg-0000", "harg-0000-web-202007-0002"],
+                           ["hargrett", "harg-ms3770", "harg-ms3770er0002"]],
+                          columns=["Group", "Collection", "AIP"])
+
+        # Runs the function being tested.
+        slices = department_slices(df)
+
+        # Tests if the function output has the expected values.
+        result = slices_to_list(slices)
+        expected = [["hargrett", [["hargrett", "harg-0000", "harg-0000-web-202007-0002"],
+                                  ["hargrett", "harg-ms3770", "harg-ms3770er0002"]]]]
+        self.assertEqual(result, expected, "Problem with test for one department")
+
+    def test_empty(self):
+        """
+        Test for a dataframe without any rows, which has no departments.
+        """
+        # Makes a dataframe to use as test input.
+        df = pd.DataFrame(columns=["Group", "Collection", "AIP"])
+
+        # Runs the function being tested.
+        slices = department_slices(df)
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(slices, [], "Problem with test for empty")
+
+
+if __name__ == '__main__':
+    unittest.main()
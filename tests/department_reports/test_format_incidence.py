@@ -0,0 +1,138 @@
+"""
+Tests for the function format_incidence(),
+which finds which formats are in each collection or AIP, as a list of the combinations that are present.
+Returns the codes for each combination and the labels for the codes.
+
+NARA risk levels in the data were assigned to get the testing variation needed and are not necessarily accurate.
+"""
+import numpy as np
+import pandas as pd
+import unittest
+from department_reports import format_incidence
+
+
+def make_df(rows_list):
+    """
+    Makes a dataframe from the provided rows to use as input for tests. The columns are the same each time.
+    Returns the dataframe.
+    """
+
+    columns_list = ["Group", "Collection", "AIP", "Format_Name", "Format_Version", "PRONOM_URL",
+                    "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan",
+                    "2021_NARA_Risk_Level", "Risk_Level_Change"]
+    df = pd.DataFrame(rows_list, columns=columns_list)
+
+    # Makes the NARA Risk Level columns ordered categorical, so risk levels can be sorted.
+    # In production, this is done as part of csv_to_dataframe().
+    risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+    df['2023_NARA_Risk_Level'] = pd.Categorical(df['2023_NARA_Risk_Level'], risk_order, ordered=True)
+    df['2021_NARA_Risk_Level'] = pd.Categorical(df['2021_NARA_Risk_Level'], risk_order, ordered=True)
+
+    return df
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_collection(self):
+        """
+        Test for the formats in each collection, with a format that is in a collection more than once.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-ms3770", "harg-ms3770er0002", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0001", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0001", "GZIP Format", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["hargrett", "harg-0000", "harg-0000-web-202007-0001", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"],
+                ["hargrett", "harg-0000", "harg-0000-web-202007-0001", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        row_codes, column_codes, row_labels, column_labels = format_incidence(df, 'Collection')
+
+        # Tests that the function output contains the correct information.
+        self.assertEqual(row_codes.tolist(), [0, 0, 1, 1], "Problem with test for collection, row_codes")
+        self.assertEqual(column_codes.tolist(), [1, 2, 0, 2], "Problem with test for collection, column_codes")
+        self.assertEqual(row_labels, ["harg-0000", "harg-ms3770"], "Problem with test for collection, row_labels")
+        expected_columns = [("High Risk", "GZIP Format (High Risk)"), ("Moderate Risk", "xml (Moderate Risk)"),
+                            ("Low Risk", "Plain text (Low Risk)")]
+        self.assertEqual(column_labels, expected_columns, "Problem with test for collection, column_labels")
+
+    def test_aip_blank(self):
+        """
+        Test for the formats in each AIP, with a format that has no risk level and so is not included.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-ms3786", "harg-ms3786er0007", "NEF EXIF", "NO VALUE", "NO VALUE",
+                 "No Match", np.NaN, "No Match", "Unchanged"],
+                ["hargrett", "harg-ms3786", "harg-ms3786er0007", "SWF", "NO VALUE", "NO VALUE",
+                 np.NaN, np.NaN, "No Match", "Unchanged"],
+                ["hargrett", "harg-ms3786", "harg-ms3786er0012", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        row_codes, column_codes, row_labels, column_labels = format_incidence(df, 'AIP')
+
+        # Tests that the function output contains the correct information.
+        self.assertEqual(row_codes.tolist(), [0, 1], "Problem with test for AIP blank, row_codes")
+        self.assertEqual(column_codes.tolist(), [0, 1], "Problem with test for AIP blank, column_codes")
+        self.assertEqual(row_labels, ["harg-ms3786er0007", "harg-ms3786er0012"],
+                         "Problem with test for AIP blank, row_labels")
+        expected_columns = [("No Match", "NEF EXIF (No Match)"), ("Moderate Risk", "xml (Moderate Risk)")]
+        self.assertEqual(column_labels, expected_columns, "Problem with test for AIP blank, column_labels")
+
+
+    def test_blank_aip(self):
+        """
+        Test for the formats in each AIP, with a row that has no AIP and so is not included.
+        The format that is only in that row is not included either.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-ms3786", np.NaN, "SWF", "NO VALUE", "NO VALUE",
+                 "High Risk", "Transform", "High Risk", "Unchanged"],
+                ["hargrett", "harg-ms3786", "harg-ms3786er0012", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        row_codes, column_codes, row_labels, column_labels = format_incidence(df, 'AIP')
+
+        # Tests that the function output contains the correct information.
+        self.assertEqual(row_codes.tolist(), [0], "Problem with test for blank AIP, row_codes")
+        self.assertEqual(column_codes.tolist(), [0], "Problem with test for blank AIP, column_codes")
+        self.assertEqual(row_labels, ["harg-ms3786er0012"], "Problem with test for blank AIP, row_labels")
+        expected_columns = [("Moderate Risk", "xml (Moderate Risk)")]
+        self.assertEqual(column_labels, expected_columns, "Problem with test for blank AIP, column_labels")
+
+    def test_blank_collection(self):
+        """
+        Test for the formats in each collection, with a row that has no collection and so is not included,
+        instead of being counted for the last collection.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["hargrett", "harg-0000", "harg-0000-web-202007-0001", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"],
+                ["hargrett", np.NaN, "harg-ms3770er0003", "GZIP Format", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["hargrett", "harg-ms3770", "harg-ms3770er0001", "Plain text", "NO VALUE", "NO VALUE",
+                 "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                ["hargrett", np.NaN, "harg-ms3770er0004", "xml", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Moderate Risk", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        row_codes, column_codes, row_labels, column_labels = format_incidence(df, 'Collection')
+
+        # Tests that the function output contains the correct information.
+        self.assertEqual(row_codes.tolist(), [0, 1], "Problem with test for blank collection, row_codes")
+        self.assertEqual(column_codes.tolist(), [0, 1], "Problem with test for blank collection, column_codes")
+        self.assertEqual(row_labels, ["harg-0000", "harg-ms3770"], "Problem with test for blank collection, row_labels")
+        expected_columns = [("Moderate Risk", "xml (Moderate Risk)"), ("Low Risk", "Plain text (Low Risk)")]
+        self.assertEqual(column_labels, expected_columns, "Problem with test for blank collection, column_labels")
+
+if __name__ == '__main__':
+    unittest.main()
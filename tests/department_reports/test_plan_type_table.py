@@ -0,0 +1,84 @@
+"""
+Tests for the function plan_type_table(),
+which calculates the number of formats and AIPs with each type of NARA preservation action plan.
+Returns a dataframe.
+
+Collections, AIP IDs, and NARA plans in the data were assigned to get the testing variation needed
+and are not necessarily accurate.
+"""
+import numpy as np
+import pandas as pd
+import unittest
+from department_reports import plan_type_table
+
+
+def make_df(rows_list):
+    """
+    Makes a dataframe from the provided rows to use as input for tests. The columns are the same each time.
+    Returns the dataframe.
+    """
+    columns_list = ["Group", "Collection", "AIP", "Format_Name", "Format_Version", "PRONOM_URL",
+                    "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan",
+                    "2021_NARA_Risk_Level", "Risk_Level_Change"]
+    df = pd.DataFrame(rows_list, columns=columns_list)
+    return df
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_multiple_types(self):
+        """
+        Test for a department with formats of several plan types, including a blank plan (No plan),
+        which are in order from the least to the most action needed.
+        """
+        # Makes the dataframe used for function input.
+        df = make_df([["hargrett", "coll-1", "aip-1", "JPEG", "1.01",
+                       "https://www.nationalarchives.gov.uk/PRONOM/fmt/43",
+                       "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                      ["hargrett", "coll-1", "aip-1", "WordPerfect", "5.1", "NO VALUE",
+                       "High Risk", "Transform to PDF", "High Risk", "Unchanged"],
+                      ["hargrett", "coll-1", "aip-2", "JPEG", "1.02",
+                       "https://www.nationalarchives.gov.uk/PRONOM/fmt/44",
+                       "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                      ["hargrett", "coll-2", "aip-3", "Unknown Binary", "NO VALUE", "NO VALUE",
+                       "No Match", np.NaN, "No Match", "Unchanged"],
+                      ["hargrett", "coll-2", "aip-3", "TIFF", "NO VALUE", "NO VALUE",
+                       "Low Risk", "Depends on version, retain TIFF 1-6", "Low Risk", "Unchanged"]])
+
+        # Runs the function being tested.
+        plan_types = plan_type_table(df)
+
+        # Tests if the function output has the expected values.
+        result = [plan_types.reset_index().columns.tolist()] + plan_types.reset_index().values.tolist()
+        expected = [["NARA_Plan_Type", "Formats", "Formats_%", "AIPs"],
+                    ["Retain", 2, 40.0, 2],
+                    ["Transform", 1, 20.0, 1],
+                    ["Depends on version", 1, 20.0, 1],
+                    ["No plan", 1, 20.0, 1]]
+        self.assertEqual(result, expected, "Problem with test for multiple types")
+
+    def test_duplicate_format(self):
+        """
+        Test for a format that is in more than one AIP and is listed with and without a PUID,
+        which is one format and is counted in every AIP.
+        """
+        # Makes the dataframe used for function input.
+        df = make_df([["dlg", "coll-1", "aip-1", "JPEG", "1.01", "NO VALUE",
+                       "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                      ["dlg", "coll-1", "aip-2", "JPEG", "1.01", "https://www.nationalarchives.gov.uk/PRONOM/fmt/43",
+                       "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                      ["dlg", "coll-1", "aip-3", "JPEG", "1.01", "https://www.nationalarchives.gov.uk/PRONOM/fmt/43",
+                       "Low Risk", "Retain", "Low Risk", "Unchanged"]])
+
+        # Runs the function being tested.
+        plan_types = plan_type_table(df)
+
+        # Tests if the function output has the expected values.
+        result = [plan_types.reset_index().columns.tolist()] + plan_types.reset_index().values.tolist()
+        expected = [["NARA_Plan_Type", "Formats", "Formats_%", "AIPs"],
+                    ["Retain", 1, 100.0, 3]]
+        self.assertEqual(result, expected, "Problem with test for duplicate format")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Tests for the function read_formats(),
+which reads an archive_formats_by_aip_date.csv into a dataframe with csv_to_dataframe(),
+or from a cache of that dataframe if the CSV has not changed.
+Returns the dataframe.
+"""
+import os
+import shutil
+import unittest
+from archive_reports import save_cache
+from department_reports import cache_key, csv_to_dataframe, read_formats
+from merge_format_reports import save_partitions
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Deletes the cache folder and partition folder produced by the tests, if they were made.
+        """
+        if os.path.exists("read_formats_cache"):
+            shutil.rmtree("read_formats_cache")
+        if os.path.exists(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02")):
+            shutil.rmtree(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02"))
+
+    def test_no_cache(self):
+        """
+        Test for not using a cache, which is the same as csv_to_dataframe() and does not make a cache.
+        """
+        # Runs the function being tested.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        format_df = read_formats(format_csv)
+
+        # Tests that the dataframe is the same as from csv_to_dataframe().
+        expected_df = csv_to_dataframe(format_csv)
+        result = [format_df.columns.to_list()] + format_df.astype(object).fillna("BLANK").values.tolist()
+        expected = [expected_df.columns.to_list()] + expected_df.astype(object).fillna("BLANK").values.tolist()
+        self.assertEqual(result, expected, "Problem with test for no cache, dataframe")
+
+        # Tests that the cache folder was not made.
+        result = os.path.exists("read_formats_cache")
+        self.assertEqual(result, False, "Problem with test for no cache, cache folder")
+
+    def test_groups_cache(self):
+        """
+        Test for reading some groups when there is a cache, which gets the groups from the cached dataframe.
+        """
+        # Makes the cache by reading every group.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        read_formats(format_csv, "read_formats_cache")
+
+        # Runs the function being tested.
+        format_df = read_formats(format_csv, "read_formats_cache", ["bmac", "dlg"])
+
+        # Tests that the dataframe only has the groups and a new index.
+        result = [format_df.index.to_list(), format_df["AIP"].to_list()]
+        expected = [[0, 1, 2], ["arl_acl_acl332", "bmac_51021enr-1a", "zhj_tecc_rml-ohp-001"]]
+        self.assertEqual(result, expected, "Problem with test for groups with cache")
+
+    def test_groups_no_cache(self):
+        """
+        Test for reading some groups when there is not a cache yet,
+        which reads only the groups from the CSV and does not make a cache.
+        """
+        # Runs the function being tested.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        format_df = read_formats(format_csv, "read_formats_cache", ["bmac", "dlg"])
+
+        # Tests that the dataframe only has the groups.
+        result = format_df["AIP"].to_list()
+        expected = ["arl_acl_acl332", "bmac_51021enr-1a", "zhj_tecc_rml-ohp-001"]
+        self.assertEqual(result, expected, "Problem with test for groups without cache, dataframe")
+
+        # Tests that the cache was not made, since it would not have every group.
+        result = os.path.exists("read_formats_cache")
+        self.assertEqual(result, False, "Problem with test for groups without cache, cache folder")
+
+    def test_groups_partitions(self):
+        """
+        Test for reading some groups when there is a cache and the CSV was also saved as one CSV per group
+        (partitions), which reads only the CSVs for the groups instead of using the cache.
+        """
+        # Makes the cache by reading every group, saves the CSV as partitions,
+        # and then changes the CSV for one group so the test can tell it was read.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        read_formats(format_csv, "read_formats_cache")
+        save_partitions(format_csv)
+        bmac_path = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02", "bmac.csv")
+        with open(bmac_path) as bmac_open:
+            bmac_text = bmac_open.read()
+        with open(bmac_path, "w") as bmac_open:
+            bmac_open.write(bmac_text.replace("bmac_51021enr-1a", "bmac_partition"))
+
+        # Runs the function being tested.
+        format_df = read_formats(format_csv, "read_formats_cache", ["bmac", "dlg"])
+
+        # Tests that the dataframe has the AIPs from the partitions.
+        result = format_df["AIP"].to_list()
+        expected = ["bmac_partition", "arl_acl_acl332", "zhj_tecc_rml-ohp-001"]
+        self.assertEqual(result, expected, "Problem with test for groups with partitions")
+
+    def test_new_cache(self):
+        """
+        Test for using a cache that does not exist yet, which reads the CSV and saves the dataframe to the cache.
+        """
+        # Runs the function being tested.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        format_df = read_formats(format_csv, "read_formats_cache")
+
+        # Tests that the dataframe is the same as from csv_to_dataframe().
+        expected_df = csv_to_dataframe(format_csv)
+        result = [format_df.columns.to_list()] + format_df.astype(object).fillna("BLANK").values.tolist()
+        expected = [expected_df.columns.to_list()] + expected_df.astype(object).fillna("BLANK").values.tolist()
+        self.assertEqual(result, expected, "Problem with test for new cache, dataframe")
+
+        # Tests that the risk level is still an ordered category after being read from the cache.
+        cached_df = read_formats(format_csv, "read_formats_cache")
+        result = cached_df["2023_NARA_Risk_Level"].cat.ordered
+        self.assertEqual(result, True, "Problem with test for new cache, risk level")
+
+        # Tests that the cache was made with the name of the CSV.
+        result = os.listdir("read_formats_cache")
+        expected = ["archive_formats_by_aip_2023-02.pickle"]
+        self.assertEqual(result, expected, "Problem with test for new cache, cache folder")
+
+    def test_use_cache(self):
+        """
+        Test for using a cache with the same key, which returns the cached dataframe instead of reading the CSV.
+        The cached dataframe is different from the CSV, so the test can tell which was used.
+        """
+        # Makes a cache with a dataframe from a different CSV, using the key for the CSV being read.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        other_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-01.csv")
+        cache_path = os.path.join("read_formats_cache", "archive_formats_by_aip_2023-02.pickle")
+        key = cache_key([os.path.abspath(os.path.join("..", "..", "department_reports.py")), format_csv])
+        save_cache(cache_path, key, csv_to_dataframe(other_csv))
+
+        # Runs the function being tested.
+        format_df = read_formats(format_csv, "read_formats_cache")
+
+        # Tests that the dataframe is the one from the cache.
+        result = format_df["AIP"].to_list()
+        expected = ["bmac_2000002pst-arch", "bmac_2000023pst-arch"]
+        self.assertEqual(result, expected, "Problem with test for use cache")
+
+    def test_changed_cache(self):
+        """
+        Test for using a cache with a different key, for example if the CSV changed,
+        which reads the CSV again and replaces the cache.
+        """
+        # Makes a cache with a dataframe from a different CSV and a key that does not match.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        other_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-01.csv")
+        cache_path = os.path.join("read_formats_cache", "archive_formats_by_aip_2023-02.pickle")
+        save_cache(cache_path, "old-key", csv_to_dataframe(other_csv))
+
+        # Runs the function being tested.
+        format_df = read_formats(format_csv, "read_formats_cache")
+
+        # Tests that the dataframe is the one from the CSV.
+        result = format_df["AIP"].to_list()
+        expected = csv_to_dataframe(format_csv)["AIP"].to_list()
+        self.assertEqual(result, expected, "Problem with test for changed cache")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Tests for the function read_groups(),
+which reads an archive_formats_by_aip_date.csv into a dataframe, keeping only the rows for some groups,
+or reads only the CSVs for those groups if merge_format_reports.py saved one CSV per group.
+Returns the dataframe.
+"""
+import os
+import shutil
+import unittest
+from department_reports import read_groups
+from merge_format_reports import save_partitions
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Deletes the partition folder made by the partition tests, if it was made.
+        """
+        if os.path.exists(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02")):
+            shutil.rmtree(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02"))
+
+    def test_all_groups(self):
+        """
+        Test for reading every group, when there is no list of groups.
+        """
+        # Runs the function being tested.
+        format_df = read_groups(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv"))
+
+        # Tests that the dataframe has the correct AIPs.
+        result = format_df["AIP"].to_list()
+        expected = ["arl_acl_acl332", "harg-ms3786er0007", "harg-0000-web-202007-0001", "harg-0000-web-202007-0002",
+                    "bmac_51021enr-1a", "zhj_tecc_rml-ohp-001"]
+        self.assertEqual(result, expected, "Problem with test for all groups")
+
+    def test_chunks(self):
+        """
+        Test for reading some groups from a CSV that is read in more than one chunk,
+        including a chunk without any rows for the groups.
+        """
+        # Runs the function being tested.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        format_df = read_groups(format_csv, ["hargrett"], chunk_size=2)
+
+        # Tests that the dataframe has the correct AIPs and a new index.
+        result = [format_df.index.to_list(), format_df["AIP"].to_list()]
+        expected = [[0, 1, 2], ["harg-ms3786er0007", "harg-0000-web-202007-0001", "harg-0000-web-202007-0002"]]
+        self.assertEqual(result, expected, "Problem with test for chunks")
+
+    def test_no_match(self):
+        """
+        Test for reading a group that is not in the CSV, which is an empty dataframe with the CSV columns.
+        """
+        # Runs the function being tested.
+        format_df = read_groups(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv"), ["error"])
+
+        # Tests that the dataframe has the columns and no rows.
+        result = [format_df.columns.to_list()[:3], len(format_df)]
+        expected = [["Group", "Collection", "AIP"], 0]
+        self.assertEqual(result, expected, "Problem with test for no match")
+
+    def test_partitions(self):
+        """
+        Test for reading some groups from a CSV that was also saved as one CSV per group (partitions),
+        which only reads the CSVs for those groups.
+        """
+        # Saves the CSV as partitions, and then changes the CSV for one group so the test can tell it was read.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        save_partitions(format_csv)
+        with open(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02", "bmac.csv")) as bmac_open:
+            bmac_text = bmac_open.read()
+        with open(os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02", "bmac.csv"), "w") as bmac_open:
+            bmac_open.write(bmac_text.replace("bmac_51021enr-1a", "bmac_partition"))
+
+        # Runs the function being tested.
+        format_df = read_groups(format_csv, ["dlg", "bmac"])
+
+        # Tests that the dataframe has the correct AIPs, in the order of the partitions.
+        result = format_df["AIP"].to_list()
+        expected = ["bmac_partition", "arl_acl_acl332", "zhj_tecc_rml-ohp-001"]
+        self.assertEqual(result, expected, "Problem with test for partitions")
+
+    def test_partitions_no_match(self):
+        """
+        Test for reading a group that is not in a CSV that was also saved as one CSV per group (partitions),
+        which is an empty dataframe with the CSV columns.
+        """
+        # Saves the CSV as partitions.
+        format_csv = os.path.join("csv_to_dataframe", "archive_formats_by_aip_2023-02.csv")
+        save_partitions(format_csv)
+
+        # Runs the function being tested.
+        format_df = read_groups(format_csv, ["error"])
+
+        # Tests that the dataframe has the columns and no rows.
+        result = [format_df.columns.to_list()[:3], len(format_df)]
+        expected = [["Group", "Collection", "AIP"], 0]
+        self.assertEqual(result, expected, "Problem with test for partitions, no match")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Tests for the function risk_change_table(),
+which makes a table with the type of risk change for every combination of previous and current risk level.
+Returns a numpy array.
+"""
+import unittest
+from department_reports import risk_change_table
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_table(self):
+        """
+        Test for the four NARA risk levels, which is how the function is used in production.
+        The first row and column are for a blank risk level.
+        """
+        # Runs the function being tested.
+        change_table = risk_change_table(["Low Risk", "Moderate Risk", "High Risk", "No Match"])
+
+        # Tests that the table contains the correct information.
+        # Rows are previous (blank, Low, Moderate, High, No Match) and columns are current in the same order.
+        # The column for a blank current risk level is not tested, since every current format has a risk level.
+        expected = [["New Format", "New Format", "New Format", "New Format"],
+                    ["Unchanged", "Increase", "Increase", "Unmatched"],
+                    ["Decrease", "Unchanged", "Increase", "Unmatched"],
+                    ["Decrease", "Decrease", "Unchanged", "Unmatched"],
+                    ["New Match", "New Match", "New Match", "Unchanged"]]
+        self.assertEqual(change_table[:, 1:].tolist(), expected, "Problem with test for table")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""
+Tests for the function risk_level_tables(),
+which calculates the percentage of formats at each risk level for several units of analysis at once.
+Returns a dictionary of dataframes.
+
+Collections, AIP IDs, and NARA risk levels in the data were assigned to get the testing variation needed
+and are not necessarily accurate. The format identifications are all present in Russell holdings.
+"""
+import pandas as pd
+import unittest
+from department_reports import risk_level_tables
+
+
+def make_df(rows_list):
+    """
+    Makes a dataframe from the provided rows to use as input for tests. The columns are the same each time.
+    Returns the dataframe.
+    """
+
+    columns_list = ["Group", "Collection", "AIP", "Format_Name", "Format_Version", "PRONOM_URL",
+                    "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan",
+                    "2021_NARA_Risk_Level", "Risk_Level_Change"]
+    df = pd.DataFrame(rows_list, columns=columns_list)
+
+    # Makes the NARA Risk Level columns ordered categorical, so risk levels can be sorted.
+    # In production, this is done as part of csv_to_dataframe().
+    risk_order = ["Low Risk", "Moderate Risk", "High Risk", "No Match"]
+    df['2023_NARA_Risk_Level'] = pd.Categorical(df['2023_NARA_Risk_Level'], risk_order, ordered=True)
+    df['2021_NARA_Risk_Level'] = pd.Categorical(df['2021_NARA_Risk_Level'], risk_order, ordered=True)
+
+    return df
+
+
+def table_to_list(table):
+    """
+    Converts one dataframe from the function output to a list, with the index as the first column, for comparison.
+    """
+    table = table.reset_index()
+    return [table.columns.tolist()] + table.values.tolist()
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_all_units(self):
+        """
+        Test for the AIP, collection, and department risk levels from one call.
+        A format is in two AIPs of a collection, once with a PUID and once without,
+        so it is one format for the collection and department with the risk from the PUID.
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["russell", "rbrl-025", "rbrl-025-er-000001", "JPEG EXIF", "7.1",
+                 "https://www.nationalarchives.gov.uk/PRONOM/fmt/645", "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                ["russell", "rbrl-025", "rbrl-025-er-000001", "ACR", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["russell", "rbrl-025", "rbrl-025-er-000002", "JPEG EXIF", "7.1", "NO VALUE",
+                 "No Match", "NO VALUE", "No Match", "Unchanged"],
+                ["russell", "rbrl-001", "rbrl-001-er-000001", "ACR", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["russell", "rbrl-001", "rbrl-001-er-000001", "DOT", "NO VALUE", "NO VALUE",
+                 "Moderate Risk", "Retain", "Low Risk", "Increase"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        tables = risk_level_tables(df, ['AIP', 'Collection', 'Group'])
+
+        # Tests that the dictionary has a table for each unit of analysis.
+        self.assertEqual(list(tables), ['AIP', 'Collection', 'Group'], "Problem with test for all units, keys")
+
+        # Tests that the AIP table contains the correct information.
+        expected_aip = [["AIP", "Formats", "No_Match_%", "High_Risk_%", "Moderate_Risk_%", "Low_Risk_%"],
+                        ["rbrl-001-er-000001", 2, 0, 50, 50, 0],
+                        ["rbrl-025-er-000001", 2, 0, 50, 0, 50],
+                        ["rbrl-025-er-000002", 1, 100, 0, 0, 0]]
+        self.assertEqual(table_to_list(tables['AIP']), expected_aip, "Problem with test for all units, AIP")
+
+        # Tests that the collection table contains the correct information.
+        expected_collection = [["Collection", "Formats", "No_Match_%", "High_Risk_%", "Moderate_Risk_%", "Low_Risk_%"],
+                               ["rbrl-001", 2, 0, 50, 50, 0],
+                               ["rbrl-025", 2, 0, 50, 0, 50]]
+        self.assertEqual(table_to_list(tables['Collection']), expected_collection,
+                         "Problem with test for all units, Collection")
+
+        # Tests that the department table contains the correct information.
+        expected_group = [["Group", "Formats", "No_Match_%", "High_Risk_%", "Moderate_Risk_%", "Low_Risk_%"],
+                          ["russell", 3, 0, 33.33, 33.33, 33.33]]
+        self.assertEqual(table_to_list(tables['Group']), expected_group, "Problem with test for all units, Group")
+
+    def test_one_unit(self):
+        """
+        Test for only one unit of analysis, which is the same as the result of risk_levels().
+        """
+        # Makes a dataframe to use as test input.
+        rows = [["russell", "rbrl-025", "rbrl-025-er-000001", "ACR", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"],
+                ["russell", "rbrl-025", "rbrl-025-er-000002", "ACR", "NO VALUE", "NO VALUE",
+                 "High Risk", "Retain", "High Risk", "Unchanged"]]
+        df = make_df(rows)
+
+        # Runs the function being tested.
+        tables = risk_level_tables(df, ['Collection'])
+
+        # Tests that the collection table contains the correct information.
+        expected = [["Collection", "Formats", "No_Match_%", "High_Risk_%", "Moderate_Risk_%", "Low_Risk_%"],
+                    ["rbrl-025", 1, 0, 100, 0, 0]]
+        self.assertEqual(list(tables), ['Collection'], "Problem with test for one unit, keys")
+        self.assertEqual(table_to_list(tables['Collection']), expected, "Problem with test for one unit, Collection")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import datetime
 import numpy as np
 import os
 import pandas as pd
+import shutil
 import subprocess
 import unittest
 
@@ -14,7 +15,7 @@ class MyTestCase(unittest.TestCase):
 
     def tearDown(self):
         """
-        Deletes the Excel spreadsheets produced by the script, if they were made by the test.
+        Deletes the Excel spreadsheets and cache folder produced by the script, if they were made by the test.
         """
         date = datetime.date.today().strftime("%Y%m")
         file_paths = [os.path.join("script", f"dlg-magil_risk_report_{date}.xlsx"),
@@ -23,6 +24,8 @@ class MyTestCase(unittest.TestCase):
         for file_path in file_paths:
             if os.path.exists(file_path):
                 os.remove(file_path)
+        if os.path.exists(os.path.join("script", "department_reports_cache")):
+            shutil.rmtree(os.path.join("script", "department_reports_cache"))
 
     def test_argument_error(self):
         """
@@ -40,7 +43,8 @@ class MyTestCase(unittest.TestCase):
         msg_result = output.stdout.decode("utf-8")
         msg_expected = "Required argument current_formats_csv is missing\r\n" \
                        "Required argument previous_formats_csv is missing\r\n" \
-                       "Script usage: python path/department_reports.py current_formats_csv previous_formats_csv\r\n"
+                       "Script usage: python path/department_reports.py current_formats_csv previous_formats_csv " \
+                       "[group ...]\r\n"
         self.assertEqual(msg_result, msg_expected, "Problem with test for error argument, message")
 
     def test_one_department(self):
@@ -61,6 +65,7 @@ class MyTestCase(unittest.TestCase):
         df_coll = pd.read_excel(df, "Collection_Risk_Levels")
         df_aip = pd.read_excel(df, "AIP_Risk_Levels")
         df_format = pd.read_excel(df, "Formats")
+        df_aip_format = pd.read_excel(df, "AIP_Formats")
         df.close()
 
         # Tests if the DLG-MAGIL AIP Risk Data sheet has the expected values.
@@ -152,6 +157,59 @@ class MyTestCase(unittest.TestCase):
                            ["gyca_gaphind", True, True, False]]
         self.assertEqual(result_format, expected_format, "Problem with DLG-MAGIL Formats")
 
+        # Tests if the DLG-MAGIL AIP Formats sheet has the expected values.
+        result_aip_format = [df_aip_format.columns.tolist()] + df_aip_format.values.tolist()
+        tiff_dlf = "TIFF DLF Benchmark for Faithful Digital Reproductions of Monographs and Serials: color (No Match)"
+        tiff = "Tagged Image File Format (Low Risk)"
+        expected_aip_format = [["Collection", "AIP", "2023_NARA_Risk_Level", "Format"],
+                               ["dlg_sanb", "dlg_sanb_savannah-1884", "Low Risk", tiff],
+                               ["dlg_sanb", "dlg_sanb_savannah-1888", "Low Risk", tiff],
+                               ["gyca_gaphind", "gyca_gaphind_appling-1952", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_appling-1952", "Low Risk", "Plain text (Low Risk)"],
+                               ["gyca_gaphind", "gyca_gaphind_appling-1962", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_appling-1962", "Low Risk", "Plain text (Low Risk)"],
+                               ["gyca_gaphind", "gyca_gaphind_appling-1968", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_appling-1968", "Low Risk", "Plain text (Low Risk)"],
+                               ["gyca_gaphind", "gyca_gaphind_atkinson-1939", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_atkinson-1947", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_bacon-1956-57", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_bacon-1962-63", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_bacon-1962-63", "Low Risk", "Plain text (Low Risk)"],
+                               ["gyca_gaphind", "gyca_gaphind_bacon-1968", "No Match", tiff_dlf],
+                               ["gyca_gaphind", "gyca_gaphind_bacon-1968", "Low Risk", "Plain text (Low Risk)"]]
+        self.assertEqual(result_aip_format, expected_aip_format, "Problem with DLG-MAGIL AIP Formats")
+
+    def test_selected_department(self):
+        """
+        Test for running the script on valid archive_formats_by_aip CSVs with two departments,
+        with an optional argument to only make the report for one department.
+        """
+        # Runs the script.
+        script_path = os.path.join("..", "..", "department_reports.py")
+        formats_current = os.path.join("script", "archive_formats_by_aip_2023-09.csv")
+        formats_previous = os.path.join("script", "archive_formats_by_aip_2021-08.csv")
+        subprocess.run(f"python {script_path} {formats_current} {formats_previous} bmac")
+
+        # Tests that only the BMAC report was made.
+        date = datetime.date.today().strftime("%Y%m")
+        result_reports = [os.path.exists(os.path.join("script", f"bmac_risk_report_{date}.xlsx")),
+                          os.path.exists(os.path.join("script", f"hargrett_risk_report_{date}.xlsx"))]
+        expected_reports = [True, False]
+        self.assertEqual(result_reports, expected_reports, "Problem with test for selected department, reports")
+
+        # Tests if the BMAC AIP Risk Data sheet has the expected values,
+        # which are the same as when the reports are made for every department.
+        df_bmac_data = pd.read_excel(os.path.join("script", f"bmac_risk_report_{date}.xlsx"), "AIP_Risk_Data")
+        result_bmac_data = [df_bmac_data.columns.tolist()] + df_bmac_data.values.tolist()
+        expected_bmac_data = [["Group", "Collection", "AIP", "Format_Name", "Format_Version", "PRONOM_URL",
+                               "2023_NARA_Risk_Level", "2023_NARA_Proposed_Preservation_Plan",
+                               "2021_NARA_Risk_Level", "Risk_Level_Change"],
+                              ["bmac", "hm-lawton", "bmac_hm-lawton_0001", "Wave", "NO VALUE", "NO VALUE",
+                               "Low Risk", "Retain", "Low Risk", "Unchanged"],
+                              ["bmac", "hm-lawton", "bmac_hm-lawton_0002", "cue", "NO VALUE", "NO VALUE",
+                               "Moderate Risk", "Retain", "No Match", "New Match"]]
+        self.assertEqual(result_bmac_data, expected_bmac_data, "Problem with test for selected department, data")
+
     def test_two_departments(self):
         """
         Test for running the script on valid archive_formats_by_aip CSVs with two departments.
@@ -0,0 +1,70 @@
+"""
+Tests for the function check_arguments(),
+which verifies the required argument store_folder is present and any optional formats_csv are correct.
+
+For input, tests use lists with the same format as sys.argv and files in the format_trends folder of this script repo.
+"""
+
+import os
+import unittest
+from format_trends import check_arguments
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_store_only(self):
+        """
+        Test for only the required argument, which does not need to exist yet.
+        """
+        # Runs the function being tested.
+        store_path, csv_paths, errors = check_arguments(["format_trends.py", "new_store"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(store_path, "new_store", "Problem with test for store only, store_path")
+        self.assertEqual(csv_paths, [], "Problem with test for store only, csv_paths")
+        self.assertEqual(errors, [], "Problem with test for store only, errors")
+
+    def test_csvs(self):
+        """
+        Test for the required argument and two correct formats_csv.
+        """
+        # Runs the function being tested.
+        csv_1 = os.path.join("snapshots", "archive_formats_by_group_2021-11.csv")
+        csv_2 = os.path.join("snapshots", "archive_formats_by_group_2023-11.csv")
+        store_path, csv_paths, errors = check_arguments(["format_trends.py", "store", csv_1, csv_2])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(store_path, "store", "Problem with test for csvs, store_path")
+        self.assertEqual(csv_paths, [csv_1, csv_2], "Problem with test for csvs, csv_paths")
+        self.assertEqual(errors, [], "Problem with test for csvs, errors")
+
+    def test_missing(self):
+        """
+        Test for no arguments.
+        """
+        # Runs the function being tested.
+        store_path, csv_paths, errors = check_arguments(["format_trends.py"])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(store_path, None, "Problem with test for missing, store_path")
+        self.assertEqual(errors, ["Required argument store_folder is missing"], "Problem with test for missing, errors")
+
+    def test_csv_errors(self):
+        """
+        Test for a formats_csv that does not exist and one that is not a merged format report.
+        """
+        # Runs the function being tested.
+        csv_missing = os.path.join("snapshots", "archive_formats_by_group_2019-11.csv")
+        csv_wrong = "test_check_arguments.py"
+        store_path, csv_paths, errors = check_arguments(["format_trends.py", "store", csv_missing, csv_wrong])
+
+        # Tests if the function output has the expected values.
+        self.assertEqual(csv_paths, [], "Problem with test for csv errors, csv_paths")
+        expected = [f"formats_csv '{csv_missing}' does not exist",
+                    "'test_check_arguments.py' is not the correct type (should be archive_formats_by_group_YYYY-MM.csv "
+                    "or archive_formats_by_aip_YYYY-MM.csv)"]
+        self.assertEqual(errors, expected, "Problem with test for csv errors, errors")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+Tests for the function ingest_snapshot(),
+which adds a merged format report to the snapshot store, with each column saved as a separate file.
+
+For input, tests use files in the format_trends folder of this script repo.
+The snapshot store is made in the test folder and deleted after each test.
+"""
+
+import os
+import shutil
+import unittest
+from format_trends import ingest_snapshot, read_snapshots
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the snapshot store and copied CSV made by the test, if they were made."""
+        if os.path.exists("ingest_store"):
+            shutil.rmtree("ingest_store")
+        if os.path.exists("archive_formats_by_group_2025-11.csv"):
+            os.remove("archive_formats_by_group_2025-11.csv")
+
+    def test_new(self):
+        """
+        Test for adding a report that is not in the store, which makes a file for each column.
+        """
+        # Runs the function being tested.
+        added = ingest_snapshot(os.path.join("snapshots", "archive_formats_by_group_2021-11.csv"), "ingest_store")
+
+        # Tests if the function returned that the report was added.
+        self.assertEqual(added, True, "Problem with test for new, added")
+
+        # Tests if the partition has the expected files.
+        result = sorted(os.listdir(os.path.join("ingest_store", "by_group", "2021-11")))
+        expected = ["File_IDs.pickle", "Format_Identification.pickle", "Format_Name.pickle", "Format_Note.pickle",
+                    "Format_Standardized_Name.pickle", "Format_Type.pickle", "Format_Version.pickle",
+                    "Group.pickle", "NARA_Format_Name.pickle", "NARA_Match_Type.pickle", "NARA_PRONOM_URL.pickle",
+                    "NARA_Proposed_Preservation_Plan.pickle", "NARA_Risk_Level.pickle", "Registry_Key.pickle",
+                    "Registry_Name.pickle", "Size_GB.pickle", "_source.txt"]
+        self.assertEqual(result, expected, "Problem with test for new, files")
+
+        # Tests if the versions are kept as text and the file_ids and size are numbers.
+        df = read_snapshots("ingest_store", "by_group", ["Format_Version", "File_IDs", "Size_GB"])
+        result = df.values.tolist()
+        expected = [["2021-11", "NO VALUE", 100, 500.5],
+                    ["2021-11", "6.0", 2000, 80.25],
+                    ["2021-11", "1.4", 50, 1.1],
+                    ["2021-11", "6.0", 10, 0.5]]
+        self.assertEqual(result, expected, "Problem with test for new, values")
+
+    def test_unchanged(self):
+        """
+        Test for adding a report a second time when it has not changed, which is not added again.
+        """
+        # Runs the function being tested twice.
+        csv_path = os.path.join("snapshots", "archive_formats_by_group_2021-11.csv")
+        ingest_snapshot(csv_path, "ingest_store")
+        added = ingest_snapshot(csv_path, "ingest_store")
+
+        # Tests if the function returned that the report was not added.
+        self.assertEqual(added, False, "Problem with test for unchanged")
+
+    def test_changed(self):
+        """
+        Test for adding a report a second time after it has changed, which replaces the earlier version.
+        """
+        # Adds a copy of a report to the store and then edits the copy to change a file_id count.
+        csv_path = "archive_formats_by_group_2025-11.csv"
+        shutil.copy(os.path.join("snapshots", "archive_formats_by_group_2021-11.csv"), csv_path)
+        ingest_snapshot(csv_path, "ingest_store")
+        with open(csv_path) as csv_open:
+            text = csv_open.read()
+        with open(csv_path, "w") as csv_open:
+            csv_open.write(text.replace("bmac,100,", "bmac,101,"))
+
+        # Runs the function being tested.
+        added = ingest_snapshot(csv_path, "ingest_store")
+
+        # Tests if the function returned that the report was added, and the store has the new value.
+        self.assertEqual(added, True, "Problem with test for changed, added")
+        df = read_snapshots("ingest_store", "by_group", ["Group", "File_IDs"])
+        result = df.values.tolist()
+        expected = [["2025-11", "bmac", 101], ["2025-11", "dlg", 2000], ["2025-11", "dlg", 50],
+                    ["2025-11", "hargrett", 10]]
+        self.assertEqual(result, expected, "Problem with test for changed, values")
+
+
+if __name__ == '__main__':
+    unittest.main()
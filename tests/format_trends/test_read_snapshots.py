@@ -0,0 +1,80 @@
+"""
+Tests for the function read_snapshots(),
+which reads the specified columns from every snapshot of one report type in the snapshot store.
+
+For input, tests use files in the format_trends folder of this script repo, which are added to a snapshot store
+made in the test folder and deleted after each test.
+"""
+
+import os
+import shutil
+import unittest
+from format_trends import ingest_snapshot, read_snapshots
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes a snapshot store with both test reports."""
+        ingest_snapshot(os.path.join("snapshots", "archive_formats_by_group_2023-11.csv"), "read_store")
+        ingest_snapshot(os.path.join("snapshots", "archive_formats_by_group_2021-11.csv"), "read_store")
+
+    def tearDown(self):
+        """Deletes the snapshot store made by the test."""
+        shutil.rmtree("read_store")
+
+    def test_columns(self):
+        """
+        Test for reading two columns from both snapshots, which are in order by date.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        df = read_snapshots("read_store", "by_group", ["Format_Standardized_Name", "NARA_Risk_Level"])
+        result = [df.columns.tolist()] + df.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Snapshot", "Format_Standardized_Name", "NARA_Risk_Level"],
+                    ["2021-11", "Quicktime", "Low Risk"],
+                    ["2021-11", "TIFF", "Low Risk"],
+                    ["2021-11", "PDF", "Moderate Risk"],
+                    ["2021-11", "TIFF", "Low Risk"],
+                    ["2023-11", "Quicktime", "Low Risk"],
+                    ["2023-11", "TIFF", "Low Risk"],
+                    ["2023-11", "JPEG", "Low Risk"],
+                    ["2023-11", "Plain Text", "No Match"]]
+        self.assertEqual(result, expected, "Problem with test for columns")
+
+    def test_missing_column(self):
+        """
+        Test for reading a column that is not in the snapshots, which is blank.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        df = read_snapshots("read_store", "by_group", ["Group", "Collection"])
+        result = [df.columns.tolist()] + df.fillna("BLANK").values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Snapshot", "Group", "Collection"],
+                    ["2021-11", "bmac", "BLANK"],
+                    ["2021-11", "dlg", "BLANK"],
+                    ["2021-11", "dlg", "BLANK"],
+                    ["2021-11", "hargrett", "BLANK"],
+                    ["2023-11", "bmac", "BLANK"],
+                    ["2023-11", "dlg", "BLANK"],
+                    ["2023-11", "dlg", "BLANK"],
+                    ["2023-11", "hargrett", "BLANK"]]
+        self.assertEqual(result, expected, "Problem with test for missing column")
+
+    def test_no_snapshots(self):
+        """
+        Test for a report type without any snapshots in the store, which is a dataframe with only the columns.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        df = read_snapshots("read_store", "by_aip", ["Group", "AIP"])
+        result = [df.columns.tolist()] + df.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Snapshot", "Group", "AIP"]]
+        self.assertEqual(result, expected, "Problem with test for no snapshots")
+
+
+if __name__ == '__main__':
+    unittest.main()
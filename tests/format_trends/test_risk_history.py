@@ -0,0 +1,90 @@
+"""
+Tests for the function risk_history(),
+which makes a table of the NARA risk level of each format in each AIP in every by_aip snapshot in the store.
+
+For input, tests use files in the format_trends folder of this script repo, which are added to a snapshot store
+made in the test folder and deleted after each test.
+"""
+
+import numpy as np
+import os
+import shutil
+import unittest
+from format_trends import ingest_snapshot, risk_history
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """Deletes the snapshot store and report made by the test, if any."""
+        if os.path.exists("history_store"):
+            shutil.rmtree("history_store")
+        if os.path.exists("archive_formats_by_aip_2024-11.csv"):
+            os.remove("archive_formats_by_aip_2024-11.csv")
+
+    def test_three_snapshots(self):
+        """
+        Test for three by_aip snapshots, with formats that are only in some snapshots and risk levels that change.
+        """
+        # Makes a snapshot store with the three by_aip test reports.
+        for snapshot_date in ("2021-11", "2022-11", "2023-11"):
+            ingest_snapshot(os.path.join("snapshots", f"archive_formats_by_aip_{snapshot_date}.csv"), "history_store")
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        history = risk_history("history_store")
+        result = [history.columns.tolist()] + history.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Group", "Collection", "AIP", "Format_Identification", "2021-11", "2022-11", "2023-11"],
+                    ["dlg", "dlg_ghn", "dlg_ghn_1", "Tagged Image File Format|6.0|NO VALUE",
+                     "Low Risk", "Low Risk", "Low Risk"],
+                    ["dlg", "dlg_ghn", "dlg_ghn_2", "PDF|1.4|fmt/18", "Moderate Risk", "High Risk", np.NaN],
+                    ["dlg", "dlg_ghn", "dlg_ghn_3", "Tagged Image File Format|6.0|NO VALUE",
+                     np.NaN, np.NaN, "Low Risk"],
+                    ["hargrett", "harg-0000", "harg-0000-0001-er", "Plain text|NO VALUE|x-fmt/111",
+                     np.NaN, "No Match", "Low Risk"]]
+        self.assertEqual(result, expected, "Problem with test for three snapshots")
+
+    def test_blank_risk(self):
+        """
+        Test for a format identification that is in an AIP twice in the same snapshot, once with a blank risk level,
+        where the risk level that is not blank is kept.
+        """
+        # Makes a by_aip report and adds it to a snapshot store.
+        with open("archive_formats_by_aip_2024-11.csv", "w", newline="") as csv_open:
+            csv_open.write("Group,Collection,AIP,Format_Type,Format_Standardized_Name,Format_Identification,"
+                           "Format_Name,Format_Version,Registry_Name,Registry_Key,Format_Note,NARA_Format_Name,"
+                           "NARA_PRONOM_URL,NARA_Risk_Level,NARA_Proposed_Preservation_Plan,NARA_Match_Type\n"
+                           "dlg,dlg_ghn,dlg_ghn_1,text,PDF,PDF|1.4|fmt/18,PDF,1.4,PRONOM,fmt/18,NO VALUE,"
+                           "PDF 1.4,https://www.nationalarchives.gov.uk/pronom/fmt/18,Moderate Risk,Transform,PRONOM\n"
+                           "dlg,dlg_ghn,dlg_ghn_1,text,PDF,PDF|1.4|fmt/18,PDF,1.4,PRONOM,fmt/18,NO VALUE,"
+                           "PDF 1.4,,,,PRONOM\n")
+        ingest_snapshot("archive_formats_by_aip_2024-11.csv", "history_store")
+
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        history = risk_history("history_store")
+        result = [history.columns.tolist()] + history.values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["Group", "Collection", "AIP", "Format_Identification", "2024-11"],
+                    ["dlg", "dlg_ghn", "dlg_ghn_1", "PDF|1.4|fmt/18", "Moderate Risk"]]
+        self.assertEqual(result, expected, "Problem with test for blank risk")
+
+    def test_by_group_only(self):
+        """
+        Test for a store with only by_group snapshots, which has no rows.
+        """
+        # Makes a snapshot store with one by_group test report.
+        ingest_snapshot(os.path.join("snapshots", "archive_formats_by_group_2021-11.csv"), "history_store")
+
+        # Runs the function being tested.
+        history = risk_history("history_store")
+
+        # Tests if the function output has the expected values.
+        result = [history.columns.tolist()] + history.values.tolist()
+        expected = [["Group", "Collection", "AIP", "Format_Identification"]]
+        self.assertEqual(result, expected, "Problem with test for by_group only")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Tests the entire script format_trends.py,
+which adds merged format reports to a snapshot store and makes a spreadsheet of the trends across the snapshots.
+
+For input, tests use files in the format_trends folder of this script repo.
+"""
+
+import os
+import pandas as pd
+import shutil
+import subprocess
+import unittest
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Deletes the snapshot store produced by the script, if made by the test.
+        """
+        if os.path.exists("script_store"):
+            shutil.rmtree("script_store")
+
+    def test_script(self):
+        """
+        Test for running the script with two reports, which are added to the store one at a time.
+        """
+        # Runs the script with the first report and then with the second report,
+        # so the second run uses the first report from the store.
+        script_path = os.path.join("..", "..", "format_trends.py")
+        csv_1 = os.path.join("snapshots", "archive_formats_by_group_2021-11.csv")
+        csv_2 = os.path.join("snapshots", "archive_formats_by_group_2023-11.csv")
+        subprocess.run(f"python {script_path} script_store {csv_1}", shell=True)
+        subprocess.run(f"python {script_path} script_store {csv_2}", shell=True)
+
+        # Reads each sheet in the Excel file into a separate dataframe.
+        trends = pd.ExcelFile(os.path.join("script_store", "ARCHive-Formats-Trends.xlsx"))
+        df_type = pd.read_excel(trends, "Format_Type_File_IDs")
+        df_name = pd.read_excel(trends, "Format_Name_File_IDs")
+        df_risk = pd.read_excel(trends, "Risk_Level_File_IDs")
+        df_size = pd.read_excel(trends, "Risk_Level_Size_GB")
+        trends.close()
+
+        # Tests the values in the Format_Type_File_IDs sheet are correct.
+        result_type = [df_type.columns.tolist()] + df_type.values.tolist()
+        expected_type = [["Format_Type", "2021-11", "2023-11"],
+                         ["image", 2010, 3005],
+                         ["text", 50, 20],
+                         ["video", 100, 150]]
+        self.assertEqual(result_type, expected_type, "Problem with test for script, Format_Type_File_IDs")
+
+        # Tests the values in the Format_Name_File_IDs sheet are correct.
+        result_name = [df_name.columns.tolist()] + df_name.values.tolist()
+        expected_name = [["Format_Standardized_Name", "2021-11", "2023-11"],
+                         ["JPEG", 0, 5],
+                         ["PDF", 50, 0],
+                         ["Plain Text", 0, 20],
+                         ["Quicktime", 100, 150],
+                         ["TIFF", 2010, 3000]]
+        self.assertEqual(result_name, expected_name, "Problem with test for script, Format_Name_File_IDs")
+
+        # Tests the values in the Risk_Level_File_IDs sheet are correct.
+        result_risk = [df_risk.columns.tolist()] + df_risk.values.tolist()
+        expected_risk = [["NARA_Risk_Level", "2021-11", "2023-11"],
+                         ["Low Risk", 2110, 3155],
+                         ["Moderate Risk", 50, 0],
+                         ["No Match", 0, 20]]
+        self.assertEqual(result_risk, expected_risk, "Problem with test for script, Risk_Level_File_IDs")
+
+        # Tests the values in the Risk_Level_Size_GB sheet are correct.
+        result_size = [df_size.columns.tolist()] + df_size.values.tolist()
+        expected_size = [["NARA_Risk_Level", "2021-11", "2023-11"],
+                         ["Low Risk", 581.25, 870.76],
+                         ["Moderate Risk", 1.1, 0],
+                         ["No Match", 0, 2.5]]
+        self.assertEqual(result_size, expected_size, "Problem with test for script, Risk_Level_Size_GB")
+
+        # Tests the risk history CSV was not made, since there are no by_aip reports in the store.
+        self.assertFalse(os.path.exists(os.path.join("script_store", "ARCHive-Risk-History.csv")),
+                         "Problem with test for script, risk history")
+
+    def test_risk_history(self):
+        """
+        Test for running the script with three by_aip reports, which makes the risk history CSV.
+        """
+        # Runs the script with all three by_aip reports at once.
+        script_path = os.path.join("..", "..", "format_trends.py")
+        csv_paths = [os.path.join("snapshots", f"archive_formats_by_aip_{date}.csv")
+                     for date in ("2021-11", "2022-11", "2023-11")]
+        subprocess.run(f"python {script_path} script_store {' '.join(csv_paths)}", shell=True)
+
+        # Tests the values in the risk history CSV are correct.
+        df = pd.read_csv(os.path.join("script_store", "ARCHive-Risk-History.csv"))
+        result = [df.columns.tolist()] + df.fillna("BLANK").values.tolist()
+        expected = [["Group", "Collection", "AIP", "Format_Identification", "2021-11", "2022-11", "2023-11"],
+                    ["dlg", "dlg_ghn", "dlg_ghn_1", "Tagged Image File Format|6.0|NO VALUE",
+                     "Low Risk", "Low Risk", "Low Risk"],
+                    ["dlg", "dlg_ghn", "dlg_ghn_2", "PDF|1.4|fmt/18", "Moderate Risk", "High Risk", "BLANK"],
+                    ["dlg", "dlg_ghn", "dlg_ghn_3", "Tagged Image File Format|6.0|NO VALUE",
+                     "BLANK", "BLANK", "Low Risk"],
+                    ["hargrett", "harg-0000", "harg-0000-0001-er", "Plain text|NO VALUE|x-fmt/111",
+                     "BLANK", "No Match", "Low Risk"]]
+        self.assertEqual(result, expected, "Problem with test for risk history")
+
+    def test_missing_argument(self):
+        """
+        Test for running the script without the required argument, which exits the script.
+        """
+        script_path = os.path.join("..", "..", "format_trends.py")
+        with self.assertRaises(subprocess.CalledProcessError):
+            subprocess.run(f"python {script_path}", shell=True, check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+"""
+Tests for the function snapshot_name(),
+which gets the report type and date from the file name of a merged format report.
+"""
+
+import os
+import unittest
+from format_trends import snapshot_name
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_by_group(self):
+        """
+        Test for an archive_formats_by_group report in a folder.
+        """
+        name = snapshot_name(os.path.join("archive_reports_2023-11-01", "archive_formats_by_group_2023-11.csv"))
+        self.assertEqual(name, ("by_group", "2023-11"), "Problem with test for by group")
+
+    def test_by_aip(self):
+        """
+        Test for an archive_formats_by_aip report.
+        """
+        name = snapshot_name("archive_formats_by_aip_2021-10.csv")
+        self.assertEqual(name, ("by_aip", "2021-10"), "Problem with test for by aip")
+
+    def test_no_date(self):
+        """
+        Test for a merged format report without a date, which does not match.
+        """
+        name = snapshot_name("archive_formats_by_group.csv")
+        self.assertEqual(name, None, "Problem with test for no date")
+
+    def test_other_report(self):
+        """
+        Test for a report that is not a merged format report, which does not match.
+        """
+        name = snapshot_name("usage_report_20210101_20211231.csv")
+        self.assertEqual(name, None, "Problem with test for other report")
+
+
+if __name__ == '__main__':
+    unittest.main()
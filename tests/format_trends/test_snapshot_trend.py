@@ -0,0 +1,60 @@
+"""
+Tests for the function snapshot_trend(),
+which calculates the total of a value for each instance of a category in every by_group snapshot in the store.
+
+For input, tests use files in the format_trends folder of this script repo, which are added to a snapshot store
+made in the test folder and deleted after each test.
+"""
+
+import os
+import shutil
+import unittest
+from format_trends import ingest_snapshot, snapshot_trend
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """Makes a snapshot store with both test reports."""
+        ingest_snapshot(os.path.join("snapshots", "archive_formats_by_group_2021-11.csv"), "trend_store")
+        ingest_snapshot(os.path.join("snapshots", "archive_formats_by_group_2023-11.csv"), "trend_store")
+
+    def tearDown(self):
+        """Deletes the snapshot store made by the test."""
+        shutil.rmtree("trend_store")
+
+    def test_format_name(self):
+        """
+        Test for file_ids by format standardized name, including names that are only in one snapshot.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        trend = snapshot_trend("trend_store", "Format_Standardized_Name")
+        result = [trend.columns.tolist()] + trend.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["2021-11", "2023-11"],
+                    ["JPEG", 0, 5],
+                    ["PDF", 50, 0],
+                    ["Plain Text", 0, 20],
+                    ["Quicktime", 100, 150],
+                    ["TIFF", 2010, 3000]]
+        self.assertEqual(result, expected, "Problem with test for format name")
+
+    def test_risk_size(self):
+        """
+        Test for size by NARA risk level, which is in order of increasing risk.
+        """
+        # Runs the function being tested and converts the output into a list for easier comparison.
+        trend = snapshot_trend("trend_store", "NARA_Risk_Level", "Size_GB")
+        result = [trend.columns.tolist()] + trend.reset_index().values.tolist()
+
+        # Tests if the function output has the expected values.
+        expected = [["2021-11", "2023-11"],
+                    ["Low Risk", 581.25, 870.76],
+                    ["Moderate Risk", 1.1, 0.0],
+                    ["No Match", 0.0, 2.5]]
+        self.assertEqual(result, expected, "Problem with test for risk size")
+
+
+if __name__ == '__main__':
+    unittest.main()
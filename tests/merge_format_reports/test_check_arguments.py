@@ -21,7 +21,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py") 
         sys_argv = [script_path, "reports_one", "NARA_PreservationActionPlan_FileFormats_test.csv"]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         expected = "reports_one"
@@ -31,6 +31,9 @@ class MyTestCase(unittest.TestCase):
         expected = "NARA_PreservationActionPlan_FileFormats_test.csv"
         self.assertEqual(nara_csv, expected, "Problem with both: correct, nara path")
         
+        # Tests that the value of partition is correct.
+        self.assertEqual(partition, False, "Problem with both: correct, partition")
+
         # Tests that the value of errors_list is correct.
         self.assertEqual(errors_list, [], "Problem with both: correct, errors list")
 
@@ -41,7 +44,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py")
         sys_argv = [script_path]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         self.assertEqual(report_folder, None, "Problem with both: missing, report path")
@@ -61,7 +64,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py")
         sys_argv = [script_path, "reports_error", "nara_error.csv"]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         expected = "reports_error"
@@ -85,7 +88,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py")
         sys_argv = [script_path, "NARA_PreservationActionPlan_FileFormats_test.csv"]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         expected = "NARA_PreservationActionPlan_FileFormats_test.csv"
@@ -107,7 +110,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py")
         sys_argv = [script_path, "reports_error", "NARA_PreservationActionPlan_FileFormats_test.csv"]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         expected = "reports_error"
@@ -129,7 +132,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py")
         sys_argv = [script_path, "reports_one"]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         expected = "reports_one"
@@ -150,7 +153,7 @@ class MyTestCase(unittest.TestCase):
         # Makes the variable used for function input and runs the function being tested.
         script_path = os.path.join(sys.path[1], "merge_format_reports.py")
         sys_argv = [script_path, "reports_one", "nara_error.csv"]
-        report_folder, nara_csv, errors_list = check_arguments(sys_argv)
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
 
         # Tests that the value of report_folder is correct.
         expected = "reports_one"
@@ -164,6 +167,37 @@ class MyTestCase(unittest.TestCase):
         expected = ["NARA CSV 'nara_error.csv' does not exist"]
         self.assertEqual(errors_list, expected, "Problem with NARA: path error, errors list")
 
+    def test_partition(self):
+        """
+        Test for when both required arguments are correct and the optional argument is partition.
+        """
+        # Makes the variable used for function input and runs the function being tested.
+        script_path = os.path.join(sys.path[1], "merge_format_reports.py")
+        sys_argv = [script_path, "reports_one", "NARA_PreservationActionPlan_FileFormats_test.csv", "partition"]
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
+
+        # Tests that the value of partition is correct.
+        self.assertEqual(partition, True, "Problem with partition: correct, partition")
+
+        # Tests that the value of errors_list is correct.
+        self.assertEqual(errors_list, [], "Problem with partition: correct, errors list")
+
+    def test_partition_error(self):
+        """
+        Test for when both required arguments are correct and the optional argument is not partition.
+        """
+        # Makes the variable used for function input and runs the function being tested.
+        script_path = os.path.join(sys.path[1], "merge_format_reports.py")
+        sys_argv = [script_path, "reports_one", "NARA_PreservationActionPlan_FileFormats_test.csv", "partitions"]
+        report_folder, nara_csv, partition, errors_list = check_arguments(sys_argv)
+
+        # Tests that the value of partition is correct.
+        self.assertEqual(partition, False, "Problem with partition: error, partition")
+
+        # Tests that the value of errors_list is correct.
+        expected = ["Optional argument 'partitions' is not partition"]
+        self.assertEqual(errors_list, expected, "Problem with partition: error, errors list")
+
 
 if __name__ == '__main__':
     unittest.main()
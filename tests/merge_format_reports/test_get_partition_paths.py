@@ -0,0 +1,85 @@
+"""
+Tests for the function get_partition_paths(),
+which gets the paths to the CSVs for each group saved from archive_formats_by_aip.csv by save_partitions().
+
+For input, tests use a CSV in the save_partitions folder of this script repo,
+which is partitioned by the test since the function compares the time the files were saved.
+"""
+
+import os
+import shutil
+import unittest
+from merge_format_reports import get_partition_paths, save_partitions
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Variables with constant values used in all of the tests.
+        """
+        self.aip_csv = os.path.join("save_partitions", "archive_formats_by_aip_2023-08.csv")
+        self.partition_folder = os.path.join("save_partitions", "archive_formats_by_aip_2023-08")
+
+    def tearDown(self):
+        """
+        Deletes the partition folder produced by the test, if it is made.
+        """
+        if os.path.exists(self.partition_folder):
+            shutil.rmtree(self.partition_folder)
+
+    def test_all_groups(self):
+        """
+        Test for getting the CSVs for every group, which are in the order of the manifest.
+        """
+        # Runs the function being tested.
+        save_partitions(self.aip_csv)
+        result = get_partition_paths(self.aip_csv)
+
+        # Tests if the paths are correct.
+        expected = [os.path.join(self.partition_folder, "bmac.csv"),
+                    os.path.join(self.partition_folder, "dlg-magil.csv"),
+                    os.path.join(self.partition_folder, "hargrett.csv")]
+        self.assertEqual(result, expected, "Problem with test for all groups")
+
+    def test_groups(self):
+        """
+        Test for getting the CSVs for some groups, including a group that is not in the by_aip CSV.
+        """
+        # Runs the function being tested.
+        save_partitions(self.aip_csv)
+        result = get_partition_paths(self.aip_csv, ["hargrett", "dlg-magil", "error"])
+
+        # Tests if the paths are correct.
+        expected = [os.path.join(self.partition_folder, "dlg-magil.csv"),
+                    os.path.join(self.partition_folder, "hargrett.csv")]
+        self.assertEqual(result, expected, "Problem with test for groups")
+
+    def test_no_partitions(self):
+        """
+        Test for a by_aip CSV that was not partitioned.
+        """
+        # Runs the function being tested.
+        result = get_partition_paths(self.aip_csv)
+
+        # Tests if the result is None.
+        self.assertEqual(result, None, "Problem with test for no partitions")
+
+    def test_old_partitions(self):
+        """
+        Test for a by_aip CSV that was saved again after it was partitioned, so the partitions are not used.
+        """
+        # Partitions the CSV and then makes the manifest older than the CSV.
+        save_partitions(self.aip_csv)
+        old_time = os.path.getmtime(self.aip_csv) - 60
+        os.utime(os.path.join(self.partition_folder, "manifest.csv"), (old_time, old_time))
+
+        # Runs the function being tested.
+        result = get_partition_paths(self.aip_csv)
+
+        # Tests if the result is None.
+        self.assertEqual(result, None, "Problem with test for old partitions")
+
+
+if __name__ == '__main__':
+    unittest.main()
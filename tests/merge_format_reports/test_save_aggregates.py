@@ -0,0 +1,62 @@
+"""
+Tests for the function save_aggregates(),
+which saves the number of unique values in each set made by update_aggregates() to a CSV.
+"""
+
+import csv
+import os
+import unittest
+from merge_format_reports import save_aggregates, update_aggregates
+
+
+def csv_to_list(csv_path):
+    """
+    Converts the information in a CSV to a list, where item is a list with one row's contents.
+    Used to compare the script output to expected results.
+    """
+    with open(csv_path, newline="") as open_csv:
+        read_csv = csv.reader(open_csv)
+        row_list = list(read_csv)
+    return row_list
+
+
+class MyTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        """
+        Deletes the CSV, if made by the test.
+        """
+        if os.path.exists("archive_formats_aggregates_2023-08.csv"):
+            os.remove("archive_formats_aggregates_2023-08.csv")
+
+    def test_save_aggregates(self):
+        """
+        Test for the function working correctly. Rows are in order by category, and then by instance.
+        There is no error handling or variations of input to test.
+        """
+        # Makes the aggregates used for function input.
+        aggregates = {}
+        aip_rows = [["dlg", "dlg_ghn", "batch_gua_1", "image", "TIFF", "TIFF|6|fmt/353"],
+                    ["dlg", "dlg_ghn", "batch_gua_2", "image", "JPEG", "JPEG EXIF|2.1|x-fmt/390"],
+                    ["bmac", "peabody", "bmac_1", "audio", "WAVE", "Wave|NO VALUE|NO VALUE"],
+                    ["bmac", "wsbn", "bmac_wsbn_1", "image", "TIFF", "TIFF|6|fmt/353"]]
+        update_aggregates(aggregates, aip_rows)
+
+        # Runs the function being tested.
+        save_aggregates("archive_formats_aggregates_2023-08.csv", aggregates)
+
+        # Tests that the content of the CSV contains the correct information.
+        result = csv_to_list("archive_formats_aggregates_2023-08.csv")
+        expected = [["Category", "Instance", "Collections", "AIPs", "Format_Types", "Format_Standardized_Names"],
+                    ["Group", "bmac", "2", "2", "2", "2"],
+                    ["Group", "dlg", "1", "2", "1", "2"],
+                    ["Format_Type", "audio", "1", "1", "", ""],
+                    ["Format_Type", "image", "2", "3", "", ""],
+                    ["Format_Standardized_Name", "JPEG", "1", "1", "", ""],
+                    ["Format_Standardized_Name", "TIFF", "2", "2", "", ""],
+                    ["Format_Standardized_Name", "WAVE", "1", "1", "", ""]]
+        self.assertEqual(result, expected, "Problem with test for save aggregates")
+
+
+if __name__ == '__main__':
+    unittest.main()
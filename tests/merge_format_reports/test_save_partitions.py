@@ -0,0 +1,109 @@
+"""
+Tests for the function save_partitions(),
+which saves the rows for each group in archive_formats_by_aip.csv to a separate CSV, with a manifest.
+
+For input, tests use a CSV in the save_partitions folder of this script repo,
+with the rows for each group not all together and values that pandas would change (a comma, NA, and a blank).
+"""
+
+import csv
+import os
+import shutil
+import unittest
+from merge_format_reports import save_partitions
+
+
+def csv_to_list(csv_path):
+    """
+    Converts the information in a CSV to a list, where item is a list with one row's contents.
+    Used to compare the function output to expected results.
+    """
+    with open(csv_path, newline="") as open_csv:
+        read_csv = csv.reader(open_csv)
+        row_list = list(read_csv)
+    return row_list
+
+
+class MyTestCase(unittest.TestCase):
+
+    def setUp(self):
+        """
+        Variables with constant values used in all of the tests.
+        """
+        self.aip_csv = os.path.join("save_partitions", "archive_formats_by_aip_2023-08.csv")
+        self.partition_folder = os.path.join("save_partitions", "archive_formats_by_aip_2023-08")
+
+    def tearDown(self):
+        """
+        Deletes the partition folder produced by the function, if it is made by the test.
+        """
+        if os.path.exists(self.partition_folder):
+            shutil.rmtree(self.partition_folder)
+
+    def test_manifest(self):
+        """
+        Test for the manifest, which has a row for each group in order by group.
+        """
+        # Runs the function being tested.
+        save_partitions(self.aip_csv)
+
+        # Tests if the manifest has the expected values.
+        result = csv_to_list(os.path.join(self.partition_folder, "manifest.csv"))
+        expected = [["Group", "File", "Rows"], ["bmac", "bmac.csv", "2"], ["dlg-magil", "dlg-magil.csv", "1"],
+                    ["hargrett", "hargrett.csv", "2"]]
+        self.assertEqual(result, expected, "Problem with test for manifest")
+
+    def test_partitions(self):
+        """
+        Test for the CSV for each group, which has the header and the rows for that group, in the same order
+        and with the same values as the by_aip CSV.
+        """
+        # Runs the function being tested.
+        save_partitions(self.aip_csv)
+
+        # Tests if the partition folder has the expected files.
+        result = sorted(os.listdir(self.partition_folder))
+        expected = ["bmac.csv", "dlg-magil.csv", "hargrett.csv", "manifest.csv"]
+        self.assertEqual(result, expected, "Problem with test for partitions, files")
+
+        # Tests if the CSV for each group has the expected values.
+        header = ["Group", "Collection", "AIP", "Format_Type", "Format_Standardized_Name", "Format_Identification",
+                  "NARA_Risk_Level"]
+        result = [csv_to_list(os.path.join(self.partition_folder, "bmac.csv")),
+                  csv_to_list(os.path.join(self.partition_folder, "dlg-magil.csv")),
+                  csv_to_list(os.path.join(self.partition_folder, "hargrett.csv"))]
+        expected = [[header,
+                     ["bmac", "peabody", "bmac_51021enr-1a", "audio", "Wave", "Wave|NO VALUE|NO VALUE", "Low Risk"],
+                     ["bmac", "peabody", "bmac_2000002pst-arch", "video", "Matroska", "Matroska|NO VALUE|NO VALUE",
+                      ""]],
+                    [header,
+                     ["dlg-magil", "dlg_sanb", "dlg_sanb_albany-1885", "image", "TIFF",
+                      "Tagged Image File Format|6|fmt/353, with a comma", "NA"]],
+                    [header,
+                     ["hargrett", "harg-ms3786", "harg-ms3786er0001", "image", "JPEG",
+                      "JPEG File Interchange Format|1.02|fmt/44", "Low Risk"],
+                     ["hargrett", "harg-ms3770", "harg-ms3770er0002", "text", "Plain Text File",
+                      "Plain text|NO VALUE|NO VALUE", "Low Risk"]]]
+        self.assertEqual(result, expected, "Problem with test for partitions, CSVs")
+
+    def test_replace(self):
+        """
+        Test for when the partition folder already exists, with a CSV for a group that is not in the by_aip CSV.
+        The folder is replaced, so that CSV is deleted.
+        """
+        # Makes a partition folder with a CSV for a group that is not in the by_aip CSV.
+        os.makedirs(self.partition_folder)
+        with open(os.path.join(self.partition_folder, "old-group.csv"), "w") as old_open:
+            old_open.write("Group\nold-group\n")
+
+        # Runs the function being tested.
+        save_partitions(self.aip_csv)
+
+        # Tests if the partition folder has the expected files.
+        result = sorted(os.listdir(self.partition_folder))
+        expected = ["bmac.csv", "dlg-magil.csv", "hargrett.csv", "manifest.csv"]
+        self.assertEqual(result, expected, "Problem with test for replace")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,7 @@ For input, tests use format archive_reports that are in the merge_format_reports
 import csv
 import datetime
 import os
+import shutil
 import subprocess
 import unittest
 
@@ -37,15 +38,20 @@ class MyTestCase(unittest.TestCase):
 
     def tearDown(self):
         """
-        Deletes the CSVs produced by the script, if it is made by the test.
+        Deletes the CSVs and partition folder produced by the script, if it is made by the test.
         """
         file_paths = [os.path.join("reports_one", f"archive_formats_by_aip_{self.today}.csv"),
                       os.path.join("reports_one", f"archive_formats_by_group_{self.today}.csv"),
+                      os.path.join("reports_one", f"archive_formats_aggregates_{self.today}.csv"),
                       os.path.join("reports_three", f"archive_formats_by_aip_{self.today}.csv"),
-                      os.path.join("reports_three", f"archive_formats_by_group_{self.today}.csv")]
+                      os.path.join("reports_three", f"archive_formats_by_group_{self.today}.csv"),
+                      os.path.join("reports_three", f"archive_formats_aggregates_{self.today}.csv")]
         for file_path in file_paths:
             if os.path.exists(file_path):
                 os.remove(file_path)
+        partition_folder = os.path.join("reports_three", f"archive_formats_by_aip_{self.today}")
+        if os.path.exists(partition_folder):
+            shutil.rmtree(partition_folder)
 
     def test_argument_error(self):
         """
@@ -61,7 +67,7 @@ class MyTestCase(unittest.TestCase):
         output = subprocess.run(f"python {self.script_path} reports_one", shell=True, stdout=subprocess.PIPE)
         msg_result = output.stdout.decode("utf-8")
         msg_expected = "Required argument nara_csv is missing\r\n" \
-                       "Script usage: python path/merge_format_reports.py report_folder nara_csv\r\n"
+                       "Script usage: python path/merge_format_reports.py report_folder nara_csv [partition]\r\n"
         self.assertEqual(msg_result, msg_expected, "Problem with test for error argument, message")
 
     def test_one_report(self):
@@ -143,6 +149,35 @@ class MyTestCase(unittest.TestCase):
                      "https://www.nationalarchives.gov.uk/pronom/x-fmt/111", "Low Risk", "Retain", "Format Name"]]
         self.assertEqual(result, expected, "Problem with one report, archive_formats_by_group.csv")
 
+    def test_partition(self):
+        """
+        Test for a report_folder that contains three ARCHive format reports, with the optional argument partition.
+        The by_aip CSV is also saved as one CSV per group, which together have the same rows as the by_aip CSV.
+        """
+        # Runs the script.
+        subprocess.run(f"python {self.script_path} reports_three {self.nara_csv} partition", shell=True)
+
+        # Tests if the manifest has the expected values.
+        partition_folder = os.path.join("reports_three", f"archive_formats_by_aip_{self.today}")
+        result = csv_to_list(os.path.join(partition_folder, "manifest.csv"))
+        expected = [["Group", "File", "Rows"], ["bmac", "bmac.csv", "3"], ["dlg", "dlg.csv", "3"],
+                    ["hargrett", "hargrett.csv", "3"]]
+        self.assertEqual(result, expected, "Problem with partition, manifest.csv")
+
+        # Tests if the CSVs for each group have the rows for that group from archive_formats_by_aip.csv.
+        aip_rows = csv_to_list(os.path.join("reports_three", f"archive_formats_by_aip_{self.today}.csv"))
+        for group in ("bmac", "dlg", "hargrett"):
+            result = csv_to_list(os.path.join(partition_folder, f"{group}.csv"))
+            expected = [aip_rows[0]] + [row for row in aip_rows[1:] if row[0] == group]
+            self.assertEqual(result, expected, f"Problem with partition, {group}.csv")
+
+        # Tests if the aggregates CSV was saved after the final by_aip CSV, so archive_reports.py will use it.
+        aip_csv = os.path.join("reports_three", f"archive_formats_by_aip_{self.today}.csv")
+        aggregates_csv = os.path.join("reports_three", f"archive_formats_aggregates_{self.today}.csv")
+        aip_time = os.path.getmtime(aip_csv)
+        aggregates_time = os.path.getmtime(aggregates_csv)
+        self.assertGreaterEqual(aggregates_time, aip_time, "Problem with partition, aggregates saved last")
+
     def test_three_reports(self):
         """
         Test for a report_folder that contains three ARCHive format archive_reports.
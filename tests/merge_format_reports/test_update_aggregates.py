@@ -0,0 +1,74 @@
+"""
+Tests for the function update_aggregates(),
+which adds the collections, AIPs, format types, and format standardized names from rows for the "by aip" CSV
+to the sets used to count unique values for each group, format type, and format standardized name.
+"""
+
+import unittest
+from merge_format_reports import update_aggregates
+
+
+def aggregates_to_list(aggregates):
+    """
+    Converts the aggregates dictionary to a sorted list, with the sets sorted as lists, for easier comparison.
+    """
+    result = []
+    for key, values in sorted(aggregates.items()):
+        result.append([key[0], key[1], sorted(values["Collections"]), sorted(values["AIPs"]),
+                       sorted(values["Format_Types"]), sorted(values["Format_Standardized_Names"])])
+    return result
+
+
+class MyTestCase(unittest.TestCase):
+
+    def test_one_report(self):
+        """
+        Test for the rows from one report, with a format in more than one AIP and an AIP with more than one format.
+        """
+        # Runs the function being tested.
+        aggregates = {}
+        aip_rows = [["hargrett", "harg-0000", "harg-0000-web-202007-0001", "web_archive", "WARC",
+                     "WARC|NO VALUE|fmt/289"],
+                    ["hargrett", "harg-0000", "harg-0000-web-202007-0002", "web_archive", "WARC",
+                     "WARC|NO VALUE|fmt/289"],
+                    ["hargrett", "harg-ms3770", "harg-ms3770er0002", "image", "JPEG", "JPEG EXIF|2.1|x-fmt/390"],
+                    ["hargrett", "harg-ms3770", "harg-ms3770er0002", "image", "TIFF", "TIFF|6|fmt/353"]]
+        update_aggregates(aggregates, aip_rows)
+
+        # Tests that the aggregates contain the correct information.
+        result = aggregates_to_list(aggregates)
+        expected = [["Format_Standardized_Name", "JPEG", ["harg-ms3770"], ["harg-ms3770er0002"], [], []],
+                    ["Format_Standardized_Name", "TIFF", ["harg-ms3770"], ["harg-ms3770er0002"], [], []],
+                    ["Format_Standardized_Name", "WARC", ["harg-0000"],
+                     ["harg-0000-web-202007-0001", "harg-0000-web-202007-0002"], [], []],
+                    ["Format_Type", "image", ["harg-ms3770"], ["harg-ms3770er0002"], [], []],
+                    ["Format_Type", "web_archive", ["harg-0000"],
+                     ["harg-0000-web-202007-0001", "harg-0000-web-202007-0002"], [], []],
+                    ["Group", "hargrett", ["harg-0000", "harg-ms3770"],
+                     ["harg-0000-web-202007-0001", "harg-0000-web-202007-0002", "harg-ms3770er0002"],
+                     ["image", "web_archive"], ["JPEG", "TIFF", "WARC"]]]
+        self.assertEqual(result, expected, "Problem with test for one report")
+
+    def test_two_reports(self):
+        """
+        Test for the rows from two reports, which are added to the same aggregates.
+        The same format type is in both groups.
+        Format types and format standardized names are only gathered for groups.
+        """
+        # Runs the function being tested, once for each report.
+        aggregates = {}
+        update_aggregates(aggregates, [["bmac", "peabody", "bmac_1", "audio", "WAVE", "Wave|NO VALUE|NO VALUE"]])
+        update_aggregates(aggregates, [["dlg", "dlg_ghn", "batch_gua_1", "audio", "MP3", "MP3|NO VALUE|fmt/134"]])
+
+        # Tests that the aggregates contain the correct information.
+        result = aggregates_to_list(aggregates)
+        expected = [["Format_Standardized_Name", "MP3", ["dlg_ghn"], ["batch_gua_1"], [], []],
+                    ["Format_Standardized_Name", "WAVE", ["peabody"], ["bmac_1"], [], []],
+                    ["Format_Type", "audio", ["dlg_ghn", "peabody"], ["batch_gua_1", "bmac_1"], [], []],
+                    ["Group", "bmac", ["peabody"], ["bmac_1"], ["audio"], ["WAVE"]],
+                    ["Group", "dlg", ["dlg_ghn"], ["batch_gua_1"], ["audio"], ["MP3"]]]
+        self.assertEqual(result, expected, "Problem with test for two reports")
+
+
+if __name__ == '__main__':
+    unittest.main()